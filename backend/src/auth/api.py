@@ -1,3 +1,4 @@
+import logging
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import RedirectResponse
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -15,6 +16,8 @@ from .dependencies import get_current_user, validate_refresh_token
 from .models import User
 from .exceptions import AuthenticationException, OAuthException
 
+logger = logging.getLogger(__name__)
+
 # Create router
 auth_router = APIRouter()
 
@@ -238,13 +241,13 @@ async def get_google_auth_url(
         return {"auth_url": auth_url}
     except AuthenticationException as e:
         # Preserve the original status code and message from the service
-        print(f"🔍 Caught AuthenticationException: {e.status_code} - {e.detail}")
+        logger.debug(f"🔍 Caught AuthenticationException: {e.status_code} - {e.detail}")
         raise e
     except Exception as e:
-        print(f"❌ Caught generic Exception: {type(e).__name__} - {str(e)}")
+        logger.error(f"❌ Caught generic Exception: {type(e).__name__} - {str(e)}")
         # Check if this is actually an AuthenticationException that wasn't caught
         if hasattr(e, 'status_code') and hasattr(e, 'detail'):
-            print(f"🔍 Exception has HTTP attributes: {e.status_code} - {e.detail}")
+            logger.debug(f"🔍 Exception has HTTP attributes: {e.status_code} - {e.detail}")
             raise HTTPException(status_code=e.status_code, detail=e.detail)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -314,9 +317,9 @@ async def google_oauth_callback_api(
     Exchanges authorization code for user tokens and creates/updates user account.
     """
     try:
-        print(f"🔍 Google OAuth callback API called with:")
-        print(f"  Code: {auth_data.code[:10]}...")
-        print(f"  Redirect URI: {auth_data.redirect_uri}")
+        logger.debug(f"🔍 Google OAuth callback API called with:")
+        logger.debug(f"  Code: {auth_data.code[:10]}...")
+        logger.debug(f"  Redirect URI: {auth_data.redirect_uri}")
         user, tokens = await auth_service.authenticate_google_user(
             db, auth_data.code, auth_data.redirect_uri
         )
@@ -337,14 +340,14 @@ async def google_oauth_callback_api(
         }
     except OAuthException as e:
         # OAuth-specific errors (400 Bad Request)
-        print(f"🔍 OAuth error in API: {e.detail}")
+        logger.debug(f"🔍 OAuth error in API: {e.detail}")
         raise e
     except AuthenticationException as e:
         # Other authentication errors
-        print(f"🔍 Auth error in API: {e.detail}")
+        logger.debug(f"🔍 Auth error in API: {e.detail}")
         raise e
     except Exception as e:
-        print(f"🔍 Unexpected error in API: {type(e).__name__} - {str(e)}")
+        logger.debug(f"🔍 Unexpected error in API: {type(e).__name__} - {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Google authentication failed: {str(e)}"
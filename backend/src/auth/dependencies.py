@@ -27,15 +27,11 @@ async def get_current_user(
     if token_data is None:
         raise InvalidTokenException("Invalid authentication token")
     
-    print(f"🔐 AUTH DEBUG: Token verified for user_id: {token_data.user_id}")
-    
     # Get user from database
     user = await get_user_by_id(db, token_data.user_id)
     if user is None:
         raise InvalidTokenException("User not found")
     
-    print(f"🔐 AUTH DEBUG: User found - id={user.id}, email={user.email}, active={user.is_active}")
-    
     # Check if user is active
     if not user.is_active:
         raise InactiveUserException()
@@ -1,3 +1,4 @@
+import logging
 import json
 import os
 from typing import Optional, Dict, Any
@@ -10,22 +11,24 @@ from fastapi import HTTPException, status
 from .schemas import GoogleUserInfo
 from .exceptions import AuthenticationException
 
+logger = logging.getLogger(__name__)
+
 
 class GoogleOAuthService:
     def __init__(self):
         # Load Google OAuth credentials with enhanced error handling
-        print("🔧 Initializing Google OAuth service...")
+        logger.info("🔧 Initializing Google OAuth service...")
         
         self.credentials_file = self._find_credentials_file()
         self.is_available = False
         
         if not self.credentials_file:
-            print("⚠️  Google OAuth credentials file not found - Google login will be disabled")
-            print("   To enable Google OAuth, place your credentials file in the backend directory")
-            print("   Expected files:")
-            print("   - client_secret_1048775706645-jka3a5o69ltecsb69ogv0usjev21npvk.apps.googleusercontent.com.json")
-            print("   - google_credentials.json")
-            print("   - client_secret.json")
+            logger.warning("⚠️  Google OAuth credentials file not found - Google login will be disabled")
+            logger.warning("   To enable Google OAuth, place your credentials file in the backend directory")
+            logger.warning("   Expected files:")
+            logger.warning("   - client_secret_1048775706645-jka3a5o69ltecsb69ogv0usjev21npvk.apps.googleusercontent.com.json")
+            logger.warning("   - google_credentials.json")
+            logger.warning("   - client_secret.json")
             self.credentials = None
             self.client_id = None
             self.client_secret = None
@@ -35,13 +38,13 @@ class GoogleOAuthService:
             return
             
         try:
-            print(f"📖 Loading credentials from: {self.credentials_file}")
+            logger.info(f"📖 Loading credentials from: {self.credentials_file}")
             
             # Force reload credentials file with better error handling
             with open(self.credentials_file, 'r', encoding='utf-8') as f:
                 self.credentials = json.load(f)
             
-            print(f"✅ JSON file loaded successfully")
+            logger.debug(f"✅ JSON file loaded successfully")
             
             # Validate required fields exist
             if 'web' not in self.credentials:
@@ -61,31 +64,30 @@ class GoogleOAuthService:
             self.token_uri = web_config['token_uri']
             
             # Debug: Print configuration details
-            print(f"✅ Client ID: {self.client_id[:20]}...")
-            print(f"✅ Client Secret: {self.client_secret[:20]}...")
-            print(f"✅ Google OAuth allowed redirect URIs: {self.redirect_uris}")
-            print(f"✅ Auth URI: {self.auth_uri}")
-            print(f"✅ Token URI: {self.token_uri}")
+            logger.debug(f"✅ Client ID: {self.client_id[:20]}...")
+            logger.debug(f"✅ Google OAuth allowed redirect URIs: {self.redirect_uris}")
+            logger.debug(f"✅ Auth URI: {self.auth_uri}")
+            logger.debug(f"✅ Token URI: {self.token_uri}")
             
             self.is_available = True
-            print("🎉 Google OAuth service initialized successfully")
+            logger.info("🎉 Google OAuth service initialized successfully")
             
         except FileNotFoundError as e:
-            print(f"❌ Credentials file not found: {str(e)}")
-            print("   Google login will be disabled")
+            logger.error(f"❌ Credentials file not found: {str(e)}")
+            logger.warning("   Google login will be disabled")
             self.is_available = False
         except json.JSONDecodeError as e:
-            print(f"❌ Invalid JSON in credentials file: {str(e)}")
-            print("   Google login will be disabled")
+            logger.error(f"❌ Invalid JSON in credentials file: {str(e)}")
+            logger.warning("   Google login will be disabled")
             self.is_available = False
         except ValueError as e:
-            print(f"❌ Invalid credentials file format: {str(e)}")
-            print("   Google login will be disabled")
+            logger.error(f"❌ Invalid credentials file format: {str(e)}")
+            logger.warning("   Google login will be disabled")
             self.is_available = False
         except Exception as e:
-            print(f"❌ Unexpected error loading Google OAuth credentials: {str(e)}")
-            print(f"   Error type: {type(e).__name__}")
-            print("   Google login will be disabled")
+            logger.error(f"❌ Unexpected error loading Google OAuth credentials: {str(e)}")
+            logger.warning(f"   Error type: {type(e).__name__}")
+            logger.warning("   Google login will be disabled")
             self.is_available = False
         
     def _find_credentials_file(self) -> Optional[str]:
@@ -95,20 +97,20 @@ class GoogleOAuthService:
         current_dir = os.path.dirname(os.path.abspath(__file__))
         backend_dir = os.path.dirname(os.path.dirname(current_dir))  # Go up 2 levels: src -> backend
         
-        print(f"🔍 Google OAuth credentials search:")
-        print(f"   Current file: {__file__}")
-        print(f"   Current dir: {current_dir}")
-        print(f"   Backend dir calculated: {backend_dir}")
+        logger.debug(f"🔍 Google OAuth credentials search:")
+        logger.debug(f"   Current file: {__file__}")
+        logger.debug(f"   Current dir: {current_dir}")
+        logger.debug(f"   Backend dir calculated: {backend_dir}")
         
         # Check for the specific file you uploaded
         specific_filename = "client_secret_1048775706645-jka3a5o69ltecsb69ogv0usjev21npvk.apps.googleusercontent.com.json"
         specific_file = os.path.join(backend_dir, specific_filename)
         
-        print(f"   Looking for specific file: {specific_file}")
-        print(f"   Specific file exists: {os.path.exists(specific_file)}")
+        logger.debug(f"   Looking for specific file: {specific_file}")
+        logger.debug(f"   Specific file exists: {os.path.exists(specific_file)}")
         
         if os.path.exists(specific_file):
-            print(f"✅ Found Google OAuth credentials at: {specific_file}")
+            logger.info(f"✅ Found Google OAuth credentials at: {specific_file}")
             return specific_file
             
         # Method 2: Alternative paths in case structure is different
@@ -119,29 +121,29 @@ class GoogleOAuthService:
             os.path.join(os.getcwd(), "backend", specific_filename),  # CWD + backend
         ]
         
-        print(f"   Trying alternative paths:")
+        logger.debug(f"   Trying alternative paths:")
         for i, alt_path in enumerate(alternative_paths):
-            print(f"   Alt path {i+1}: {alt_path}")
-            print(f"   Alt path {i+1} exists: {os.path.exists(alt_path)}")
+            logger.debug(f"   Alt path {i+1}: {alt_path}")
+            logger.debug(f"   Alt path {i+1} exists: {os.path.exists(alt_path)}")
             if os.path.exists(alt_path):
-                print(f"✅ Found Google OAuth credentials at alternative path: {alt_path}")
+                logger.info(f"✅ Found Google OAuth credentials at alternative path: {alt_path}")
                 return alt_path
         
         # Check for generic credentials files in all locations
         generic_filenames = ["google_credentials.json", "client_secret.json"]
         all_search_dirs = [backend_dir] + [os.path.dirname(path) for path in alternative_paths]
         
-        print(f"   Searching for generic files in directories:")
+        logger.debug(f"   Searching for generic files in directories:")
         for search_dir in all_search_dirs:
-            print(f"   Directory: {search_dir}")
+            logger.debug(f"   Directory: {search_dir}")
             for filename in generic_filenames:
                 filepath = os.path.join(search_dir, filename)
-                print(f"     Checking: {filepath}")
+                logger.debug(f"     Checking: {filepath}")
                 if os.path.exists(filepath):
-                    print(f"✅ Found generic credentials file: {filepath}")
+                    logger.info(f"✅ Found generic credentials file: {filepath}")
                     return filepath
                 
-        print(f"❌ No Google OAuth credentials file found in any location")
+        logger.error(f"❌ No Google OAuth credentials file found in any location")
         return None
     
     def _check_availability(self):
@@ -157,18 +159,18 @@ class GoogleOAuthService:
         self._check_availability()
         
         try:
-            print(f"🔍 Requested redirect URI: {redirect_uri}")
-            print(f"🔍 Available redirect URIs: {self.redirect_uris}")
+            logger.debug(f"🔍 Requested redirect URI: {redirect_uri}")
+            logger.debug(f"🔍 Available redirect URIs: {self.redirect_uris}")
             
             # Validate that the redirect_uri is in our allowed list
             if redirect_uri not in self.redirect_uris:
-                print(f"❌ Redirect URI validation failed!")
+                logger.error(f"❌ Redirect URI validation failed!")
                 raise AuthenticationException(
                     status_code=400,
                     detail=f"Invalid redirect URI: {redirect_uri}. Allowed URIs: {self.redirect_uris}"
                 )
             
-            print(f"✅ Redirect URI validation passed")
+            logger.info(f"✅ Redirect URI validation passed")
             
             # Use the full credentials config instead of creating a new one
             # Include calendar scope for calendar integration
@@ -178,7 +180,7 @@ class GoogleOAuthService:
             )
             flow.redirect_uri = redirect_uri
             
-            print(f"🔍 Flow configured with redirect_uri: {flow.redirect_uri}")
+            logger.debug(f"🔍 Flow configured with redirect_uri: {flow.redirect_uri}")
             
             auth_url, _ = flow.authorization_url(
                 access_type='offline',
@@ -186,14 +188,14 @@ class GoogleOAuthService:
                 state=state
             )
             
-            print(f"🔗 Generated auth URL: {auth_url[:100]}...")
+            logger.info(f"🔗 Generated auth URL: {auth_url[:100]}...")
             
             return auth_url
             
         except AuthenticationException:
             raise
         except Exception as e:
-            print(f"❌ Exception in get_authorization_url: {str(e)}")
+            logger.error(f"❌ Exception in get_authorization_url: {str(e)}")
             raise AuthenticationException(
                 status_code=500,
                 detail=f"Failed to generate authorization URL: {str(e)}"
@@ -1,3 +1,4 @@
+import logging
 from typing import Tuple, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta
@@ -26,6 +27,8 @@ from .exceptions import (
 from .google_oauth import google_oauth_service
 from .schemas import GoogleUserInfo
 
+logger = logging.getLogger(__name__)
+
 
 class AuthService:
     """Authentication service handling all auth-related business logic"""
@@ -149,7 +152,7 @@ class AuthService:
             
             # TODO: Send email with reset token
             # For now, we'll just log it (in production, send email)
-            print(f"Password reset token for {email}: {reset_request.token}")
+            logger.debug(f"Password reset token for {email}: {reset_request.token}")
         
         # Always return True for security (don't reveal if email exists)
         return True
@@ -258,20 +261,20 @@ class AuthService:
             AuthenticationError: If Google authentication fails
         """
         try:
-            print(f"🔍 Starting Google user authentication:")
-            print(f"  Code: {code[:10]}...")
-            print(f"  Redirect URI: {redirect_uri}")
+            logger.debug(f"🔍 Starting Google user authentication:")
+            logger.debug(f"  Code: {code[:10]}...")
+            logger.debug(f"  Redirect URI: {redirect_uri}")
             # Exchange code for tokens
-            print("🔍 Exchanging code for tokens...")
+            logger.debug("🔍 Exchanging code for tokens...")
             token_response = await google_oauth_service.exchange_code_for_tokens(code, redirect_uri)
-            print(f"🔍 Token exchange response: {list(token_response.keys()) if token_response else 'None'}")
+            logger.debug(f"🔍 Token exchange response: {list(token_response.keys()) if token_response else 'None'}")
             
             access_token = token_response.get('access_token')
             refresh_token = token_response.get('refresh_token')
             expires_in = token_response.get('expires_in')
             
             if not access_token:
-                print(f"❌ No access token in response: {token_response}")
+                logger.error(f"❌ No access token in response: {token_response}")
                 raise OAuthException("Failed to get access token from Google")
             
             # Calculate token expiry time
@@ -324,9 +327,9 @@ class AuthService:
                     refresh_token=refresh_token,
                     token_expires_at=token_expires_at
                 )
-                print(f"✅ Google Calendar integration saved for user {user.email}")
+                logger.info(f"✅ Google Calendar integration saved for user {user.email}")
             except Exception as e:
-                print(f"⚠️  Failed to save Google Calendar integration: {str(e)}")
+                logger.warning(f"⚠️  Failed to save Google Calendar integration: {str(e)}")
                 # Don't fail the authentication if calendar integration fails
             
             # Generate our app tokens
@@ -343,7 +346,7 @@ class AuthService:
             return user, tokens
             
         except Exception as e:
-            print(f"❌ Google authentication failed: {type(e).__name__} - {str(e)}")
+            logger.error(f"❌ Google authentication failed: {type(e).__name__} - {str(e)}")
             import traceback
             traceback.print_exc()
             raise OAuthException(f"Google authentication failed: {str(e)}")
@@ -0,0 +1,133 @@
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from settings import settings
+
+# redis is optional; without it only the in-process backends are available
+try:
+    import redis.asyncio as redis_asyncio
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis_asyncio = None
+    REDIS_AVAILABLE = False
+
+
+class CacheBackend:
+    """
+    Minimal async key-value interface shared by all cache backends
+
+    The method set mirrors the Redis commands the cache layer relies on
+    (GET, SET with expiry, DEL, INCR), so a Redis client can back it directly.
+    Values are strings; callers serialize.
+    """
+
+    async def get(self, key: str) -> Optional[str]:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: str, ttl_seconds: Optional[float] = None) -> None:
+        raise NotImplementedError
+
+    async def delete(self, *keys: str) -> None:
+        raise NotImplementedError
+
+    async def incr(self, key: str) -> int:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+
+class MemoryTTLCache(CacheBackend):
+    """In-process LRU with per-entry TTL; the default backend for a single API process"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Optional[float], str]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[str]:
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str, ttl_seconds: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + ttl_seconds if ttl_seconds else None
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    async def incr(self, key: str) -> int:
+        value = int(await self.get(key) or 0) + 1
+        await self.set(key, str(value))
+        return value
+
+
+class FakeCache(CacheBackend):
+    """Plain dict backend without expiry or eviction, for tests"""
+
+    def __init__(self):
+        self.data: Dict[str, str] = {}
+
+    async def get(self, key: str) -> Optional[str]:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: str, ttl_seconds: Optional[float] = None) -> None:
+        self.data[key] = value
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.data.pop(key, None)
+
+    async def incr(self, key: str) -> int:
+        value = int(self.data.get(key, 0)) + 1
+        self.data[key] = str(value)
+        return value
+
+
+class RedisCache(CacheBackend):
+    """Redis-backed cache shared by all API processes"""
+
+    def __init__(self, url: str):
+        if not REDIS_AVAILABLE:
+            raise Exception("The redis package is required for CACHE_BACKEND=redis")
+        self.client = redis_asyncio.from_url(url, decode_responses=True)
+
+    async def get(self, key: str) -> Optional[str]:
+        return await self.client.get(key)
+
+    async def set(self, key: str, value: str, ttl_seconds: Optional[float] = None) -> None:
+        if ttl_seconds:
+            await self.client.set(key, value, px=int(ttl_seconds * 1000))
+        else:
+            await self.client.set(key, value)
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self.client.delete(*keys)
+
+    async def incr(self, key: str) -> int:
+        return await self.client.incr(key)
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+
+def create_cache_backend() -> CacheBackend:
+    """Build the backend selected by CACHE_BACKEND (memory, redis or fake)"""
+    backend = settings.CACHE_BACKEND.lower()
+    if backend == "redis":
+        return RedisCache(settings.REDIS_URL)
+    if backend == "fake":
+        return FakeCache()
+    return MemoryTTLCache(settings.CACHE_MAX_ENTRIES)
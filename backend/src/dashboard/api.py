@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from fastapi.responses import Response
+import logging
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Header
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Dict, Optional
 from datetime import datetime
+import asyncio
 
 from database import get_async_db
 from auth.dependencies import get_current_user
@@ -14,14 +16,23 @@ from .schemas import (
     NotesSearchRequest, NotesExportRequest, SummaryCreate, SummaryUpdate, SummaryResponse,
     SummaryListResponse, DashboardResponse, DashboardStats, HeatmapData,
     StructuredNotesResponse, GenerateStructuredNotesRequest, StructuredMeetingNotesResponse,
-    StatisticsResponse
+    StatisticsResponse, ActionItemResponse, ActionItemUpdate, ActionItemStats, TagCount
 )
 from .service import dashboard_service
 from .comprehensive_notes_service import comprehensive_notes_service
 from .pdf_service import pdf_service
+from .transcript_stream import transcript_broadcaster, format_sse_event, SSE_HEARTBEAT_SECONDS, RESYNC
+from .generation_stream import stream_generation
+from .dashboard_cache import dashboard_cache
+from .pagination import encode_cursor, decode_cursor
+
+from jobs.schemas import JobResponse
+from jobs.queue import job_queue
 
 from . import crud
 
+logger = logging.getLogger(__name__)
+
 # Create dashboard router
 dashboard_router = APIRouter()
 
@@ -52,19 +63,28 @@ async def create_meeting(
 
 @dashboard_router.get("/meetings", response_model=MeetingListResponse)
 async def get_user_meetings(
-    page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    include_total: bool = Query(False, description="Include the total meeting count"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Get all meetings for the current user with pagination
+    Get all meetings for the current user with cursor pagination
     
-    Returns a paginated list of meetings ordered by creation date (newest first).
+    Returns a page of meetings ordered by creation date (newest first) and
+    the cursor for the next page.
     """
     try:
-        meetings = await dashboard_service.get_user_meetings(db, current_user.id, page, per_page)
+        meetings = await dashboard_service.get_user_meetings(
+            db, current_user.id, per_page, cursor, include_total
+        )
         return meetings
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -132,6 +152,7 @@ async def update_meeting(
 @dashboard_router.post("/meetings/{meeting_id}/end", response_model=MeetingResponse)
 async def end_meeting(
     meeting_id: str,
+    response: Response,
     end_data: Optional[MeetingEnd] = None,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_async_db)
@@ -143,23 +164,21 @@ async def end_meeting(
     1. Updates the meeting status to 'ended'
     2. Sets the end timestamp
     3. Optionally updates user notes
+    4. Queues a job that stops the bot, syncs final transcripts and generates
+       the AI summary; its ID is returned in the `X-Job-Id` header
     """
     try:
-        print(f"🔍 API DEBUG: Received end_meeting request")
-        print(f"🔍 API DEBUG: meeting_id: {meeting_id}")
-        print(f"🔍 API DEBUG: end_data: {end_data}")
-        print(f"🔍 API DEBUG: end_data type: {type(end_data)}")
-        print(f"🔍 API DEBUG: current_user.id: {current_user.id}")
+        logger.debug("🔍 end_meeting request - meeting_id: %s, user_id: %s, end_data: %r", meeting_id, current_user.id, end_data)
         
         # Create default end_data if none provided
         if end_data is None:
-            print(f"🔍 API DEBUG: Creating default end_data")
             end_data = MeetingEnd(user_notes=None)
         
-        meeting = await dashboard_service.end_meeting(db, meeting_id, current_user.id, end_data)
+        meeting, job = await dashboard_service.end_meeting(db, meeting_id, current_user.id, end_data)
+        response.headers["X-Job-Id"] = job.id
         return meeting
     except Exception as e:
-        print(f"❌ API DEBUG: Exception in end_meeting: {str(e)}")
+        logger.error(f"❌ Exception in end_meeting: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
@@ -217,10 +236,15 @@ async def get_meeting_summary(
         if not meeting.summary and meeting.status == "ended":
             try:
                 await dashboard_service.generate_meeting_summary(db, meeting_id, current_user.id)
-                # Refresh meeting data
-                meeting = await dashboard_service.get_meeting_with_transcripts(db, meeting_id, current_user.id)
+                # The summary was saved through this session's meeting instance and the
+                # transcripts of an ended meeting do not change, so nothing is reloaded
+                updated = await crud.get_meeting_by_id(db, meeting_id, current_user.id)
+                meeting = meeting.copy(update={
+                    "summary": updated.summary,
+                    "summary_generated_at": updated.summary_generated_at
+                })
             except Exception as e:
-                print(f"Failed to generate summary: {str(e)}")
+                logger.warning(f"Failed to generate summary: {str(e)}")
                 
         return {
             "meeting_id": meeting.id,
@@ -242,6 +266,79 @@ async def get_meeting_summary(
         )
 
 
+def _generation_response(request: Request, generate) -> StreamingResponse:
+    """Serve a streaming AI generation as Server-Sent Events"""
+    return StreamingResponse(
+        stream_generation(request, generate),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"
+        }
+    )
+
+
+async def _embed_when_done(events, user_id: str, meeting_id: str):
+    """
+    Pass generation events through, queueing semantic indexing once a new result is saved
+
+    A stream that generated something emits content events before `done`; one that
+    only returns what was already saved emits `done` alone and queues nothing. The
+    idempotency key names the saved result, so each result is embedded once.
+    """
+    generated = False
+    async for event, data in events:
+        yield event, data
+        if event != "done":
+            generated = True
+        elif generated:
+            saved_id = getattr(data, "id", None)
+            try:
+                await job_queue.enqueue(
+                    user_id,
+                    "embed_meeting",
+                    {"meeting_id": meeting_id},
+                    idempotency_key=f"embed_meeting:{meeting_id}:{saved_id}" if saved_id else f"embed_meeting:{meeting_id}"
+                )
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to queue embedding of meeting {meeting_id}: {str(e)}")
+
+
+@dashboard_router.get("/meetings/{meeting_id}/summary/stream")
+async def stream_meeting_summary(
+    meeting_id: str,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Stream the AI-generated meeting summary using Server-Sent Events
+    
+    Generates the summary of an ended meeting that has none, token by token, and
+    saves it once complete. Otherwise the current summary is sent straight away.
+    
+    Events:
+    - `start`: sent immediately
+    - `delta`: JSON string with the next chunk of summary text
+    - `done`: `{"meeting_id", "summary", "summary_generated_at"}`
+    - `error`: `{"detail"}`; nothing was saved
+    """
+    meeting = await crud.get_meeting_by_id(db, meeting_id, current_user.id)
+    if not meeting:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Meeting not found"
+        )
+    
+    user_id = current_user.id
+    return _generation_response(
+        request,
+        lambda session: _embed_when_done(
+            dashboard_service.stream_meeting_summary(session, meeting_id, user_id), user_id, meeting_id
+        )
+    )
+
+
 # Health check endpoint for dashboard
 @dashboard_router.get("/health", response_model=MessageResponse)
 async def dashboard_health():
@@ -265,7 +362,7 @@ async def get_dashboard_overview(
         Complete dashboard data for the current user
     """
     try:
-        overview = await dashboard_service.get_dashboard_overview(db, current_user.id)
+        overview = await dashboard_service.get_dashboard_overview(db, current_user.id, current_user.timezone)
         return DashboardResponse(**overview)
     except Exception as e:
         raise HTTPException(
@@ -286,7 +383,7 @@ async def get_dashboard_stats(
         Statistics about meetings, summaries, and tasks for the current user
     """
     try:
-        stats = await dashboard_service.get_dashboard_stats(db, current_user.id)
+        stats = await dashboard_service.get_dashboard_stats(db, current_user.id, current_user.timezone)
         return DashboardStats(**stats)
     except Exception as e:
         raise HTTPException(
@@ -295,6 +392,87 @@ async def get_dashboard_stats(
         )
 
 
+@dashboard_router.get("/action-items", response_model=List[ActionItemResponse])
+async def get_action_items(
+    status_filter: Optional[str] = Query(None, alias="status", pattern="^(open|done)$", description="open or done"),
+    assignee: Optional[str] = Query(None, description="Exact assignee name"),
+    meeting_id: Optional[str] = Query(None, description="Only tasks from this meeting"),
+    limit: int = Query(100, ge=1, le=500, description="Maximum number of tasks to return"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Get action items extracted from the user's summaries
+    
+    Sorted by deadline (soonest first, undated last).
+    """
+    try:
+        items = await crud.get_action_items(
+            db, current_user.id, status=status_filter, assignee=assignee, meeting_id=meeting_id, limit=limit
+        )
+        return [ActionItemResponse.from_orm(item) for item in items]
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+
+@dashboard_router.get("/action-items/stats", response_model=ActionItemStats)
+async def get_action_item_stats(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Get open, done and overdue action item counts, overall and per assignee
+    """
+    try:
+        stats = await dashboard_service.get_action_item_stats(db, current_user.id, current_user.timezone)
+        return ActionItemStats(**stats)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+
+@dashboard_router.patch("/action-items/{item_id}", response_model=ActionItemResponse)
+async def update_action_item(
+    item_id: str,
+    update_data: ActionItemUpdate,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Mark an action item open or done
+    """
+    item = await crud.update_action_item_status(db, item_id, current_user.id, update_data.status)
+    if not item:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Action item not found"
+        )
+    return ActionItemResponse.from_orm(item)
+
+
+@dashboard_router.get("/tags", response_model=List[TagCount])
+async def get_tags(
+    limit: int = Query(100, ge=1, le=500, description="Maximum number of tags to return"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Get the user's tags, most used first
+    """
+    try:
+        return await crud.get_tag_counts(db, current_user.id, limit)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+
 @dashboard_router.get("/heatmap", response_model=List[HeatmapData])
 async def get_dashboard_heatmap(
     year: Optional[int] = Query(None, description="Year for heatmap data"),
@@ -308,7 +486,7 @@ async def get_dashboard_heatmap(
         Heatmap data showing meeting count by date
     """
     try:
-        heatmap_data = await crud.get_meeting_heatmap_data(db, current_user.id, year)
+        heatmap_data = await dashboard_service.get_heatmap_data(db, current_user.id, year, current_user.timezone)
         return [HeatmapData(**item) for item in heatmap_data]
     except Exception as e:
         raise HTTPException(
@@ -330,7 +508,7 @@ async def get_meeting_trends(
         Trends data showing meetings and summaries count by date
     """
     try:
-        trends_data = await crud.get_meeting_trends_data(db, current_user.id, days)
+        trends_data = await dashboard_service.get_trends_data(db, current_user.id, days, current_user.timezone)
         return trends_data
     except Exception as e:
         raise HTTPException(
@@ -361,26 +539,44 @@ async def create_summary(
 
 @dashboard_router.get("/summaries", response_model=SummaryListResponse)
 async def get_user_summaries(
-    page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    include_total: bool = Query(False, description="Include the total summary count"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Get all summaries for the current user with pagination
+    Get all summaries for the current user with cursor pagination (newest first)
     """
     try:
-        skip = (page - 1) * per_page
-        summaries = await crud.get_summaries_by_user(db, current_user.id, skip, per_page)
-        total = await crud.count_summaries_by_user(db, current_user.id)
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    try:
+        # Fetch one extra row to learn whether another page exists
+        summaries = await crud.get_summaries_by_user(db, current_user.id, per_page + 1, after)
+        has_more = len(summaries) > per_page
+        summaries = summaries[:per_page]
+        
+        total = None
+        if include_total:
+            total = await dashboard_cache.get_or_compute(
+                current_user.id, "summaries_total", {},
+                lambda: crud.count_summaries_by_user(db, current_user.id)
+            )
         
         summary_responses = [SummaryResponse.from_orm(summary) for summary in summaries]
         
         return SummaryListResponse(
             summaries=summary_responses,
-            total=total,
-            page=page,
-            per_page=per_page
+            per_page=per_page,
+            next_cursor=encode_cursor(summaries[-1].created_at, summaries[-1].id) if has_more else None,
+            has_more=has_more,
+            total=total
         )
     except Exception as e:
         raise HTTPException(
@@ -463,24 +659,37 @@ async def delete_summary(
 
 # Analytics endpoints
 # Comprehensive Notes endpoints
-@dashboard_router.post("/meetings/{meeting_id}/comprehensive-notes", response_model=ComprehensiveNotesResponse)
+@dashboard_router.post("/meetings/{meeting_id}/comprehensive-notes", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
 async def create_comprehensive_notes(
     meeting_id: str,
     notes_request: ComprehensiveNotesRequest,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Generate comprehensive notes for a meeting
+    Queue generation of comprehensive notes for a meeting
     
-    This endpoint combines AI summary, user notes, and transcript highlights
-    into a comprehensive notes document using AI enhancement.
+    The notes combine AI summary, user notes, and transcript highlights into a
+    comprehensive notes document using AI enhancement. Poll GET /api/jobs/{id};
+    once it has succeeded, `result` holds the ComprehensiveNotesResponse.
+    Retrying with the same `Idempotency-Key` header returns the same job.
     """
+    meeting = await crud.get_meeting_by_id(db, meeting_id, current_user.id)
+    if not meeting:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Meeting not found"
+        )
+    
     try:
-        notes = await comprehensive_notes_service.generate_comprehensive_notes(
-            db, meeting_id, current_user.id, notes_request
+        job = await job_queue.enqueue(
+            current_user.id,
+            "comprehensive_notes",
+            {"meeting_id": meeting_id, "request": notes_request.model_dump(mode="json")},
+            idempotency_key=f"comprehensive_notes:{current_user.id}:{idempotency_key}" if idempotency_key else None
         )
-        return notes
+        return JobResponse.from_orm(job)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -488,6 +697,44 @@ async def create_comprehensive_notes(
         )
 
 
+@dashboard_router.post("/meetings/{meeting_id}/comprehensive-notes/stream")
+async def stream_comprehensive_notes(
+    meeting_id: str,
+    notes_request: ComprehensiveNotesRequest,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Generate comprehensive notes for a meeting, streamed using Server-Sent Events
+    
+    Same input and result as POST /meetings/{id}/comprehensive-notes, but the
+    notes text is forwarded as the model writes it. The notes are saved once
+    generation completes, even if the client disconnects first.
+    
+    Events:
+    - `start`: sent immediately
+    - `delta`: JSON string with the next chunk of notes text
+    - `done`: the saved ComprehensiveNotesResponse
+    - `error`: `{"detail"}`; nothing was saved
+    """
+    meeting = await crud.get_meeting_by_id(db, meeting_id, current_user.id)
+    if not meeting:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Meeting not found"
+        )
+    
+    user_id = current_user.id
+    return _generation_response(
+        request,
+        lambda session: _embed_when_done(
+            comprehensive_notes_service.stream_comprehensive_notes(session, meeting_id, user_id, notes_request),
+            user_id, meeting_id
+        )
+    )
+
+
 @dashboard_router.get("/meetings/{meeting_id}/comprehensive-notes", response_model=List[ComprehensiveNotesResponse])
 async def get_meeting_comprehensive_notes(
     meeting_id: str,
@@ -512,23 +759,24 @@ async def get_meeting_comprehensive_notes(
 @dashboard_router.get("/meetings/{meeting_id}/transcripts", response_model=List[TranscriptResponse])
 async def sync_meeting_transcripts(
     meeting_id: str,
+    since: Optional[datetime] = Query(None, description="created_at of the newest transcript the client already has"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Sync and get the latest transcripts for a meeting
+    Get the latest transcripts for a live meeting
     
-    This endpoint:
-    1. Checks if meeting is still active (prevents sync for ended meetings)
-    2. Fetches the latest transcripts from Vexa (only for active meetings)
-    3. Updates the database with new transcript data
-    4. Returns all transcript entries for the meeting
+    Transcripts are ingested from Vexa by a background worker; this endpoint
+    reads them from the database. Concurrent requests share the worker's
+    in-progress fetch instead of calling Vexa themselves.
+    
+    Returns transcripts stored after `since` if given, otherwise all of them.
+    Revised segments are re-sent with a new id; clients should merge by timestamp.
     
-    Note: Transcript syncing is automatically stopped for ended meetings to reduce server load.
+    Note: Ended meetings return 410 Gone; use the meeting endpoint for their transcripts.
     """
     try:
-        transcripts = await dashboard_service.sync_transcripts(db, meeting_id, current_user.id)
-        return transcripts
+        return await dashboard_service.read_transcripts(db, meeting_id, current_user.id, since)
     except Exception as e:
         # Enhanced error message for ended meetings
         if "Meeting has ended" in str(e) or "avoid server overload" in str(e):
@@ -542,6 +790,123 @@ async def sync_meeting_transcripts(
         )
 
 
+@dashboard_router.get("/meetings/{meeting_id}/transcripts/range", response_model=List[TranscriptResponse])
+async def get_meeting_transcripts_in_range(
+    meeting_id: str,
+    start_seconds: float = Query(..., ge=0, description="Window start in seconds from the start of the recording"),
+    end_seconds: float = Query(..., gt=0, description="Window end in seconds (exclusive)"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Get the transcript segments of a time window, e.g. minutes 10-20 of a meeting
+    
+    Works for live and ended meetings. Segments stored before timing was
+    recorded have no offsets and are not returned.
+    """
+    if end_seconds <= start_seconds:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end_seconds must be greater than start_seconds"
+        )
+    
+    try:
+        return await dashboard_service.get_transcripts_in_range(
+            db, meeting_id, current_user.id, start_seconds, end_seconds
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+
+@dashboard_router.get("/meetings/{meeting_id}/transcripts/stream")
+async def stream_meeting_transcripts(
+    meeting_id: str,
+    request: Request,
+    since: Optional[datetime] = Query(None, description="created_at of the newest transcript the client already has"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Stream live transcripts for a meeting using Server-Sent Events
+    
+    Events:
+    - `transcripts`: JSON array of new or revised transcript items
+    - `end`: the meeting has ended and the stream closes
+    - `resync`: the client fell too far behind; the stream closes and the client should
+      reconnect with `since` set to the newest created_at it has
+    
+    All viewers of a meeting share the ingestion worker's single Vexa poller. Pass `since` when
+    reconnecting to receive the segments stored in the meantime first.
+    """
+    meeting = await crud.get_meeting_by_id(db, meeting_id, current_user.id)
+    if not meeting:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Meeting not found"
+        )
+    
+    user_id = current_user.id
+    is_live = meeting.status == "active"
+    
+    # Subscribe before reading the backlog so no delta published in between is missed
+    queue = transcript_broadcaster.subscribe(meeting_id) if is_live else None
+    backlog = []
+    if since is not None:
+        try:
+            backlog = await dashboard_service.get_transcripts_since(db, meeting_id, user_id, since)
+        except Exception:
+            if queue is not None:
+                transcript_broadcaster.unsubscribe(meeting_id, queue)
+            raise
+    
+    async def event_stream():
+        if backlog:
+            yield format_sse_event("transcripts", backlog)
+        
+        if queue is None:
+            yield format_sse_event("end", [])
+            return
+        
+        # Deltas queued while the backlog was read may repeat segments it already sent
+        sent_ids = {t.id for t in backlog}
+        try:
+            while not await request.is_disconnected():
+                try:
+                    transcripts = await asyncio.wait_for(queue.get(), timeout=SSE_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                
+                if transcripts is None:
+                    yield format_sse_event("end", [])
+                    break
+                
+                if transcripts is RESYNC:
+                    yield format_sse_event("resync", [])
+                    break
+                
+                if sent_ids:
+                    transcripts = [t for t in transcripts if t.id not in sent_ids]
+                    if not transcripts:
+                        continue
+                
+                yield format_sse_event("transcripts", transcripts)
+        finally:
+            transcript_broadcaster.unsubscribe(meeting_id, queue)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"
+        }
+    )
+
+
 @dashboard_router.put("/meetings/{meeting_id}/notes", response_model=MeetingResponse)
 async def update_meeting_notes(
     meeting_id: str,
@@ -643,15 +1008,16 @@ async def delete_comprehensive_notes(
 
 
 # Structured Notes endpoints (New Implementation)
-@dashboard_router.post("/meetings/{meeting_id}/structured-notes", response_model=SummaryResponse)
+@dashboard_router.post("/meetings/{meeting_id}/structured-notes", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
 async def generate_structured_meeting_notes(
     meeting_id: str,
     request: Optional[GenerateStructuredNotesRequest] = None,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Generate structured meeting notes using GPT-4o and save as summary
+    Queue generation of structured meeting notes using GPT-4o, saved as a summary
     
     This endpoint creates beautifully structured notes with:
     - Action items with tasks, descriptions, deadlines, and assignees
@@ -659,80 +1025,74 @@ async def generate_structured_meeting_notes(
     - Ideas & Insights with creative suggestions and future possibilities
     
     The notes are generated from meeting transcripts using AI analysis and saved as a summary.
-    If a summary already exists for this meeting, it returns the existing one instead of creating a duplicate.
+    If a summary already exists for this meeting, the job returns the existing one instead of creating a duplicate.
+    Poll GET /api/jobs/{id}; once it has succeeded, `result` holds the SummaryResponse.
     """
-    try:
-        # First, check if we already have a structured summary for this meeting
-        existing_summaries = await crud.get_summaries_by_meeting(db, meeting_id, current_user.id)
-        
-        # Look for AI-generated structured notes summary
-        for summary in existing_summaries:
-            if (summary.summary_type == "ai_generated" and 
-                summary.tags and "structured_notes" in summary.tags):
-                print(f"✅ Found existing structured summary for meeting {meeting_id}")
-                return SummaryResponse.from_orm(summary)
-        
-        print(f"🔍 No existing structured summary found, generating new one for meeting {meeting_id}")
-        
-        # Generate structured notes using AI
-        structured_notes = await comprehensive_notes_service.generate_structured_meeting_notes(
-            db, meeting_id, current_user.id, request.model_dump() if request else {}
+    meeting = await crud.get_meeting_by_id(db, meeting_id, current_user.id)
+    if not meeting:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Meeting not found"
         )
-        
-        # Convert structured notes to summary format
-        import json
-        summary_content = "# 📋 Meeting Summary\n\n"
-        
-        if structured_notes['notes']['to_do']:
-            summary_content += "## 🎯 Action Items\n\n"
-            for i, item in enumerate(structured_notes['notes']['to_do'], 1):
-                summary_content += f"### {i}. {item['task_name']} 📋\n\n"
-                summary_content += f"**Assignee:** {item['assignee']}\n\n"
-                summary_content += f"**Deadline:** {item['deadline']}\n\n"
-                summary_content += f"**Description:** {item['task_description']}\n\n"
-                summary_content += "---\n\n"
-        
-        if structured_notes['notes']['key_updates']:
-            summary_content += "## 📢 Key Updates\n\n"
-            for update in structured_notes['notes']['key_updates']:
-                summary_content += f"### {update['update_number']}. Update #{update['update_number']} 📋\n\n"
-                summary_content += f"**Description:** {update['update_description']}\n\n"
-                summary_content += "---\n\n"
-        
-        if structured_notes['notes']['brainstorming_ideas']:
-            summary_content += "## 💡 Ideas & Insights\n\n"
-            for idea in structured_notes['notes']['brainstorming_ideas']:
-                summary_content += f"### {idea['idea_number']}. Idea #{idea['idea_number']} 💡\n\n"
-                summary_content += f"**Description:** {idea['idea_description']}\n\n"
-                summary_content += "---\n\n"
-        
-        # Create summary data
-        from .schemas import SummaryCreate
-        summary_data = SummaryCreate(
-            meeting_id=meeting_id,
-            title=f"AI Meeting Summary - {datetime.now().strftime('%B %d, %Y')}",
-            content=summary_content,
-            summary_type="ai_generated",
-            action_items=json.dumps(structured_notes['notes']['to_do']) if structured_notes['notes']['to_do'] else None,
-            key_points=json.dumps(structured_notes['notes']['key_updates']) if structured_notes['notes']['key_updates'] else None,
-            decisions=json.dumps(structured_notes['notes']['brainstorming_ideas']) if structured_notes['notes']['brainstorming_ideas'] else None,
-            tags="ai_generated,structured_notes",
-            is_favorite=False
+    
+    try:
+        job = await job_queue.enqueue(
+            current_user.id,
+            "structured_notes",
+            {"meeting_id": meeting_id, "request": request.model_dump(mode="json") if request else {}},
+            idempotency_key=f"structured_notes:{current_user.id}:{idempotency_key}" if idempotency_key else None
         )
-        
-        # Save as summary in database
-        summary = await crud.create_summary(db, summary_data, current_user.id)
-        print(f"✅ Created new structured summary for meeting {meeting_id}")
-        return SummaryResponse.from_orm(summary)
+        return JobResponse.from_orm(job)
         
     except Exception as e:
-        print(f"❌ Error in generate_structured_meeting_notes: {str(e)}")
+        logger.error(f"❌ Error in generate_structured_meeting_notes: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
 
 
+@dashboard_router.post("/meetings/{meeting_id}/structured-notes/stream")
+async def stream_structured_meeting_notes(
+    meeting_id: str,
+    request: Request,
+    notes_request: Optional[GenerateStructuredNotesRequest] = None,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Generate structured meeting notes, streamed using Server-Sent Events
+    
+    Same input and result as POST /meetings/{id}/structured-notes. Each action
+    item, key update and idea is validated against the structured notes schema
+    and sent as soon as the model has finished writing it; the summary is saved
+    once the whole document is complete and valid. An existing structured
+    summary is sent as `done` straight away.
+    
+    Events:
+    - `start`: sent immediately
+    - `item`: `{"section": "to_do" | "key_updates" | "brainstorming_ideas", "item": {...}}`
+    - `done`: the saved SummaryResponse
+    - `error`: `{"detail"}`; nothing was saved
+    """
+    meeting = await crud.get_meeting_by_id(db, meeting_id, current_user.id)
+    if not meeting:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Meeting not found"
+        )
+    
+    user_id = current_user.id
+    options = notes_request.model_dump(mode="json") if notes_request else {}
+    return _generation_response(
+        request,
+        lambda session: _embed_when_done(
+            comprehensive_notes_service.stream_structured_notes_summary(session, meeting_id, user_id, options),
+            user_id, meeting_id
+        )
+    )
+
+
 @dashboard_router.get("/meetings/{meeting_id}/structured-notes", response_model=SummaryResponse)
 async def get_structured_meeting_notes(
     meeting_id: str,
@@ -810,7 +1170,7 @@ async def download_summary_pdf(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Error downloading summary PDF: {str(e)}")
+        logger.error(f"❌ Error downloading summary PDF: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to generate PDF"
@@ -863,7 +1223,7 @@ async def download_meeting_pdf(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Error downloading meeting PDF: {str(e)}")
+        logger.error(f"❌ Error downloading meeting PDF: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to generate PDF"
@@ -892,7 +1252,7 @@ async def get_global_statistics(
         )
         
     except Exception as e:
-        print(f"❌ Error getting global statistics: {str(e)}")
+        logger.error(f"❌ Error getting global statistics: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve statistics"
@@ -1,17 +1,28 @@
-from typing import List, Optional, Dict, Any
+import logging
+import asyncio
+from typing import List, Optional, Dict, Any, AsyncIterator, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, func
-from .models import ComprehensiveNotes, Meeting, Transcript
+from sqlalchemy import select, and_, func, delete
+from .models import ComprehensiveNotes, Meeting, Tag
 from .schemas import (
     ComprehensiveNotesRequest, 
     ComprehensiveNotesResponse, 
     ComprehensiveNotesUpdate,
     TranscriptHighlight,
-    NotesSearchRequest
+    NotesSearchRequest,
+    SummaryCreate,
+    SummaryResponse
 )
+from . import crud
+from .summary_items import parse_tags
+from search import indexer as search_indexer
+from search.service import search_service
 from .openai_service import openai_service
+from .task_graph import TaskGraph
 import json
-from datetime import datetime
+from datetime import date, datetime
+
+logger = logging.getLogger(__name__)
 
 
 class ComprehensiveNotesService:
@@ -37,116 +48,233 @@ class ComprehensiveNotesService:
             Created comprehensive notes
         """
         try:
-            print(f"🔍 DEBUG: Creating comprehensive notes for meeting {meeting_id}, user {user_id}")
-            print(f"🔍 DEBUG: Request data: {request}")
-            
-            # Get meeting data
-            meeting_query = select(Meeting).where(
-                and_(Meeting.id == meeting_id, Meeting.user_id == user_id)
+            meeting, transcript_text, user_notes, ai_summary = await self._load_notes_sources(
+                db, meeting_id, user_id, request
             )
-            meeting_result = await db.execute(meeting_query)
-            meeting = meeting_result.scalar_one_or_none()
-            
-            if not meeting:
-                print(f"❌ DEBUG: Meeting not found for id {meeting_id} and user {user_id}")
-                raise Exception("Meeting not found")
-            
-            print(f"✅ DEBUG: Found meeting: {meeting.title}, user_notes: {meeting.user_notes}, summary: {meeting.summary}")
-            
-            # Get transcripts
-            transcripts_query = select(Transcript).where(Transcript.meeting_id == meeting_id)
-            transcripts_result = await db.execute(transcripts_query)
-            transcripts = transcripts_result.scalars().all()
-            
-            print(f"🔍 DEBUG: Found {len(transcripts)} transcripts")
-            
-            # Build transcript text
-            transcript_text = "\n".join([
-                f"{t.speaker or 'Unknown'} ({t.timestamp or 'Unknown time'}): {t.text}"
-                for t in transcripts
-            ])
-            
-            print(f"🔍 DEBUG: Transcript text length: {len(transcript_text)}")
-            if len(transcript_text) == 0:
-                print("⚠️ DEBUG: No transcript text found! Checking meeting status before sync...")
-                
-                # Check if meeting is ended before attempting sync
-                if meeting.status == "ended":
-                    print(f"🛑 Meeting {meeting_id} has ended. Skipping transcript sync.")
-                elif meeting.status == "active":
-                    try:
-                        # Import dashboard_service to sync transcripts
-                        from .service import dashboard_service
-                        synced_transcripts = await dashboard_service.sync_transcripts(db, meeting_id, user_id)
-                        print(f"✅ DEBUG: Synced {len(synced_transcripts)} transcripts")
-                        
-                        # Re-fetch transcripts after sync
-                        transcripts_query = select(Transcript).where(Transcript.meeting_id == meeting_id)
-                        transcripts_result = await db.execute(transcripts_query)
-                        transcripts = transcripts_result.scalars().all()
-                        
-                        # Rebuild transcript text
-                        transcript_text = "\n".join([
-                            f"{t.speaker or 'Unknown'} ({t.timestamp or 'Unknown time'}): {t.text}"
-                            for t in transcripts
-                        ])
-                        print(f"🔍 DEBUG: After sync, transcript text length: {len(transcript_text)}")
-                    except Exception as sync_error:
-                        print(f"⚠️ DEBUG: Failed to sync transcripts: {str(sync_error)}")
-                        # Continue with empty transcripts
-                else:
-                    print(f"⚠️ Meeting status is '{meeting.status}'. Skipping transcript sync.")
             
-            # Prepare data for AI generation
-            user_notes = meeting.user_notes if request.include_user_notes else None
-            ai_summary = meeting.summary if request.include_ai_summary else None
-            
-            print(f"🔍 DEBUG: Using user_notes: {user_notes}, ai_summary: {ai_summary}")
-            
-            # Process transcript highlights
-            transcript_highlights = None
-            if request.include_transcript_highlights and request.transcript_highlights:
-                transcript_highlights = request.transcript_highlights
-            elif request.include_transcript_highlights and not request.transcript_highlights:
-                # Auto-generate smart highlights
-                try:
-                    print("🔄 DEBUG: Generating smart highlights...")
-                    smart_highlights = await openai_service.generate_smart_highlights(transcript_text)
-                    transcript_highlights = [
-                        TranscriptHighlight(
-                            transcript_id="auto",
-                            speaker=h.get("speaker"),
-                            text=h.get("text"),
-                            timestamp=None,
-                            highlight_reason=h.get("reason")
-                        )
-                        for h in smart_highlights
-                    ]
-                    print(f"✅ DEBUG: Generated {len(transcript_highlights)} smart highlights")
-                except Exception as e:
-                    print(f"⚠️ Failed to generate smart highlights: {str(e)}")
+            # Highlights and notes only need the loaded sources, so they are generated
+            # concurrently; a failed step leaves its fallback and the other result is kept
+            requested_highlights = self._requested_highlights(request)
+            graph = TaskGraph(user_id)
+            if self._wants_auto_highlights(request, transcript_text):
+                graph.add("highlights", lambda: self._generate_highlights(transcript_text), fallback=None)
             
             # Generate comprehensive notes using AI
-            comprehensive_notes_text = ""
             if transcript_text:
-                try:
-                    print("🔄 DEBUG: Generating comprehensive notes with AI...")
-                    comprehensive_notes_text = await openai_service.generate_comprehensive_notes(
+                logger.debug("🔄 DEBUG: Generating comprehensive notes with AI...")
+                graph.add(
+                    "notes",
+                    lambda: openai_service.generate_comprehensive_notes(
                         transcript_text=transcript_text,
                         user_notes=user_notes,
                         ai_summary=ai_summary,
-                        transcript_highlights=transcript_highlights,
+                        transcript_highlights=requested_highlights,
                         template_type=request.template_type,
                         custom_prompt=request.custom_prompt,
                         meeting_context=f"Meeting Platform: {meeting.meeting_platform}, Bot: {meeting.bot_name}"
-                    )
-                    print(f"✅ DEBUG: Generated comprehensive notes, length: {len(comprehensive_notes_text)}")
-                except Exception as e:
-                    print(f"⚠️ Failed to generate comprehensive notes: {str(e)}")
-                    comprehensive_notes_text = "Failed to generate comprehensive notes. Please try again."
+                    ),
+                    fallback="Failed to generate comprehensive notes. Please try again."
+                )
+            
+            results = await graph.run()
+            transcript_highlights = results.get("highlights", requested_highlights)
+            
+            if transcript_text:
+                comprehensive_notes_text = results["notes"]
+                logger.debug(f"✅ DEBUG: Generated comprehensive notes, length: {len(comprehensive_notes_text)}")
+            else:
+                logger.warning("⚠️ DEBUG: No transcript text available, creating notes with available data only")
+                comprehensive_notes_text = self._notes_without_transcript(meeting, user_notes, ai_summary)
+            
+            return await self._save_comprehensive_notes(
+                db, meeting_id, user_id, request,
+                user_notes, ai_summary, transcript_highlights, comprehensive_notes_text
+            )
+            
+        except Exception as e:
+            logger.error(f"❌ Error creating comprehensive notes: {str(e)}")
+            raise Exception(f"Failed to create comprehensive notes: {str(e)}")
+    
+    async def stream_comprehensive_notes(
+        self,
+        db: AsyncSession,
+        meeting_id: str,
+        user_id: str,
+        request: ComprehensiveNotesRequest
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Create comprehensive notes for a meeting, streaming the text as it is generated
+        
+        The notes are saved once generation completes; nothing is saved if it fails.
+        
+        Args:
+            db: Database session
+            meeting_id: Meeting ID
+            user_id: User ID
+            request: Comprehensive notes request data
+            
+        Yields:
+            ("delta", text) chunks of the notes, then ("done", ComprehensiveNotesResponse)
+        """
+        highlights_run = None
+        try:
+            meeting, transcript_text, user_notes, ai_summary = await self._load_notes_sources(
+                db, meeting_id, user_id, request
+            )
+            
+            # Auto highlights are generated alongside the streamed notes
+            transcript_highlights = self._requested_highlights(request)
+            if self._wants_auto_highlights(request, transcript_text):
+                graph = TaskGraph(user_id)
+                graph.add("highlights", lambda: self._generate_highlights(transcript_text), fallback=None)
+                highlights_run = asyncio.ensure_future(graph.run())
+            
+            comprehensive_notes_text = ""
+            if transcript_text:
+                async for event, data in openai_service.stream_comprehensive_notes(
+                    transcript_text=transcript_text,
+                    user_notes=user_notes,
+                    ai_summary=ai_summary,
+                    transcript_highlights=transcript_highlights,
+                    template_type=request.template_type,
+                    custom_prompt=request.custom_prompt,
+                    meeting_context=f"Meeting Platform: {meeting.meeting_platform}, Bot: {meeting.bot_name}"
+                ):
+                    if event == "delta":
+                        yield event, data
+                    else:
+                        comprehensive_notes_text = data
+            else:
+                logger.warning("⚠️ DEBUG: No transcript text available, creating notes with available data only")
+                comprehensive_notes_text = self._notes_without_transcript(meeting, user_notes, ai_summary)
+                yield "delta", comprehensive_notes_text
+            
+            if highlights_run:
+                transcript_highlights = (await highlights_run)["highlights"]
+            
+            notes = await self._save_comprehensive_notes(
+                db, meeting_id, user_id, request,
+                user_notes, ai_summary, transcript_highlights, comprehensive_notes_text
+            )
+            yield "done", notes
+            
+        except Exception as e:
+            logger.error(f"❌ Error streaming comprehensive notes: {str(e)}")
+            raise Exception(f"Failed to create comprehensive notes: {str(e)}")
+        finally:
+            if highlights_run and not highlights_run.done():
+                highlights_run.cancel()
+    
+    async def _load_notes_sources(
+        self,
+        db: AsyncSession,
+        meeting_id: str,
+        user_id: str,
+        request: ComprehensiveNotesRequest
+    ) -> Tuple[Meeting, str, Optional[str], Optional[str]]:
+        """
+        Collect the inputs of comprehensive notes for a meeting
+        
+        Returns:
+            (meeting, transcript text, user notes, AI summary)
+            
+        Raises:
+            Exception: If the meeting is not found
+        """
+        logger.debug(f"🔍 DEBUG: Creating comprehensive notes for meeting {meeting_id}, user {user_id}")
+        logger.debug(f"🔍 DEBUG: Request data: {request}")
+        
+        # Get meeting data
+        meeting_query = select(Meeting).where(
+            and_(Meeting.id == meeting_id, Meeting.user_id == user_id)
+        )
+        meeting_result = await db.execute(meeting_query)
+        meeting = meeting_result.scalar_one_or_none()
+        
+        if not meeting:
+            logger.error(f"❌ DEBUG: Meeting not found for id {meeting_id} and user {user_id}")
+            raise Exception("Meeting not found")
+        
+        logger.debug(f"✅ DEBUG: Found meeting: {meeting.name}, user_notes: {meeting.user_notes}, summary: {meeting.summary}")
+        
+        # Get transcripts
+        transcripts = await crud.get_transcripts_by_meeting(db, meeting_id, user_id)
+        
+        logger.debug(f"🔍 DEBUG: Found {len(transcripts)} transcripts")
+        
+        # Build transcript text
+        transcript_text = "\n".join([
+            f"{t.speaker or 'Unknown'} ({t.timestamp or 'Unknown time'}): {t.text}"
+            for t in transcripts
+        ])
+        
+        logger.debug(f"🔍 DEBUG: Transcript text length: {len(transcript_text)}")
+        if len(transcript_text) == 0:
+            logger.warning("⚠️ DEBUG: No transcript text found! Checking meeting status before sync...")
+            
+            # Check if meeting is ended before attempting sync
+            if meeting.status == "ended":
+                logger.info(f"🛑 Meeting {meeting_id} has ended. Skipping transcript sync.")
+            elif meeting.status == "active":
+                try:
+                    # Join (or trigger) the ingestion worker's sync for this meeting
+                    from .transcript_ingestion import transcript_ingestion
+                    synced_transcripts = await transcript_ingestion.ingest(meeting_id, user_id)
+                    logger.debug(f"✅ DEBUG: Synced {len(synced_transcripts)} transcripts")
+                    
+                    # Re-fetch transcripts after sync
+                    transcripts = await crud.get_transcripts_by_meeting(db, meeting_id, user_id)
+                    
+                    # Rebuild transcript text
+                    transcript_text = "\n".join([
+                        f"{t.speaker or 'Unknown'} ({t.timestamp or 'Unknown time'}): {t.text}"
+                        for t in transcripts
+                    ])
+                    logger.debug(f"🔍 DEBUG: After sync, transcript text length: {len(transcript_text)}")
+                except Exception as sync_error:
+                    logger.warning(f"⚠️ DEBUG: Failed to sync transcripts: {str(sync_error)}")
+                    # Continue with empty transcripts
             else:
-                print("⚠️ DEBUG: No transcript text available, creating notes with available data only")
-                comprehensive_notes_text = f"""
+                logger.warning(f"⚠️ Meeting status is '{meeting.status}'. Skipping transcript sync.")
+        
+        # Prepare data for AI generation
+        user_notes = meeting.user_notes if request.include_user_notes else None
+        ai_summary = meeting.summary if request.include_ai_summary else None
+        
+        logger.debug(f"🔍 DEBUG: Using user_notes: {user_notes}, ai_summary: {ai_summary}")
+        
+        return meeting, transcript_text, user_notes, ai_summary
+    
+    def _requested_highlights(self, request: ComprehensiveNotesRequest) -> Optional[List[TranscriptHighlight]]:
+        """Highlights supplied with the request, if they are to be included"""
+        if request.include_transcript_highlights and request.transcript_highlights:
+            return request.transcript_highlights
+        return None
+    
+    def _wants_auto_highlights(self, request: ComprehensiveNotesRequest, transcript_text: str) -> bool:
+        """Whether smart highlights should be generated for the request"""
+        return bool(request.include_transcript_highlights and not request.transcript_highlights and transcript_text)
+    
+    async def _generate_highlights(self, transcript_text: str) -> List[TranscriptHighlight]:
+        """Auto-generate smart highlights from the transcript"""
+        logger.debug("🔄 DEBUG: Generating smart highlights...")
+        smart_highlights = await openai_service.generate_smart_highlights(transcript_text)
+        transcript_highlights = [
+            TranscriptHighlight(
+                transcript_id="auto",
+                speaker=h.get("speaker"),
+                text=h.get("text"),
+                timestamp=None,
+                highlight_reason=h.get("reason")
+            )
+            for h in smart_highlights
+        ]
+        logger.debug(f"✅ DEBUG: Generated {len(transcript_highlights)} smart highlights")
+        return transcript_highlights
+    
+    def _notes_without_transcript(self, meeting: Meeting, user_notes: Optional[str], ai_summary: Optional[str]) -> str:
+        """Notes text for a meeting that has no transcript yet"""
+        return f"""
 # Comprehensive Notes
 
 ## Meeting Information
@@ -167,34 +295,45 @@ No transcript data is currently available for this meeting. This could be becaus
 
 Please try again later or contact support if this issue persists.
 """
-            
-            # Create comprehensive notes record
-            comprehensive_notes = ComprehensiveNotes(
-                meeting_id=meeting_id,
-                user_id=user_id,
-                user_notes=user_notes,
-                ai_summary=ai_summary,
-                transcript_highlights=json.dumps([h.dict() for h in transcript_highlights]) if transcript_highlights else None,
-                comprehensive_notes=comprehensive_notes_text,
-                template_type=request.template_type,
-                tags=request.tags,
-                include_ai_summary=request.include_ai_summary,
-                include_user_notes=request.include_user_notes,
-                include_transcript_highlights=request.include_transcript_highlights,
-                custom_prompt=request.custom_prompt
-            )
-            
-            db.add(comprehensive_notes)
-            await db.commit()
-            await db.refresh(comprehensive_notes)
-            
-            print(f"✅ Created comprehensive notes for meeting {meeting_id}")
-            
-            return ComprehensiveNotesResponse.from_orm(comprehensive_notes)
-            
-        except Exception as e:
-            print(f"❌ Error creating comprehensive notes: {str(e)}")
-            raise Exception(f"Failed to create comprehensive notes: {str(e)}")
+    
+    async def _save_comprehensive_notes(
+        self,
+        db: AsyncSession,
+        meeting_id: str,
+        user_id: str,
+        request: ComprehensiveNotesRequest,
+        user_notes: Optional[str],
+        ai_summary: Optional[str],
+        transcript_highlights: Optional[List[TranscriptHighlight]],
+        comprehensive_notes_text: str
+    ) -> ComprehensiveNotesResponse:
+        """Save generated comprehensive notes with their search index entries and tags"""
+        # Create comprehensive notes record
+        comprehensive_notes = ComprehensiveNotes(
+            meeting_id=meeting_id,
+            user_id=user_id,
+            user_notes=user_notes,
+            ai_summary=ai_summary,
+            transcript_highlights=json.dumps([h.dict() for h in transcript_highlights]) if transcript_highlights else None,
+            comprehensive_notes=comprehensive_notes_text,
+            template_type=request.template_type,
+            tags=request.tags,
+            include_ai_summary=request.include_ai_summary,
+            include_user_notes=request.include_user_notes,
+            include_transcript_highlights=request.include_transcript_highlights,
+            custom_prompt=request.custom_prompt
+        )
+        
+        db.add(comprehensive_notes)
+        await db.flush()
+        await search_indexer.index_notes(db, comprehensive_notes)
+        crud.add_item_tags(db, user_id, meeting_id, comprehensive_notes.tags, notes_id=comprehensive_notes.id)
+        await db.commit()
+        await db.refresh(comprehensive_notes)
+        
+        logger.info(f"✅ Created comprehensive notes for meeting {meeting_id}")
+        
+        return ComprehensiveNotesResponse.from_orm(comprehensive_notes)
     
     async def get_comprehensive_notes(
         self, 
@@ -220,7 +359,7 @@ Please try again later or contact support if this issue persists.
             return ComprehensiveNotesResponse.from_orm(notes)
             
         except Exception as e:
-            print(f"❌ Error getting comprehensive notes: {str(e)}")
+            logger.error(f"❌ Error getting comprehensive notes: {str(e)}")
             return None
     
     async def update_comprehensive_notes(
@@ -250,12 +389,14 @@ Please try again later or contact support if this issue persists.
                 notes.user_notes = update_data.user_notes
             if update_data.tags is not None:
                 notes.tags = update_data.tags
+                await crud.replace_item_tags(db, user_id, notes.meeting_id, notes.tags, notes_id=notes.id)
             if update_data.is_favorite is not None:
                 notes.is_favorite = update_data.is_favorite
             if update_data.template_type is not None:
                 notes.template_type = update_data.template_type
             
             notes.updated_at = datetime.utcnow()
+            await search_indexer.index_notes(db, notes)
             
             await db.commit()
             await db.refresh(notes)
@@ -263,7 +404,7 @@ Please try again later or contact support if this issue persists.
             return ComprehensiveNotesResponse.from_orm(notes)
             
         except Exception as e:
-            print(f"❌ Error updating comprehensive notes: {str(e)}")
+            logger.error(f"❌ Error updating comprehensive notes: {str(e)}")
             return None
     
     async def search_comprehensive_notes(
@@ -272,47 +413,70 @@ Please try again later or contact support if this issue persists.
         user_id: str,
         search_request: NotesSearchRequest
     ) -> List[ComprehensiveNotesResponse]:
-        """Search comprehensive notes"""
+        """
+        Search comprehensive notes
+        
+        A non-empty query goes through the full-text index and returns the
+        page best match first; without one, the filtered notes are paged
+        newest first.
+        """
         try:
-            query = select(ComprehensiveNotes).where(ComprehensiveNotes.user_id == user_id)
+            filtered = select(ComprehensiveNotes.id).where(ComprehensiveNotes.user_id == user_id)
             
             # Apply filters
-            if search_request.query:
-                search_term = f"%{search_request.query}%"
-                query = query.where(
-                    or_(
-                        ComprehensiveNotes.comprehensive_notes.ilike(search_term),
-                        ComprehensiveNotes.user_notes.ilike(search_term),
-                        ComprehensiveNotes.tags.ilike(search_term)
-                    )
-                )
-            
             if search_request.template_type:
-                query = query.where(ComprehensiveNotes.template_type == search_request.template_type)
+                filtered = filtered.where(ComprehensiveNotes.template_type == search_request.template_type)
             
             if search_request.favorites_only:
-                query = query.where(ComprehensiveNotes.is_favorite == True)
+                filtered = filtered.where(ComprehensiveNotes.is_favorite == True)
             
-            if search_request.tags:
-                for tag in search_request.tags:
-                    query = query.where(ComprehensiveNotes.tags.ilike(f"%{tag}%"))
+            for tag in parse_tags(",".join(search_request.tags or [])):
+                filtered = filtered.where(ComprehensiveNotes.id.in_(
+                    select(Tag.notes_id).where(and_(Tag.user_id == user_id, Tag.name == tag))
+                ))
             
             if search_request.date_from:
-                query = query.where(ComprehensiveNotes.created_at >= search_request.date_from)
+                filtered = filtered.where(ComprehensiveNotes.created_at >= search_request.date_from)
             
             if search_request.date_to:
-                query = query.where(ComprehensiveNotes.created_at <= search_request.date_to)
-            
-            # Order by creation date (newest first)
-            query = query.order_by(ComprehensiveNotes.created_at.desc())
+                filtered = filtered.where(ComprehensiveNotes.created_at <= search_request.date_to)
+            
+            page, per_page = search_request.page, search_request.per_page
+            if not search_request.query.strip():
+                # Order by creation date (newest first)
+                result = await db.execute(
+                    select(ComprehensiveNotes)
+                    .where(ComprehensiveNotes.id.in_(filtered))
+                    .order_by(ComprehensiveNotes.created_at.desc())
+                    .limit(per_page)
+                    .offset((page - 1) * per_page)
+                )
+                return [ComprehensiveNotesResponse.from_orm(notes) for notes in result.scalars().all()]
+            
+            hits, _ = await search_service.search(
+                db, user_id, search_request.query,
+                source_types=[search_indexer.NOTES],
+                source_ids=filtered,
+                page=page,
+                per_page=per_page
+            )
+            if not hits:
+                return []
             
-            result = await db.execute(query)
-            notes_list = result.scalars().all()
+            # Keep the ranking of the search hits
+            note_ids = [hit.source_id for hit in hits]
+            result = await db.execute(
+                select(ComprehensiveNotes).where(ComprehensiveNotes.id.in_(note_ids))
+            )
+            notes_by_id = {notes.id: notes for notes in result.scalars().all()}
             
-            return [ComprehensiveNotesResponse.from_orm(notes) for notes in notes_list]
+            return [
+                ComprehensiveNotesResponse.from_orm(notes_by_id[note_id])
+                for note_id in note_ids if note_id in notes_by_id
+            ]
             
         except Exception as e:
-            print(f"❌ Error searching comprehensive notes: {str(e)}")
+            logger.error(f"❌ Error searching comprehensive notes: {str(e)}")
             return []
     
     async def get_notes_statistics(
@@ -359,7 +523,7 @@ Please try again later or contact support if this issue persists.
             }
             
         except Exception as e:
-            print(f"❌ Error getting notes statistics: {str(e)}")
+            logger.error(f"❌ Error getting notes statistics: {str(e)}")
             return {
                 "total_notes": 0,
                 "favorite_notes": 0,
@@ -389,16 +553,168 @@ Please try again later or contact support if this issue persists.
             if not notes:
                 return False
             
+            await db.execute(delete(Tag).where(Tag.notes_id == notes_id))
             await db.delete(notes)
+            await search_indexer.remove_source(db, search_indexer.NOTES, notes_id)
             await db.commit()
             
-            print(f"✅ Deleted comprehensive notes {notes_id}")
+            logger.info(f"✅ Deleted comprehensive notes {notes_id}")
             return True
             
         except Exception as e:
-            print(f"❌ Error deleting comprehensive notes: {str(e)}")
+            logger.error(f"❌ Error deleting comprehensive notes: {str(e)}")
             return False
 
+    async def create_structured_notes_summary(
+        self, 
+        db: AsyncSession,
+        meeting_id: str,
+        user_id: str,
+        request: Optional[Dict] = None
+    ) -> SummaryResponse:
+        """
+        Generate structured notes for a meeting and save them as a summary
+        
+        If a structured summary already exists for the meeting it is returned
+        instead, so repeated or retried calls don't create duplicates.
+        
+        Args:
+            db: Database session
+            meeting_id: Meeting ID
+            user_id: User ID
+            request: Optional request parameters
+            
+        Returns:
+            The structured notes summary
+        """
+        existing = await self._get_structured_summary(db, meeting_id, user_id)
+        if existing:
+            return existing
+        
+        logger.debug(f"🔍 No existing structured summary found, generating new one for meeting {meeting_id}")
+        
+        # Generate structured notes using AI
+        structured_notes = await self.generate_structured_meeting_notes(db, meeting_id, user_id, request or {})
+        
+        return await self._save_structured_notes_summary(db, meeting_id, user_id, structured_notes['notes'])
+    
+    async def stream_structured_notes_summary(
+        self,
+        db: AsyncSession,
+        meeting_id: str,
+        user_id: str,
+        request: Optional[Dict] = None
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Generate structured notes for a meeting, streaming each item as it is validated
+        
+        The summary is saved once the stream completes; an existing structured
+        summary is returned straight away, as in create_structured_notes_summary.
+        
+        Args:
+            db: Database session
+            meeting_id: Meeting ID
+            user_id: User ID
+            request: Optional request parameters
+            
+        Yields:
+            ("item", {"section": ..., "item": ...}) per validated item, then ("done", SummaryResponse)
+        """
+        existing = await self._get_structured_summary(db, meeting_id, user_id)
+        if existing:
+            yield "done", existing
+            return
+        
+        try:
+            transcript_text, meeting_context, meeting_date = await self._load_structured_notes_input(db, meeting_id, user_id, request or {})
+            
+            structured_notes = None
+            async for event, data in openai_service.stream_structured_notes(
+                transcript_text=transcript_text,
+                meeting_context=meeting_context,
+                meeting_date=meeting_date
+            ):
+                if event == "item":
+                    yield event, data
+                else:
+                    structured_notes = data
+        except Exception as e:
+            logger.error(f"❌ Error streaming structured notes: {str(e)}")
+            raise Exception(f"Failed to generate structured notes: {str(e)}")
+        
+        summary = await self._save_structured_notes_summary(db, meeting_id, user_id, structured_notes['notes'])
+        yield "done", summary
+    
+    async def _get_structured_summary(
+        self,
+        db: AsyncSession,
+        meeting_id: str,
+        user_id: str
+    ) -> Optional[SummaryResponse]:
+        """Find the AI-generated structured notes summary of a meeting, if any"""
+        existing_summaries = await crud.get_summaries_by_meeting(db, meeting_id, user_id)
+        
+        # Look for AI-generated structured notes summary
+        for summary in existing_summaries:
+            if (summary.summary_type == "ai_generated" and 
+                summary.tags and "structured_notes" in summary.tags):
+                logger.info(f"✅ Found existing structured summary for meeting {meeting_id}")
+                return SummaryResponse.from_orm(summary)
+        
+        return None
+    
+    async def _save_structured_notes_summary(
+        self,
+        db: AsyncSession,
+        meeting_id: str,
+        user_id: str,
+        notes: Dict
+    ) -> SummaryResponse:
+        """Render structured notes as markdown and save them as the meeting's AI summary"""
+        # Convert structured notes to summary format
+        summary_content = "# 📋 Meeting Summary\n\n"
+        
+        if notes['to_do']:
+            summary_content += "## 🎯 Action Items\n\n"
+            for i, item in enumerate(notes['to_do'], 1):
+                summary_content += f"### {i}. {item['task_name']} 📋\n\n"
+                summary_content += f"**Assignee:** {item['assignee']}\n\n"
+                summary_content += f"**Deadline:** {item['deadline']}\n\n"
+                summary_content += f"**Description:** {item['task_description']}\n\n"
+                summary_content += "---\n\n"
+        
+        if notes['key_updates']:
+            summary_content += "## 📢 Key Updates\n\n"
+            for update in notes['key_updates']:
+                summary_content += f"### {update['update_number']}. Update #{update['update_number']} 📋\n\n"
+                summary_content += f"**Description:** {update['update_description']}\n\n"
+                summary_content += "---\n\n"
+        
+        if notes['brainstorming_ideas']:
+            summary_content += "## 💡 Ideas & Insights\n\n"
+            for idea in notes['brainstorming_ideas']:
+                summary_content += f"### {idea['idea_number']}. Idea #{idea['idea_number']} 💡\n\n"
+                summary_content += f"**Description:** {idea['idea_description']}\n\n"
+                summary_content += "---\n\n"
+        
+        # Create summary data
+        summary_data = SummaryCreate(
+            meeting_id=meeting_id,
+            title=f"AI Meeting Summary - {datetime.now().strftime('%B %d, %Y')}",
+            content=summary_content,
+            summary_type="ai_generated",
+            action_items=json.dumps(notes['to_do']) if notes['to_do'] else None,
+            key_points=json.dumps(notes['key_updates']) if notes['key_updates'] else None,
+            decisions=json.dumps(notes['brainstorming_ideas']) if notes['brainstorming_ideas'] else None,
+            tags="ai_generated,structured_notes",
+            is_favorite=False
+        )
+        
+        # Save as summary in database
+        summary = await crud.create_summary(db, summary_data, user_id)
+        logger.info(f"✅ Created new structured summary for meeting {meeting_id}")
+        return SummaryResponse.from_orm(summary)
+
     async def generate_structured_meeting_notes(
         self, 
         db: AsyncSession,
@@ -419,88 +735,19 @@ Please try again later or contact support if this issue persists.
             Structured notes with to_do, key_updates, and brainstorming_ideas
         """
         try:
-            print(f"🔍 DEBUG: Generating structured notes for meeting {meeting_id}, user {user_id}")
-            
-            # Get meeting data
-            meeting_query = select(Meeting).where(
-                and_(Meeting.id == meeting_id, Meeting.user_id == user_id)
-            )
-            meeting_result = await db.execute(meeting_query)
-            meeting = meeting_result.scalar_one_or_none()
-            
-            if not meeting:
-                print(f"❌ DEBUG: Meeting not found for id {meeting_id} and user {user_id}")
-                raise Exception("Meeting not found")
-            
-            print(f"✅ DEBUG: Found meeting: {meeting.title if hasattr(meeting, 'title') else 'N/A'}")
-            
-            # Get transcripts
-            transcripts_query = select(Transcript).where(Transcript.meeting_id == meeting_id)
-            transcripts_result = await db.execute(transcripts_query)
-            transcripts = transcripts_result.scalars().all()
-            
-            print(f"🔍 DEBUG: Found {len(transcripts)} transcripts")
-            
-            # Build transcript text
-            transcript_text = "\n".join([
-                f"{t.speaker or 'Speaker'} ({t.timestamp or 'Time'}): {t.text}"
-                for t in transcripts
-            ])
-            
-            print(f"🔍 DEBUG: Transcript text length: {len(transcript_text)}")
-            
-            # If no transcripts, try to sync from Vexa first (only for active meetings)
-            if len(transcript_text.strip()) < 50:
-                print("⚠️ DEBUG: No meaningful transcript found! Checking meeting status before sync...")
-                
-                # Only attempt sync for active meetings
-                if meeting.status == "ended":
-                    print(f"🛑 Meeting {meeting_id} has ended. Skipping transcript sync.")
-                elif meeting.status == "active":
-                    try:
-                        from .service import dashboard_service
-                        synced_transcripts = await dashboard_service.sync_transcripts(db, meeting_id, user_id)
-                        print(f"✅ DEBUG: Synced {len(synced_transcripts)} transcripts")
-                        
-                        # Re-fetch transcripts after sync
-                        transcripts_query = select(Transcript).where(Transcript.meeting_id == meeting_id)
-                        transcripts_result = await db.execute(transcripts_query)
-                        transcripts = transcripts_result.scalars().all()
-                        
-                        # Rebuild transcript text
-                        transcript_text = "\n".join([
-                            f"{t.speaker or 'Speaker'} ({t.timestamp or 'Time'}): {t.text}"
-                            for t in transcripts
-                        ])
-                        print(f"🔍 DEBUG: After sync, transcript text length: {len(transcript_text)}")
-                    except Exception as sync_error:
-                        print(f"⚠️ DEBUG: Failed to sync transcripts: {str(sync_error)}")
-                else:
-                    print(f"⚠️ Meeting status is '{meeting.status}'. Skipping transcript sync.")
-            
-            # Final check for transcript requirement
-            if len(transcript_text.strip()) < 50:
-                raise Exception("No meaningful transcript data available. Cannot generate structured notes without sufficient meeting content.")
-            
-            # Prepare meeting context
-            context_parts = []
-            if hasattr(meeting, 'meeting_platform') and meeting.meeting_platform:
-                context_parts.append(f"Platform: {meeting.meeting_platform}")
-            if hasattr(meeting, 'bot_name') and meeting.bot_name:
-                context_parts.append(f"Bot: {meeting.bot_name}")
-            if request and request.get('custom_context'):
-                context_parts.append(request['custom_context'])
+            logger.debug(f"🔍 DEBUG: Generating structured notes for meeting {meeting_id}, user {user_id}")
             
-            meeting_context = ", ".join(context_parts) if context_parts else None
+            transcript_text, meeting_context, meeting_date = await self._load_structured_notes_input(db, meeting_id, user_id, request)
             
             # Generate structured notes using OpenAI
-            print("🔄 DEBUG: Calling OpenAI to generate structured notes...")
+            logger.debug("🔄 DEBUG: Calling OpenAI to generate structured notes...")
             structured_notes = await openai_service.generate_structured_notes(
                 transcript_text=transcript_text,
-                meeting_context=meeting_context
+                meeting_context=meeting_context,
+                meeting_date=meeting_date
             )
             
-            print(f"✅ DEBUG: Generated structured notes successfully")
+            logger.debug(f"✅ DEBUG: Generated structured notes successfully")
             
             # Add metadata
             result = {
@@ -519,9 +766,92 @@ Please try again later or contact support if this issue persists.
             return result
             
         except Exception as e:
-            print(f"❌ Error generating structured notes: {str(e)}")
+            logger.error(f"❌ Error generating structured notes: {str(e)}")
             raise Exception(f"Failed to generate structured notes: {str(e)}")
 
+    async def _load_structured_notes_input(
+        self,
+        db: AsyncSession,
+        meeting_id: str,
+        user_id: str,
+        request: Optional[Dict]
+    ) -> Tuple[str, Optional[str], date]:
+        """
+        Collect the transcript text, meeting context and meeting date for structured notes
+        
+        Raises:
+            Exception: If the meeting is not found or has too little transcript
+        """
+        # Get meeting data
+        meeting_query = select(Meeting).where(
+            and_(Meeting.id == meeting_id, Meeting.user_id == user_id)
+        )
+        meeting_result = await db.execute(meeting_query)
+        meeting = meeting_result.scalar_one_or_none()
+        
+        if not meeting:
+            logger.error(f"❌ DEBUG: Meeting not found for id {meeting_id} and user {user_id}")
+            raise Exception("Meeting not found")
+        
+        logger.debug(f"✅ DEBUG: Found meeting: {meeting.title if hasattr(meeting, 'title') else 'N/A'}")
+        
+        # Get transcripts
+        transcripts = await crud.get_transcripts_by_meeting(db, meeting_id, user_id)
+        
+        logger.debug(f"🔍 DEBUG: Found {len(transcripts)} transcripts")
+        
+        # Build transcript text
+        transcript_text = "\n".join([
+            f"{t.speaker or 'Speaker'} ({t.timestamp or 'Time'}): {t.text}"
+            for t in transcripts
+        ])
+        
+        logger.debug(f"🔍 DEBUG: Transcript text length: {len(transcript_text)}")
+        
+        # If no transcripts, try to sync from Vexa first (only for active meetings)
+        if len(transcript_text.strip()) < 50:
+            logger.warning("⚠️ DEBUG: No meaningful transcript found! Checking meeting status before sync...")
+            
+            # Only attempt sync for active meetings
+            if meeting.status == "ended":
+                logger.info(f"🛑 Meeting {meeting_id} has ended. Skipping transcript sync.")
+            elif meeting.status == "active":
+                try:
+                    from .transcript_ingestion import transcript_ingestion
+                    synced_transcripts = await transcript_ingestion.ingest(meeting_id, user_id)
+                    logger.debug(f"✅ DEBUG: Synced {len(synced_transcripts)} transcripts")
+                    
+                    # Re-fetch transcripts after sync
+                    transcripts = await crud.get_transcripts_by_meeting(db, meeting_id, user_id)
+                    
+                    # Rebuild transcript text
+                    transcript_text = "\n".join([
+                        f"{t.speaker or 'Speaker'} ({t.timestamp or 'Time'}): {t.text}"
+                        for t in transcripts
+                    ])
+                    logger.debug(f"🔍 DEBUG: After sync, transcript text length: {len(transcript_text)}")
+                except Exception as sync_error:
+                    logger.warning(f"⚠️ DEBUG: Failed to sync transcripts: {str(sync_error)}")
+            else:
+                logger.warning(f"⚠️ Meeting status is '{meeting.status}'. Skipping transcript sync.")
+        
+        # Final check for transcript requirement
+        if len(transcript_text.strip()) < 50:
+            raise Exception("No meaningful transcript data available. Cannot generate structured notes without sufficient meeting content.")
+        
+        # Prepare meeting context
+        context_parts = []
+        if hasattr(meeting, 'meeting_platform') and meeting.meeting_platform:
+            context_parts.append(f"Platform: {meeting.meeting_platform}")
+        if hasattr(meeting, 'bot_name') and meeting.bot_name:
+            context_parts.append(f"Bot: {meeting.bot_name}")
+        if request and request.get('custom_context'):
+            context_parts.append(request['custom_context'])
+        
+        meeting_context = ", ".join(context_parts) if context_parts else None
+        
+        return transcript_text, meeting_context, meeting.meeting_date
+
     async def generate_comprehensive_notes(
         self, 
         db: AsyncSession,
@@ -561,7 +891,7 @@ Please try again later or contact support if this issue persists.
             return [ComprehensiveNotesResponse.from_orm(notes) for notes in notes_list]
             
         except Exception as e:
-            print(f"❌ Error getting meeting notes: {str(e)}")
+            logger.error(f"❌ Error getting meeting notes: {str(e)}")
             return []
 
 
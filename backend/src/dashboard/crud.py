@@ -1,12 +1,25 @@
+import logging
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy import inspect
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, desc, func, extract
-from typing import Optional, List, Dict
+from sqlalchemy import select, and_, desc, func, delete, update, tuple_
+from typing import Callable, Optional, List, Dict, Tuple
 from datetime import datetime, date, timedelta
+import uuid
 
-from .models import Meeting, Transcript, ComprehensiveNotes, Summary
+from .models import Meeting, Transcript, TranscriptArchive, ComprehensiveNotes, Summary, Tag, ActionItem, LLMCacheEntry
 from .schemas import MeetingCreate, MeetingUpdate, TranscriptBase, SummaryCreate, SummaryUpdate
+from .dashboard_cache import dashboard_cache
+from .transcript_archive import ARCHIVE_FORMAT_VERSION, encode_transcripts, decode_transcripts
+from .summary_items import parse_tags, parse_action_items
+from .date_ranges import get_timezone, local_today, month_range, year_range, local_dates_to_utc, utc_to_local_date
 from auth.models import User
+from search import indexer as search_indexer
+from search.models import SearchDocument
+from settings import settings
+
+logger = logging.getLogger(__name__)
 
 
 # Meeting CRUD operations
@@ -25,13 +38,33 @@ async def create_meeting(db: AsyncSession, meeting_data: MeetingCreate, user_id:
     
     db.add(meeting)
     await db.commit()
+    await dashboard_cache.invalidate_user(user_id)
     await db.refresh(meeting)
     return meeting
 
 
+def _session_meeting(db: AsyncSession, meeting_id: str, user_id: str) -> Optional[Meeting]:
+    """
+    Return the meeting if this session has already loaded it for its owner
+    
+    Sessions are request-scoped, so a meeting the service layer loaded to check
+    ownership is reused by the crud write that follows instead of being fetched
+    again. Expired or deleted instances are ignored and reloaded.
+    """
+    meeting = db.identity_map.get(identity_key(Meeting, meeting_id))
+    if meeting is None:
+        return None
+    state = inspect(meeting)
+    if state.expired_attributes or state.deleted or state.was_deleted:
+        return None
+    return meeting if meeting.user_id == user_id else None
+
+
 async def get_meeting_by_id(db: AsyncSession, meeting_id: str, user_id: str) -> Optional[Meeting]:
-    """Get meeting by ID for a specific user"""
-    print(f"🔍 CRUD DEBUG: Looking for meeting_id={meeting_id}, user_id={user_id}")
+    """Get meeting by ID for a specific user (served from the session when already loaded)"""
+    meeting = _session_meeting(db, meeting_id, user_id)
+    if meeting is not None:
+        return meeting
     
     result = await db.execute(
         select(Meeting).where(
@@ -40,17 +73,16 @@ async def get_meeting_by_id(db: AsyncSession, meeting_id: str, user_id: str) ->
     )
     meeting = result.scalar_one_or_none()
     
-    print(f"🔍 CRUD DEBUG: Meeting found: {meeting is not None}")
-    if meeting:
-        print(f"🔍 CRUD DEBUG: Meeting details - id={meeting.id}, user_id={meeting.user_id}, status={meeting.status}")
-    else:
-        # Let's check if the meeting exists with any user
-        all_result = await db.execute(select(Meeting).where(Meeting.id == meeting_id))
-        any_meeting = all_result.scalar_one_or_none()
-        if any_meeting:
-            print(f"🔍 CRUD DEBUG: Meeting exists but for different user_id: {any_meeting.user_id}")
+    if meeting is None and settings.LOG_DEBUG_QUERIES:
+        # Diagnostic only: tell "wrong owner" apart from "does not exist".
+        # Costs an extra query, so it is off unless LOG_DEBUG_QUERIES is set.
+        owner_id = (await db.execute(
+            select(Meeting.user_id).where(Meeting.id == meeting_id)
+        )).scalar_one_or_none()
+        if owner_id is not None:
+            logger.debug("Meeting %s exists but belongs to user %s, not %s", meeting_id, owner_id, user_id)
         else:
-            print(f"🔍 CRUD DEBUG: Meeting does not exist in database")
+            logger.debug("Meeting %s does not exist", meeting_id)
     
     return meeting
 
@@ -58,16 +90,21 @@ async def get_meeting_by_id(db: AsyncSession, meeting_id: str, user_id: str) ->
 async def get_meetings_by_user(
     db: AsyncSession, 
     user_id: str, 
-    skip: int = 0, 
-    limit: int = 20
+    limit: int = 20, 
+    after: Optional[Tuple[datetime, str]] = None
 ) -> List[Meeting]:
-    """Get all meetings for a user with pagination"""
+    """
+    Get a user's meetings newest first, one keyset page at a time
+
+    Args:
+        after: (created_at, id) of the last meeting on the previous page
+    """
+    query = select(Meeting).where(Meeting.user_id == user_id)
+    if after is not None:
+        query = query.where(tuple_(Meeting.created_at, Meeting.id) < tuple_(*after))
+    
     result = await db.execute(
-        select(Meeting)
-        .where(Meeting.user_id == user_id)
-        .order_by(desc(Meeting.created_at))
-        .offset(skip)
-        .limit(limit)
+        query.order_by(desc(Meeting.created_at), desc(Meeting.id)).limit(limit)
     )
     return result.scalars().all()
 
@@ -80,27 +117,94 @@ async def count_meetings_by_user(db: AsyncSession, user_id: str) -> int:
     return result.scalar() or 0
 
 
-async def count_meetings_by_user_this_month(db: AsyncSession, user_id: str) -> int:
-    """Count meetings for a user in current month"""
-    current_month = datetime.now().month
-    current_year = datetime.now().year
+async def get_dashboard_stats(db: AsyncSession, user_id: str, timezone: Optional[str] = None) -> Dict:
+    """
+    Get all dashboard counters for a user in a single query
+
+    Each counter is a scalar subquery served by the (user_id, ...) indexes,
+    so the whole set costs one round trip instead of six. "This month" is the
+    current month in the user's timezone.
+    """
+    tz = get_timezone(timezone)
+    month_start, month_end = month_range(local_today(tz))
+    month_start_utc, month_end_utc = local_dates_to_utc(month_start, month_end, tz)
+    
+    total_meetings = select(func.count(Meeting.id)).where(
+        Meeting.user_id == user_id
+    ).scalar_subquery()
+    
+    meetings_this_month = select(func.count(Meeting.id)).where(
+        and_(
+            Meeting.user_id == user_id,
+            Meeting.meeting_date >= month_start,
+            Meeting.meeting_date < month_end
+        )
+    ).scalar_subquery()
+    
+    avg_meeting_duration = select(func.avg(
+        func.extract('epoch', Meeting.ended_at) - func.extract('epoch', Meeting.started_at)
+    ) / 60).where(
+        and_(
+            Meeting.user_id == user_id,
+            Meeting.started_at.isnot(None),
+            Meeting.ended_at.isnot(None)
+        )
+    ).scalar_subquery()
+    
+    total_summaries = select(func.count(Summary.id)).where(
+        Summary.user_id == user_id
+    ).scalar_subquery()
+    
+    summaries_this_month = select(func.count(Summary.id)).where(
+        and_(
+            Summary.user_id == user_id,
+            Summary.created_at >= month_start_utc,
+            Summary.created_at < month_end_utc
+        )
+    ).scalar_subquery()
+    
+    total_tasks = select(func.count()).select_from(ActionItem).where(
+        ActionItem.user_id == user_id
+    ).scalar_subquery()
+    
+    open_tasks = select(func.count()).select_from(ActionItem).where(
+        and_(ActionItem.user_id == user_id, ActionItem.status == "open")
+    ).scalar_subquery()
     
     result = await db.execute(
-        select(func.count(Meeting.id)).where(
-            and_(
-                Meeting.user_id == user_id,
-                extract('month', Meeting.meeting_date) == current_month,
-                extract('year', Meeting.meeting_date) == current_year
-            )
+        select(
+            total_meetings.label('total_meetings'),
+            total_summaries.label('total_summaries'),
+            total_tasks.label('total_tasks'),
+            open_tasks.label('open_tasks'),
+            meetings_this_month.label('meetings_this_month'),
+            summaries_this_month.label('summaries_this_month'),
+            avg_meeting_duration.label('avg_meeting_duration_minutes')
         )
     )
-    return result.scalar() or 0
-
-
-async def get_meeting_heatmap_data(db: AsyncSession, user_id: str, year: int = None) -> List[Dict]:
-    """Get meeting count by date for heatmap visualization"""
+    row = result.one()
+    
+    return {
+        "total_meetings": row.total_meetings or 0,
+        "total_summaries": row.total_summaries or 0,
+        "total_tasks": row.total_tasks or 0,
+        "open_tasks": row.open_tasks or 0,
+        "meetings_this_month": row.meetings_this_month or 0,
+        "summaries_this_month": row.summaries_this_month or 0,
+        "avg_meeting_duration_minutes": round(row.avg_meeting_duration_minutes or 0.0, 1)
+    }
+
+
+async def get_meeting_heatmap_data(
+    db: AsyncSession, 
+    user_id: str, 
+    year: int = None, 
+    timezone: Optional[str] = None
+) -> List[Dict]:
+    """Get meeting count by date for heatmap visualization (defaults to the user's current year)"""
     if year is None:
-        year = datetime.now().year
+        year = local_today(get_timezone(timezone)).year
+    year_start, year_end = year_range(year)
     
     result = await db.execute(
         select(
@@ -109,7 +213,8 @@ async def get_meeting_heatmap_data(db: AsyncSession, user_id: str, year: int = N
         ).where(
             and_(
                 Meeting.user_id == user_id,
-                extract('year', Meeting.meeting_date) == year
+                Meeting.meeting_date >= year_start,
+                Meeting.meeting_date < year_end
             )
         ).group_by(Meeting.meeting_date)
         .order_by(Meeting.meeting_date)
@@ -121,11 +226,17 @@ async def get_meeting_heatmap_data(db: AsyncSession, user_id: str, year: int = N
     ]
 
 
-async def get_meeting_trends_data(db: AsyncSession, user_id: str, days: int = 7) -> List[Dict]:
-    """Get meeting trends data for the last N days"""
-    # Calculate date range
-    end_date = datetime.now().date()
-    start_date = end_date - timedelta(days=days-1)
+async def get_meeting_trends_data(
+    db: AsyncSession, 
+    user_id: str, 
+    days: int = 7, 
+    timezone: Optional[str] = None
+) -> List[Dict]:
+    """Get meeting trends data for the last N days, bucketed by day in the user's timezone"""
+    # Calculate date range: [start_date, end_date) in the user's local calendar
+    tz = get_timezone(timezone)
+    end_date = local_today(tz) + timedelta(days=1)
+    start_date = end_date - timedelta(days=days)
     
     # Get meeting data
     result = await db.execute(
@@ -136,7 +247,7 @@ async def get_meeting_trends_data(db: AsyncSession, user_id: str, days: int = 7)
             and_(
                 Meeting.user_id == user_id,
                 Meeting.meeting_date >= start_date,
-                Meeting.meeting_date <= end_date
+                Meeting.meeting_date < end_date
             )
         ).group_by(Meeting.meeting_date)
         .order_by(Meeting.meeting_date)
@@ -144,22 +255,22 @@ async def get_meeting_trends_data(db: AsyncSession, user_id: str, days: int = 7)
     
     meeting_data = {row.meeting_date: row.meeting_count for row in result.fetchall()}
     
-    # Get summary data
+    # Get summary data: range-scan creation times, then bucket into local days
+    start_utc, end_utc = local_dates_to_utc(start_date, end_date, tz)
     summary_result = await db.execute(
-        select(
-            func.date(Summary.created_at).label('summary_date'),
-            func.count(Summary.id).label('summary_count')
-        ).where(
+        select(Summary.created_at).where(
             and_(
                 Summary.user_id == user_id,
-                func.date(Summary.created_at) >= start_date,
-                func.date(Summary.created_at) <= end_date
+                Summary.created_at >= start_utc,
+                Summary.created_at < end_utc
             )
-        ).group_by(func.date(Summary.created_at))
-        .order_by(func.date(Summary.created_at))
+        )
     )
     
-    summary_data = {row.summary_date: row.summary_count for row in summary_result.fetchall()}
+    summary_data = {}
+    for created_at in summary_result.scalars():
+        summary_date = utc_to_local_date(created_at, tz)
+        summary_data[summary_date] = summary_data.get(summary_date, 0) + 1
     
     # Create trends data for each day
     trends = []
@@ -202,7 +313,7 @@ async def update_meeting(
         meeting.meeting_date = update_data.meeting_date
     
     await db.commit()
-    await db.refresh(meeting)
+    await dashboard_cache.invalidate_user(user_id)
     return meeting
 
 
@@ -222,10 +333,45 @@ async def update_meeting_vexa_id(
     meeting.started_at = datetime.utcnow()
     
     await db.commit()
-    await db.refresh(meeting)
+    await dashboard_cache.invalidate_user(user_id)
+    return meeting
+
+
+async def update_meeting_summary(
+    db: AsyncSession, 
+    meeting_id: str, 
+    user_id: str, 
+    summary: str
+) -> Optional[Meeting]:
+    """Save the AI-generated summary on a meeting"""
+    meeting = await get_meeting_by_id(db, meeting_id, user_id)
+    if not meeting:
+        return None
+    
+    meeting.summary = summary
+    meeting.summary_generated_at = datetime.utcnow()
+    await search_indexer.index_meeting_summary(db, meeting)
+    
+    await db.commit()
+    await dashboard_cache.invalidate_user(user_id)
     return meeting
 
 
+async def update_rolling_summary(
+    db: AsyncSession, 
+    meeting_id: str, 
+    rolling_summary: str, 
+    folded_until: datetime
+) -> None:
+    """Save a meeting's running notes and the transcript cursor they cover"""
+    await db.execute(
+        update(Meeting)
+        .where(Meeting.id == meeting_id)
+        .values(rolling_summary=rolling_summary, rolling_summary_until=folded_until)
+    )
+    await db.commit()
+
+
 async def end_meeting(
     db: AsyncSession, 
     meeting_id: str, 
@@ -244,18 +390,48 @@ async def end_meeting(
         meeting.user_notes = user_notes
     
     await db.commit()
-    await db.refresh(meeting)
+    await dashboard_cache.invalidate_user(user_id)
     return meeting
 
 
+async def get_active_meetings(db: AsyncSession) -> List[tuple]:
+    """Get (meeting_id, user_id) for every active meeting with a running bot"""
+    result = await db.execute(
+        select(Meeting.id, Meeting.user_id)
+        .where(
+            and_(
+                Meeting.status == "active",
+                Meeting.vexa_meeting_id.isnot(None)
+            )
+        )
+    )
+    return [(row.id, row.user_id) for row in result.all()]
+
+
 async def delete_meeting(db: AsyncSession, meeting_id: str, user_id: str) -> bool:
-    """Delete a meeting"""
-    meeting = await get_meeting_by_id(db, meeting_id, user_id)
-    if not meeting:
+    """
+    Delete a meeting with its transcripts, summaries, notes and derived rows
+    
+    Set-based DELETEs scoped to the owner, so neither the meeting nor its
+    children are loaded first.
+    """
+    owned_meeting = select(Meeting.id).where(
+        and_(Meeting.id == meeting_id, Meeting.user_id == user_id)
+    )
+    for model in (Transcript, TranscriptArchive, Tag, ActionItem, Summary, ComprehensiveNotes, SearchDocument):
+        await db.execute(
+            delete(model).where(model.meeting_id.in_(owned_meeting)),
+            execution_options={"synchronize_session": False}
+        )
+    result = await db.execute(
+        delete(Meeting).where(and_(Meeting.id == meeting_id, Meeting.user_id == user_id))
+    )
+    if result.rowcount == 0:
+        await db.rollback()
         return False
     
-    await db.delete(meeting)
     await db.commit()
+    await dashboard_cache.invalidate_user(user_id)
     return True
 
 
@@ -283,7 +459,12 @@ async def create_summary(db: AsyncSession, summary_data: SummaryCreate, user_id:
     )
     
     db.add(summary)
+    await db.flush()
+    await search_indexer.index_summary(db, summary)
+    add_item_tags(db, user_id, summary.meeting_id, summary.tags, summary_id=summary.id)
+    add_action_items(db, summary)
     await db.commit()
+    await dashboard_cache.invalidate_user(user_id)
     await db.refresh(summary)
     return summary
 
@@ -301,16 +482,21 @@ async def get_summary_by_id(db: AsyncSession, summary_id: str, user_id: str) ->
 async def get_summaries_by_user(
     db: AsyncSession, 
     user_id: str, 
-    skip: int = 0, 
-    limit: int = 20
+    limit: int = 20, 
+    after: Optional[Tuple[datetime, str]] = None
 ) -> List[Summary]:
-    """Get all summaries for a user with pagination"""
+    """
+    Get a user's summaries newest first, one keyset page at a time
+
+    Args:
+        after: (created_at, id) of the last summary on the previous page
+    """
+    query = select(Summary).where(Summary.user_id == user_id)
+    if after is not None:
+        query = query.where(tuple_(Summary.created_at, Summary.id) < tuple_(*after))
+    
     result = await db.execute(
-        select(Summary)
-        .where(Summary.user_id == user_id)
-        .order_by(desc(Summary.created_at))
-        .offset(skip)
-        .limit(limit)
+        query.order_by(desc(Summary.created_at), desc(Summary.id)).limit(limit)
     )
     return result.scalars().all()
 
@@ -333,56 +519,6 @@ async def count_summaries_by_user(db: AsyncSession, user_id: str) -> int:
     return result.scalar() or 0
 
 
-async def count_summaries_by_user_this_month(db: AsyncSession, user_id: str) -> int:
-    """Count summaries for a user in current month"""
-    current_month = datetime.now().month
-    current_year = datetime.now().year
-    
-    result = await db.execute(
-        select(func.count(Summary.id)).where(
-            and_(
-                Summary.user_id == user_id,
-                extract('month', Summary.created_at) == current_month,
-                extract('year', Summary.created_at) == current_year
-            )
-        )
-    )
-    return result.scalar() or 0
-
-
-async def count_action_items_by_user(db: AsyncSession, user_id: str) -> int:
-    """Count total action items (tasks) for a user"""
-    # This is a simplified count - in reality, you'd parse the JSON action_items
-    # For now, we'll count summaries that have action_items
-    result = await db.execute(
-        select(func.count(Summary.id)).where(
-            and_(
-                Summary.user_id == user_id,
-                Summary.action_items.isnot(None),
-                Summary.action_items != ""
-            )
-        )
-    )
-    return result.scalar() or 0
-
-
-async def get_avg_meeting_duration_by_user(db: AsyncSession, user_id: str) -> float:
-    """Get average meeting duration in minutes for a user"""
-    result = await db.execute(
-        select(func.avg(
-            func.extract('epoch', Meeting.ended_at) - func.extract('epoch', Meeting.started_at)
-        ) / 60).where(
-            and_(
-                Meeting.user_id == user_id,
-                Meeting.started_at.isnot(None),
-                Meeting.ended_at.isnot(None)
-            )
-        )
-    )
-    avg_duration = result.scalar()
-    return round(avg_duration or 0.0, 1)
-
-
 async def update_summary(
     db: AsyncSession, 
     summary_id: str, 
@@ -416,8 +552,15 @@ async def update_summary(
         summary.is_favorite = update_data.is_favorite
     
     summary.updated_at = datetime.utcnow()
+    if update_data.title is not None or update_data.content is not None:
+        await search_indexer.index_summary(db, summary)
+    if update_data.tags is not None:
+        await replace_item_tags(db, user_id, summary.meeting_id, summary.tags, summary_id=summary.id)
+    if update_data.action_items is not None:
+        await replace_action_items(db, summary)
     
     await db.commit()
+    await dashboard_cache.invalidate_user(user_id)
     await db.refresh(summary)
     return summary
 
@@ -428,8 +571,12 @@ async def delete_summary(db: AsyncSession, summary_id: str, user_id: str) -> boo
     if not summary:
         return False
     
+    await db.execute(delete(Tag).where(Tag.summary_id == summary_id))
+    await db.execute(delete(ActionItem).where(ActionItem.summary_id == summary_id))
     await db.delete(summary)
+    await search_indexer.remove_source(db, search_indexer.SUMMARY, summary_id)
     await db.commit()
+    await dashboard_cache.invalidate_user(user_id)
     return True
 
 
@@ -444,7 +591,9 @@ async def create_transcript(
         meeting_id=meeting_id,
         speaker=transcript_data.speaker,
         text=transcript_data.text,
-        timestamp=transcript_data.timestamp
+        timestamp=transcript_data.timestamp,
+        start_seconds=transcript_data.start_seconds,
+        end_seconds=transcript_data.end_seconds
     )
     
     db.add(transcript)
@@ -453,69 +602,340 @@ async def create_transcript(
     return transcript
 
 
+# Transcripts are read in meeting-time order: by segment start offset, with
+# created_at breaking ties (and ordering legacy rows stored without offsets).
+# Incremental reads use created_at cursors and are ordered by it instead.
+TIMELINE_ORDER = (Transcript.start_seconds, Transcript.created_at)
+
+
+def _timeline_key(transcript: Transcript):
+    return (transcript.start_seconds or 0.0, transcript.created_at)
+
+
+def _owned_transcripts(meeting_id: str, user_id: str, *criteria):
+    """
+    SELECT of a meeting's transcript rows and archive blob for its owner
+    
+    Both storage forms are outer-joined to the meeting, so the ownership check
+    and whichever form the meeting is in come back in one statement: one row
+    per matching live transcript, or a single row carrying the archive once
+    the meeting has been archived. `criteria` filter the transcript rows.
+    """
+    return (
+        select(Transcript, TranscriptArchive.data)
+        .select_from(Meeting)
+        .outerjoin(Transcript, and_(Transcript.meeting_id == Meeting.id, *criteria))
+        .outerjoin(TranscriptArchive, TranscriptArchive.meeting_id == Meeting.id)
+        .where(and_(Meeting.id == meeting_id, Meeting.user_id == user_id))
+    )
+
+
+def _collect_transcripts(
+    meeting_id: str, 
+    transcripts: List[Transcript], 
+    archive_data: Optional[bytes], 
+    keep: Optional[Callable[[Transcript], bool]] = None,
+    sort_key: Callable[[Transcript], tuple] = _timeline_key
+) -> List[Transcript]:
+    """
+    Archived segments (decoded only now that they are read) followed by any live rows
+    
+    Args:
+        keep: Python equivalent of the SQL criteria, applied to archived segments
+        sort_key: Order of the archived segments, matching the SQL ORDER BY
+    """
+    transcripts = [transcript for transcript in transcripts if transcript is not None]
+    if archive_data is None:
+        return transcripts
+    
+    archived = decode_transcripts(meeting_id, archive_data)
+    if keep is not None:
+        archived = [transcript for transcript in archived if keep(transcript)]
+    archived.sort(key=sort_key)
+    return archived + transcripts
+
+
+async def get_meeting_with_transcripts(
+    db: AsyncSession, 
+    meeting_id: str, 
+    user_id: str
+) -> Optional[Tuple[Meeting, List[Transcript]]]:
+    """
+    Get a meeting and its transcripts in one statement
+    
+    Returns:
+        (meeting, transcripts ordered by created_at), or None if the meeting
+        does not exist or belongs to another user
+    """
+    result = await db.execute(
+        select(Meeting, Transcript, TranscriptArchive.data)
+        .outerjoin(Transcript, Transcript.meeting_id == Meeting.id)
+        .outerjoin(TranscriptArchive, TranscriptArchive.meeting_id == Meeting.id)
+        .where(and_(Meeting.id == meeting_id, Meeting.user_id == user_id))
+        .order_by(*TIMELINE_ORDER)
+    )
+    rows = result.all()
+    if not rows:
+        return None
+    
+    meeting, _, archive_data = rows[0]
+    return meeting, _collect_transcripts(meeting_id, [row[1] for row in rows], archive_data)
+
+
 async def get_transcripts_by_meeting(
     db: AsyncSession, 
     meeting_id: str, 
     user_id: str
 ) -> List[Transcript]:
-    """Get all transcripts for a meeting"""
-    # First verify the meeting belongs to the user
-    meeting = await get_meeting_by_id(db, meeting_id, user_id)
-    if not meeting:
+    """Get all transcripts for a meeting, live or archived (empty if the user does not own it)"""
+    rows = (await db.execute(
+        _owned_transcripts(meeting_id, user_id).order_by(*TIMELINE_ORDER)
+    )).all()
+    if not rows:
         return []
     
-    result = await db.execute(
-        select(Transcript)
-        .where(Transcript.meeting_id == meeting_id)
+    return _collect_transcripts(meeting_id, [row[0] for row in rows], rows[0][1])
+
+
+async def get_transcripts_since(
+    db: AsyncSession, 
+    meeting_id: str, 
+    user_id: str, 
+    since: datetime
+) -> List[Transcript]:
+    """Get transcripts stored after the given cursor (used for incremental reads)"""
+    rows = (await db.execute(
+        _owned_transcripts(meeting_id, user_id, Transcript.created_at > since)
         .order_by(Transcript.created_at)
+    )).all()
+    if not rows:
+        return []
+    
+    return _collect_transcripts(
+        meeting_id, [row[0] for row in rows], rows[0][1],
+        keep=lambda transcript: transcript.created_at > since,
+        sort_key=lambda transcript: transcript.created_at
     )
-    return result.scalars().all()
 
 
-async def bulk_create_transcripts(
+async def get_transcripts_in_range(
     db: AsyncSession, 
     meeting_id: str, 
-    transcripts_data: List[TranscriptBase]
+    user_id: str, 
+    start_seconds: float, 
+    end_seconds: float
 ) -> List[Transcript]:
-    """Create multiple transcript entries at once"""
-    transcripts = []
+    """
+    Get the transcript segments starting within [start_seconds, end_seconds) of the meeting
+    
+    Served by a range scan on the (meeting_id, start_seconds) index. Segments
+    stored without offsets (before they were recorded) never match.
+    """
+    def in_range(transcript: Transcript) -> bool:
+        return (transcript.start_seconds is not None
+                and start_seconds <= transcript.start_seconds < end_seconds)
+    
+    rows = (await db.execute(
+        _owned_transcripts(
+            meeting_id, user_id,
+            Transcript.start_seconds >= start_seconds,
+            Transcript.start_seconds < end_seconds
+        ).order_by(*TIMELINE_ORDER)
+    )).all()
+    if not rows:
+        return []
+    
+    return _collect_transcripts(meeting_id, [row[0] for row in rows], rows[0][1], keep=in_range)
+
+
+async def get_transcript_segments_from(
+    db: AsyncSession, 
+    meeting_id: str, 
+    start_seconds: Optional[float] = None
+) -> List[Tuple[float, Optional[str], str]]:
+    """
+    Get the stored Vexa segments of a meeting starting at or after start_seconds
     
-    for transcript_data in transcripts_data:
-        transcript = Transcript(
+    Segments are keyed by their start offset; the sync reconciles them against
+    Vexa's list. Served by a range scan on the (meeting_id, start_seconds) index.
+    
+    Args:
+        start_seconds: Lower bound of the window, None for every segment with an offset
+        
+    Returns:
+        (start_seconds, speaker, text) of each stored row, duplicates included
+    """
+    criteria = [Transcript.meeting_id == meeting_id, Transcript.start_seconds.is_not(None)]
+    if start_seconds is not None:
+        criteria.append(Transcript.start_seconds >= start_seconds)
+    
+    result = await db.execute(
+        select(Transcript.start_seconds, Transcript.speaker, Transcript.text).where(and_(*criteria))
+    )
+    return [tuple(row) for row in result.all()]
+
+
+def _build_transcripts(meeting_id: str, transcripts_data: List[TranscriptBase]) -> List[Transcript]:
+    """
+    Build transcript rows with every column set client-side
+    
+    With the primary key and created_at already populated the ORM has nothing
+    to fetch back, so the whole batch is flushed as one executemany INSERT and
+    the returned objects are usable without a refresh. created_at is spaced by
+    a microsecond per row so the batch keeps its order when sorted by it.
+    """
+    created_at = datetime.utcnow()
+    return [
+        Transcript(
+            id=str(uuid.uuid4()),
             meeting_id=meeting_id,
             speaker=transcript_data.speaker,
             text=transcript_data.text,
-            timestamp=transcript_data.timestamp
+            timestamp=transcript_data.timestamp,
+            start_seconds=transcript_data.start_seconds,
+            end_seconds=transcript_data.end_seconds,
+            created_at=created_at + timedelta(microseconds=position)
+        )
+        for position, transcript_data in enumerate(transcripts_data)
+    ]
+
+
+async def append_transcripts(
+    db: AsyncSession, 
+    meeting_id: str, 
+    transcripts_data: List[TranscriptBase],
+    synced_until: Optional[float] = None,
+    replaced_segments: Optional[List[float]] = None
+) -> List[Transcript]:
+    """
+    Append new transcript segments and advance the meeting's sync high-water mark
+    
+    IDs and timestamps are generated client-side so the rows go out as a single
+    batched INSERT without a refresh per row. Stored segments whose start
+    offsets are listed in replaced_segments (revised or dropped by Vexa since
+    the last sync) are deleted first; revised ones are in transcripts_data.
+    """
+    if replaced_segments:
+        await db.execute(
+            delete(Transcript).where(
+                and_(
+                    Transcript.meeting_id == meeting_id,
+                    Transcript.start_seconds.in_(replaced_segments)
+                )
+            )
         )
-        transcripts.append(transcript)
     
+    transcripts = _build_transcripts(meeting_id, transcripts_data)
     db.add_all(transcripts)
-    await db.commit()
     
-    # Refresh all transcripts
-    for transcript in transcripts:
-        await db.refresh(transcript)
+    if synced_until is not None:
+        await db.execute(
+            update(Meeting)
+            .where(Meeting.id == meeting_id)
+            .values(transcript_synced_until=synced_until)
+        )
     
+    await db.commit()
+    return transcripts
+
+
+async def bulk_create_transcripts(
+    db: AsyncSession, 
+    meeting_id: str, 
+    transcripts_data: List[TranscriptBase]
+) -> List[Transcript]:
+    """Create multiple transcript entries at once (a single batched INSERT)"""
+    transcripts = _build_transcripts(meeting_id, transcripts_data)
+    db.add_all(transcripts)
+    await db.commit()
     return transcripts
 
 
 async def clear_meeting_transcripts(db: AsyncSession, meeting_id: str, user_id: str) -> bool:
-    """Clear all transcripts for a meeting"""
-    # First verify the meeting belongs to the user
+    """Clear all transcripts for a meeting with a single DELETE"""
+    # First verify the meeting belongs to the user (free when the caller already loaded it)
     meeting = await get_meeting_by_id(db, meeting_id, user_id)
     if not meeting:
         return False
     
+    await db.execute(
+        delete(Transcript).where(Transcript.meeting_id == meeting_id)
+    )
+    await db.commit()
+    return True
+
+
+async def archive_meeting_transcripts(
+    db: AsyncSession, 
+    meeting_id: str, 
+    user_id: str
+) -> Optional[TranscriptArchive]:
+    """
+    Move a finished meeting's transcript rows into its compressed archive
+    
+    Rows written after an earlier archive (e.g. by a retried finalize job) are
+    merged in, a re-sent segment replacing its archived version, so this is
+    safe to repeat.
+    
+    Returns:
+        The meeting's archive, or None if it has no transcripts
+    """
+    meeting = await get_meeting_by_id(db, meeting_id, user_id)
+    if not meeting:
+        return None
+    
     result = await db.execute(
-        select(Transcript).where(Transcript.meeting_id == meeting_id)
+        select(Transcript)
+        .where(Transcript.meeting_id == meeting_id)
+        .order_by(*TIMELINE_ORDER)
     )
     transcripts = result.scalars().all()
+    archive = await db.get(TranscriptArchive, meeting_id)
+    if not transcripts:
+        return archive
+    
+    def segment_key(transcript: Transcript):
+        return transcript.start_seconds if transcript.start_seconds is not None else transcript.timestamp
     
-    for transcript in transcripts:
-        await db.delete(transcript)
+    segments = list(transcripts)
+    if archive is not None:
+        resent = {segment_key(transcript) for transcript in transcripts} - {None}
+        segments = sorted([
+            archived for archived in decode_transcripts(meeting_id, archive.data)
+            if segment_key(archived) is None or segment_key(archived) not in resent
+        ] + segments, key=_timeline_key)
+    else:
+        archive = TranscriptArchive(meeting_id=meeting_id, created_at=datetime.utcnow())
+        db.add(archive)
     
+    archive.format_version = ARCHIVE_FORMAT_VERSION
+    archive.segment_count = len(segments)
+    archive.data = encode_transcripts(segments)
+    
+    await db.execute(
+        delete(Transcript).where(Transcript.meeting_id == meeting_id)
+    )
     await db.commit()
-    return True
+    return archive
+
+
+async def index_meeting_transcript(db: AsyncSession, meeting_id: str, user_id: str) -> int:
+    """
+    (Re)build the search documents of a finished meeting's transcript
+    
+    Returns:
+        Number of search documents written
+    """
+    meeting = await get_meeting_by_id(db, meeting_id, user_id)
+    if not meeting:
+        return 0
+    
+    transcripts = await get_transcripts_by_meeting(db, meeting_id, user_id)
+    count = await search_indexer.index_meeting_transcript(
+        db, meeting_id, user_id, transcripts, created_at=meeting.ended_at
+    )
+    await db.commit()
+    return count
 
 
 # Comprehensive Notes CRUD operations
@@ -533,6 +953,9 @@ async def create_comprehensive_notes(
     )
     
     db.add(notes)
+    await db.flush()
+    await search_indexer.index_notes(db, notes)
+    add_item_tags(db, user_id, meeting_id, notes.tags, notes_id=notes.id)
     await db.commit()
     await db.refresh(notes)
     return notes
@@ -588,6 +1011,9 @@ async def update_comprehensive_notes(
             setattr(notes, key, value)
     
     notes.updated_at = datetime.utcnow()
+    await search_indexer.index_notes(db, notes)
+    if "tags" in update_data:
+        await replace_item_tags(db, user_id, notes.meeting_id, notes.tags, notes_id=notes.id)
     
     await db.commit()
     await db.refresh(notes)
@@ -604,11 +1030,183 @@ async def delete_comprehensive_notes(
     if not notes:
         return False
     
+    await db.execute(delete(Tag).where(Tag.notes_id == notes_id))
     await db.delete(notes)
+    await search_indexer.remove_source(db, search_indexer.NOTES, notes_id)
     await db.commit()
     return True
 
 
+# Tag and action item CRUD operations
+def add_item_tags(
+    db: AsyncSession,
+    user_id: str,
+    meeting_id: str,
+    raw_tags: Optional[str],
+    summary_id: Optional[str] = None,
+    notes_id: Optional[str] = None
+) -> None:
+    """Add tag rows for a new summary or comprehensive notes (not committed)"""
+    db.add_all([
+        Tag(user_id=user_id, meeting_id=meeting_id, name=name, summary_id=summary_id, notes_id=notes_id)
+        for name in parse_tags(raw_tags)
+    ])
+
+
+async def replace_item_tags(
+    db: AsyncSession,
+    user_id: str,
+    meeting_id: str,
+    raw_tags: Optional[str],
+    summary_id: Optional[str] = None,
+    notes_id: Optional[str] = None
+) -> None:
+    """Rewrite the tag rows of a summary or comprehensive notes after its tags changed (not committed)"""
+    if summary_id is not None:
+        await db.execute(delete(Tag).where(Tag.summary_id == summary_id))
+    else:
+        await db.execute(delete(Tag).where(Tag.notes_id == notes_id))
+    add_item_tags(db, user_id, meeting_id, raw_tags, summary_id=summary_id, notes_id=notes_id)
+
+
+def add_action_items(
+    db: AsyncSession,
+    summary: Summary,
+    progress: Optional[Dict[str, Tuple[str, Optional[datetime]]]] = None
+) -> None:
+    """
+    Add action item rows parsed from a summary's action_items JSON (not committed)
+    
+    Args:
+        progress: (status, completed_at) of earlier rows by lower-cased task name
+    """
+    progress = progress or {}
+    items = []
+    for position, task in enumerate(parse_action_items(summary.action_items)):
+        status, completed_at = progress.get(task["task_name"].lower(), ("open", None))
+        items.append(ActionItem(
+            user_id=summary.user_id,
+            meeting_id=summary.meeting_id,
+            summary_id=summary.id,
+            position=position,
+            status=status,
+            completed_at=completed_at,
+            **task
+        ))
+    db.add_all(items)
+
+
+async def replace_action_items(db: AsyncSession, summary: Summary) -> None:
+    """Rewrite a summary's action item rows after its action_items changed, keeping task progress (not committed)"""
+    result = await db.execute(
+        select(ActionItem.task_name, ActionItem.status, ActionItem.completed_at).where(
+            ActionItem.summary_id == summary.id
+        )
+    )
+    progress = {task_name.lower(): (status, completed_at) for task_name, status, completed_at in result.all()}
+    
+    await db.execute(delete(ActionItem).where(ActionItem.summary_id == summary.id))
+    add_action_items(db, summary, progress)
+
+
+async def get_action_items(
+    db: AsyncSession,
+    user_id: str,
+    status: Optional[str] = None,
+    assignee: Optional[str] = None,
+    meeting_id: Optional[str] = None,
+    limit: int = 100
+) -> List[ActionItem]:
+    """Get a user's action items, soonest deadline first (undated last)"""
+    query = select(ActionItem).where(ActionItem.user_id == user_id)
+    if status is not None:
+        query = query.where(ActionItem.status == status)
+    if assignee is not None:
+        query = query.where(ActionItem.assignee == assignee)
+    if meeting_id is not None:
+        query = query.where(ActionItem.meeting_id == meeting_id)
+    
+    result = await db.execute(
+        query.order_by(
+            ActionItem.deadline.is_(None), ActionItem.deadline, ActionItem.created_at, ActionItem.position
+        ).limit(limit)
+    )
+    return result.scalars().all()
+
+
+async def update_action_item_status(
+    db: AsyncSession,
+    item_id: str,
+    user_id: str,
+    status: str
+) -> Optional[ActionItem]:
+    """Mark an action item open or done"""
+    result = await db.execute(
+        select(ActionItem).where(and_(ActionItem.id == item_id, ActionItem.user_id == user_id))
+    )
+    item = result.scalar_one_or_none()
+    if not item:
+        return None
+    
+    if item.status != status:
+        item.status = status
+        item.completed_at = datetime.utcnow() if status == "done" else None
+        await db.commit()
+        await dashboard_cache.invalidate_user(user_id)
+    return item
+
+
+async def get_action_item_stats(db: AsyncSession, user_id: str, timezone: Optional[str] = None) -> Dict:
+    """
+    Count a user's action items by status, overdue and per assignee
+    
+    Both queries are aggregates over the (user_id, ...) indexes; no summary
+    JSON is parsed. Overdue means open with a deadline before today in the
+    user's timezone.
+    """
+    result = await db.execute(
+        select(ActionItem.assignee, ActionItem.status, func.count())
+        .where(ActionItem.user_id == user_id)
+        .group_by(ActionItem.assignee, ActionItem.status)
+    )
+    
+    totals = {"open": 0, "done": 0}
+    by_assignee: Dict[Optional[str], Dict] = {}
+    for assignee, status, count in result.all():
+        totals[status] = totals.get(status, 0) + count
+        entry = by_assignee.setdefault(assignee, {"assignee": assignee, "open": 0, "done": 0})
+        entry[status] = entry.get(status, 0) + count
+    
+    overdue = await db.execute(
+        select(func.count()).select_from(ActionItem).where(
+            and_(
+                ActionItem.user_id == user_id,
+                ActionItem.status == "open",
+                ActionItem.deadline < local_today(get_timezone(timezone))
+            )
+        )
+    )
+    
+    return {
+        "open": totals["open"],
+        "done": totals["done"],
+        "overdue": overdue.scalar() or 0,
+        "by_assignee": sorted(by_assignee.values(), key=lambda entry: (-entry["open"], entry["assignee"] or "")),
+    }
+
+
+async def get_tag_counts(db: AsyncSession, user_id: str, limit: int = 100) -> List[Dict]:
+    """Get a user's tags with the number of summaries and notes carrying each, most used first"""
+    result = await db.execute(
+        select(Tag.name, func.count().label("count"))
+        .where(Tag.user_id == user_id)
+        .group_by(Tag.name)
+        .order_by(desc("count"), Tag.name)
+        .limit(limit)
+    )
+    return [{"name": name, "count": count} for name, count in result.all()]
+
+
 # Global Statistics CRUD operations
 async def get_total_users_count(db: AsyncSession) -> int:
     """Get total count of all users in the system"""
@@ -628,3 +1226,78 @@ async def get_total_processed_meetings_count(db: AsyncSession) -> int:
         select(func.count(Meeting.id)).where(Meeting.status == "ended")
     )
     return result.scalar() or 0 
+
+
+
+# LLM cache CRUD operations
+async def get_llm_cache_entry(db: AsyncSession, key: str) -> Optional[LLMCacheEntry]:
+    """Get an unexpired cache entry and record the hit"""
+    now = datetime.utcnow()
+    result = await db.execute(
+        select(LLMCacheEntry).where(
+            and_(
+                LLMCacheEntry.key == key,
+                LLMCacheEntry.expires_at > now
+            )
+        )
+    )
+    entry = result.scalar_one_or_none()
+    if entry is None:
+        return None
+    
+    await db.execute(
+        update(LLMCacheEntry)
+        .where(LLMCacheEntry.key == key)
+        .values(hit_count=LLMCacheEntry.hit_count + 1, last_accessed_at=now)
+    )
+    await db.commit()
+    return entry
+
+
+async def save_llm_cache_entry(
+    db: AsyncSession, 
+    key: str, 
+    model: str, 
+    response: str, 
+    ttl: timedelta
+) -> LLMCacheEntry:
+    """Insert or replace a cache entry"""
+    now = datetime.utcnow()
+    entry = await db.merge(LLMCacheEntry(
+        key=key,
+        model=model,
+        response=response,
+        size_bytes=len(response.encode("utf-8")),
+        hit_count=0,
+        created_at=now,
+        last_accessed_at=now,
+        expires_at=now + ttl
+    ))
+    await db.commit()
+    return entry
+
+
+async def prune_llm_cache(db: AsyncSession, max_bytes: int) -> int:
+    """Delete expired entries, then least recently used ones until the cache fits in max_bytes"""
+    result = await db.execute(
+        delete(LLMCacheEntry).where(LLMCacheEntry.expires_at <= datetime.utcnow())
+    )
+    deleted = result.rowcount or 0
+    
+    result = await db.execute(
+        select(LLMCacheEntry.key, LLMCacheEntry.size_bytes)
+        .order_by(desc(LLMCacheEntry.last_accessed_at))
+    )
+    total_bytes = 0
+    evicted_keys = []
+    for key, size_bytes in result.all():
+        total_bytes += size_bytes
+        if total_bytes > max_bytes:
+            evicted_keys.append(key)
+    
+    if evicted_keys:
+        await db.execute(delete(LLMCacheEntry).where(LLMCacheEntry.key.in_(evicted_keys)))
+        deleted += len(evicted_keys)
+    
+    await db.commit()
+    return deleted
\ No newline at end of file
@@ -0,0 +1,98 @@
+import logging
+import json
+from datetime import date
+from typing import Any, Awaitable, Callable, Optional
+
+from fastapi.encoders import jsonable_encoder
+
+from cache import CacheBackend, create_cache_backend
+from settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class DashboardCache:
+    """
+    Read-through cache for per-user dashboard aggregates
+
+    Entries are keyed by user, endpoint and parameters. Each user also has a
+    generation counter that is part of every key; crud write functions bump it
+    after committing a meeting or summary change, which orphans all of the
+    user's cached entries at once (they age out via TTL/LRU). A read that
+    races with a write stores its result under the old generation, so it is
+    never served. The current date is part of every key, so "this month" and
+    trend windows roll over on their own.
+
+    Values are stored as JSON, so hits return plain dicts and lists. Cache
+    failures never fail the request.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None):
+        self.enabled = settings.DASHBOARD_CACHE_ENABLED
+        self.ttl_seconds = settings.DASHBOARD_CACHE_TTL_SECONDS
+        self.backend = backend or create_cache_backend()
+
+    @staticmethod
+    def _generation_key(user_id: str) -> str:
+        return f"dashboard:{user_id}:generation"
+
+    async def get_or_compute(
+        self,
+        user_id: str,
+        endpoint: str,
+        params: dict,
+        compute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Return the cached value for (user, endpoint, params), computing and storing it on a miss
+
+        Args:
+            user_id: Owner of the data
+            endpoint: Cached endpoint name (overview, stats, heatmap, trends)
+            params: Endpoint parameters that change the result
+            compute: Coroutine factory producing the fresh value
+
+        Returns:
+            JSON-compatible value
+        """
+        if not self.enabled:
+            return jsonable_encoder(await compute())
+
+        key = None
+        try:
+            generation = await self.backend.get(self._generation_key(user_id)) or "0"
+            key_params = json.dumps({**params, "today": date.today().isoformat()}, sort_keys=True, default=str)
+            key = f"dashboard:{user_id}:{generation}:{endpoint}:{key_params}"
+
+            cached = await self.backend.get(key)
+            if cached is not None:
+                return json.loads(cached)
+        except Exception as e:
+            logger.warning(f"⚠️ Dashboard cache read failed: {str(e)}")
+
+        value = jsonable_encoder(await compute())
+
+        if key is not None:
+            try:
+                await self.backend.set(key, json.dumps(value), self.ttl_seconds)
+            except Exception as e:
+                logger.warning(f"⚠️ Dashboard cache write failed: {str(e)}")
+
+        return value
+
+    async def invalidate_user(self, user_id: str) -> None:
+        """Drop every cached dashboard entry of a user; called after meeting/summary writes"""
+        if not self.enabled:
+            return
+        try:
+            await self.backend.incr(self._generation_key(user_id))
+        except Exception as e:
+            logger.warning(f"⚠️ Dashboard cache invalidation failed: {str(e)}")
+
+    async def close(self) -> None:
+        """Release the backend connection; called from the application lifespan"""
+        await self.backend.close()
+
+
+# Global cache instance
+dashboard_cache = DashboardCache()
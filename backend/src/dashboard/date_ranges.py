@@ -0,0 +1,58 @@
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+# Date filters are half-open ranges [start, end) on the raw column, so they
+# stay sargable: `created_at >= start AND created_at < end` can use the
+# (user_id, created_at) index, while extract()/date() on the column cannot.
+# Naive DateTime columns (created_at, started_at, ...) hold UTC; Date
+# columns (meeting_date) are calendar dates chosen by the user.
+
+
+def get_timezone(name: Optional[str]) -> ZoneInfo:
+    """Resolve a user's IANA timezone name, falling back to UTC for unknown values"""
+    try:
+        return ZoneInfo(name or "UTC")
+    except (ZoneInfoNotFoundError, ValueError):
+        return ZoneInfo("UTC")
+
+
+def local_today(tz: ZoneInfo) -> date:
+    """Current calendar date in the user's timezone"""
+    return datetime.now(tz).date()
+
+
+def month_range(day: date) -> Tuple[date, date]:
+    """First day of the month containing `day` and first day of the next month"""
+    start = day.replace(day=1)
+    end = (start + timedelta(days=32)).replace(day=1)
+    return start, end
+
+
+def year_range(year: int) -> Tuple[date, date]:
+    """January 1st of `year` and of the following year"""
+    return date(year, 1, 1), date(year + 1, 1, 1)
+
+
+def local_dates_to_utc(start: date, end: date, tz: ZoneInfo) -> Tuple[datetime, datetime]:
+    """
+    Convert a half-open range of local calendar dates to naive UTC datetimes
+
+    Args:
+        start: First local date included
+        end: First local date excluded
+        tz: User's timezone
+
+    Returns:
+        (start, end) bounds for comparing against naive UTC DateTime columns
+    """
+    def to_utc(day: date) -> datetime:
+        local_midnight = datetime(day.year, day.month, day.day, tzinfo=tz)
+        return local_midnight.astimezone(timezone.utc).replace(tzinfo=None)
+
+    return to_utc(start), to_utc(end)
+
+
+def utc_to_local_date(value: datetime, tz: ZoneInfo) -> date:
+    """Calendar date in the user's timezone of a naive UTC datetime"""
+    return value.replace(tzinfo=timezone.utc).astimezone(tz).date()
@@ -0,0 +1,79 @@
+import logging
+import asyncio
+import json
+from typing import Any, AsyncIterator, Callable, Set, Tuple
+
+from fastapi import Request
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import AsyncSessionLocal
+from .transcript_stream import SSE_HEARTBEAT_SECONDS
+
+logger = logging.getLogger(__name__)
+
+# Generations whose client disconnected, kept referenced until they finish and save
+_detached_generations: Set[asyncio.Task] = set()
+
+
+def format_generation_event(event: str, data: Any) -> str:
+    """Format a generation event as a Server-Sent Events message"""
+    if isinstance(data, BaseModel):
+        data = data.model_dump(mode="json")
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+async def stream_generation(
+    request: Request,
+    generate: Callable[[AsyncSession], AsyncIterator[Tuple[str, Any]]]
+) -> AsyncIterator[str]:
+    """
+    Relay a streaming AI generation to the client as Server-Sent Events
+
+    The generation runs in its own task with its own database session, so a
+    `start` event goes out before the model is even called and keep-alive
+    comments flow while it is thinking. If the client disconnects, the
+    generation still runs to completion and saves its result.
+
+    Args:
+        request: Incoming request, checked for disconnects while idle
+        generate: Called with a database session; yields (event, data) tuples
+
+    Yields:
+        SSE messages: `start`, the generation's own events, or `error` if it fails
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def produce():
+        try:
+            async with AsyncSessionLocal() as db:
+                async for event in generate(db):
+                    queue.put_nowait(event)
+        except Exception as e:
+            logger.error(f"❌ Streaming generation failed: {str(e)}")
+            queue.put_nowait(("error", {"detail": str(e)}))
+        finally:
+            queue.put_nowait(None)
+
+    producer = asyncio.create_task(produce())
+    try:
+        yield format_generation_event("start", {})
+
+        while True:
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout=SSE_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    break
+                yield ": keep-alive\n\n"
+                continue
+
+            if item is None:
+                break
+
+            yield format_generation_event(*item)
+    finally:
+        if not producer.done():
+            logger.info("🔌 Client disconnected, finishing generation in the background")
+            _detached_generations.add(producer)
+            producer.add_done_callback(_detached_generations.discard)
@@ -0,0 +1,43 @@
+from typing import Optional
+
+from database import AsyncSessionLocal
+from jobs.queue import job_queue
+from .schemas import ComprehensiveNotesRequest
+from .service import dashboard_service
+from .comprehensive_notes_service import comprehensive_notes_service
+
+
+@job_queue.handler("finalize_meeting")
+async def finalize_meeting(user_id: str, payload: dict) -> Optional[dict]:
+    """Stop the bot, sync final transcripts and generate the summary of an ended meeting"""
+    async with AsyncSessionLocal() as db:
+        await dashboard_service.finalize_meeting(db, payload["meeting_id"], user_id, payload.get("stop_bot", False))
+    return {"meeting_id": payload["meeting_id"]}
+
+
+async def _queue_embedding(user_id: str, meeting_id: str) -> None:
+    """Embed newly written notes or summaries of a meeting for semantic search"""
+    await job_queue.enqueue(user_id, "embed_meeting", {"meeting_id": meeting_id})
+
+
+@job_queue.handler("comprehensive_notes")
+async def generate_comprehensive_notes(user_id: str, payload: dict) -> Optional[dict]:
+    """Generate comprehensive notes; the result is the ComprehensiveNotesResponse"""
+    request = ComprehensiveNotesRequest(**payload["request"])
+    async with AsyncSessionLocal() as db:
+        notes = await comprehensive_notes_service.generate_comprehensive_notes(
+            db, payload["meeting_id"], user_id, request
+        )
+    await _queue_embedding(user_id, payload["meeting_id"])
+    return notes.model_dump(mode="json")
+
+
+@job_queue.handler("structured_notes")
+async def generate_structured_notes(user_id: str, payload: dict) -> Optional[dict]:
+    """Generate structured notes and save them as a summary; the result is the SummaryResponse"""
+    async with AsyncSessionLocal() as db:
+        summary = await comprehensive_notes_service.create_structured_notes_summary(
+            db, payload["meeting_id"], user_id, payload.get("request")
+        )
+    await _queue_embedding(user_id, payload["meeting_id"])
+    return summary.model_dump(mode="json")
@@ -0,0 +1,111 @@
+import logging
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from database import AsyncSessionLocal
+from settings import settings
+from . import crud
+
+logger = logging.getLogger(__name__)
+
+
+class LLMCache:
+    """
+    Content-addressed cache for OpenAI completions
+
+    Entries are keyed by a SHA-256 of the model, prompt messages and sampling
+    parameters, so any change to the prompt template, transcript, user notes
+    or custom prompt produces a new key and stale results are never served.
+    Results are stored in the `llm_cache` table with a TTL and a total size
+    limit; a small in-process LRU tier in front of it saves the DB round-trip
+    for hot entries. Cache failures never fail the generation.
+    """
+
+    PRUNE_EVERY_WRITES = 100
+
+    def __init__(self):
+        self.enabled = settings.LLM_CACHE_ENABLED
+        self.ttl = timedelta(hours=settings.LLM_CACHE_TTL_HOURS)
+        self.max_bytes = settings.LLM_CACHE_MAX_MB * 1024 * 1024
+        self.memory_entries = settings.LLM_CACHE_MEMORY_ENTRIES
+        self._memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._writes = 0
+
+    @staticmethod
+    def make_key(request: Dict[str, Any]) -> str:
+        """Hash a completion request (model, messages and parameters) into a cache key"""
+        canonical = json.dumps(request, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _memory_get(self, key: str) -> Optional[str]:
+        item = self._memory.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at <= time.time():
+            del self._memory[key]
+            return None
+        self._memory.move_to_end(key)
+        return value
+
+    def _memory_set(self, key: str, value: str, expires_at: float) -> None:
+        if self.memory_entries <= 0:
+            return
+        self._memory[key] = (expires_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached completion for a key, or None on a miss"""
+        if not self.enabled:
+            return None
+
+        value = self._memory_get(key)
+        if value is not None:
+            return value
+
+        try:
+            async with AsyncSessionLocal() as db:
+                entry = await crud.get_llm_cache_entry(db, key)
+        except Exception as e:
+            logger.warning(f"⚠️ LLM cache read failed: {str(e)}")
+            return None
+
+        if entry is None:
+            return None
+
+        remaining = (entry.expires_at - datetime.utcnow()).total_seconds()
+        self._memory_set(key, entry.response, time.time() + remaining)
+        return entry.response
+
+    async def set(self, key: str, model: str, value: str) -> None:
+        """Store a completion under a key"""
+        if not self.enabled:
+            return
+
+        self._memory_set(key, value, time.time() + self.ttl.total_seconds())
+
+        try:
+            async with AsyncSessionLocal() as db:
+                await crud.save_llm_cache_entry(db, key, model, value, self.ttl)
+
+                self._writes += 1
+                if self._writes % self.PRUNE_EVERY_WRITES == 0:
+                    deleted = await crud.prune_llm_cache(db, self.max_bytes)
+                    if deleted:
+                        logger.info(f"🧹 Evicted {deleted} LLM cache entries")
+        except Exception as e:
+            logger.warning(f"⚠️ LLM cache write failed: {str(e)}")
+
+    def clear_memory(self) -> None:
+        """Drop the in-process tier (the DB tier is untouched)"""
+        self._memory.clear()
+
+
+# Global cache instance
+llm_cache = LLMCache()
@@ -1,7 +1,8 @@
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Boolean, Integer, Date
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Boolean, Integer, Date, Float, Index, LargeBinary
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from database import Base
+from datetime import datetime
 import uuid
 
 
@@ -29,11 +30,18 @@ class Meeting(Base):
     # User notes
     user_notes = Column(Text, nullable=True)
     
+    # Transcript sync high-water mark (start offset in seconds of the newest stored Vexa segment)
+    transcript_synced_until = Column(Float, nullable=True)
+    
+    # Rolling summary maintained while the meeting is live
+    rolling_summary = Column(Text, nullable=True)  # Running notes folded from transcript deltas
+    rolling_summary_until = Column(DateTime, nullable=True)  # created_at of the newest transcript folded in
+    
     # Meeting date for heatmap analysis
     meeting_date = Column(Date, nullable=False)
     
     # Timestamps
-    created_at = Column(DateTime, default=func.now())
+    created_at = Column(DateTime, default=datetime.utcnow)  # Client-side so SQLite keeps microseconds; keyset cursor column
     started_at = Column(DateTime, nullable=True)
     ended_at = Column(DateTime, nullable=True)
     
@@ -42,6 +50,16 @@ class Meeting(Base):
     transcripts = relationship("Transcript", back_populates="meeting", cascade="all, delete-orphan")
     comprehensive_notes = relationship("ComprehensiveNotes", back_populates="meeting", cascade="all, delete-orphan")
     summaries = relationship("Summary", back_populates="meeting", cascade="all, delete-orphan")
+    transcript_archive = relationship("TranscriptArchive", back_populates="meeting", uselist=False, cascade="all, delete-orphan")
+    
+    __table_args__ = (
+        # Meeting list (newest first, keyset on created_at/id) and per-user counts
+        Index("ix_meetings_user_id_created_at", "user_id", created_at.desc(), id.desc()),
+        # Heatmap and trends by meeting date
+        Index("ix_meetings_user_id_meeting_date", "user_id", "meeting_date"),
+        # Active meeting scan for transcript ingestion
+        Index("ix_meetings_status", "status"),
+    )
 
 
 class Summary(Base):
@@ -70,12 +88,19 @@ class Summary(Base):
     reading_time_minutes = Column(Integer, default=0)
     
     # Timestamps
-    created_at = Column(DateTime, default=func.now())
+    created_at = Column(DateTime, default=datetime.utcnow)  # Client-side so SQLite keeps microseconds; keyset cursor column
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
     
     # Relationships
     meeting = relationship("Meeting", back_populates="summaries")
     user = relationship("User")
+    
+    __table_args__ = (
+        # Summary list (newest first, keyset on created_at/id) and per-user counts
+        Index("ix_summaries_user_id_created_at", "user_id", created_at.desc(), id.desc()),
+        # Summaries of a meeting
+        Index("ix_summaries_meeting_id_created_at", "meeting_id", "created_at"),
+    )
 
 
 class Transcript(Base):
@@ -90,11 +115,40 @@ class Transcript(Base):
     text = Column(Text, nullable=False)
     timestamp = Column(String, nullable=True)  # Time within the meeting (e.g., "00:01:15")
     
+    # Segment timing in seconds from the start of the recording (Vexa start/end)
+    start_seconds = Column(Float, nullable=True)
+    end_seconds = Column(Float, nullable=True)
+    
     # Metadata
     created_at = Column(DateTime, default=func.now())
     
     # Relationships
     meeting = relationship("Meeting", back_populates="transcripts")
+    
+    __table_args__ = (
+        # Deltas stored since a created_at cursor
+        Index("ix_transcripts_meeting_id_created_at", "meeting_id", "created_at"),
+        # Transcript of a meeting in meeting-time order, time ranges and segment lookup during sync
+        Index("ix_transcripts_meeting_id_start_seconds", "meeting_id", "start_seconds"),
+    )
+
+
+class TranscriptArchive(Base):
+    """Compressed columnar transcript of an ended meeting, replacing its transcripts rows"""
+    __tablename__ = "transcript_archives"
+    
+    meeting_id = Column(String, ForeignKey("meetings.id"), primary_key=True)
+    
+    # Archive payload (see transcript_archive.py for the format)
+    format_version = Column(Integer, nullable=False)
+    segment_count = Column(Integer, nullable=False)
+    data = Column(LargeBinary, nullable=False)  # zlib-compressed columnar JSON
+    
+    # Timestamps
+    created_at = Column(DateTime, default=func.now())
+    
+    # Relationships
+    meeting = relationship("Meeting", back_populates="transcript_archive")
 
 
 class ComprehensiveNotes(Base):
@@ -129,4 +183,98 @@ class ComprehensiveNotes(Base):
     
     # Relationships
     meeting = relationship("Meeting", back_populates="comprehensive_notes")
-    user = relationship("User") 
\ No newline at end of file
+    user = relationship("User")
+    
+    __table_args__ = (
+        # Latest notes of a meeting for its owner
+        Index("ix_comprehensive_notes_meeting_id_user_id", "meeting_id", "user_id", "created_at"),
+    )
+
+
+class Tag(Base):
+    """
+    One tag on a summary or comprehensive notes
+    
+    Derived from the item's comma-separated `tags` column and rewritten by
+    crud whenever that changes; tag filters and tag counts read this table.
+    """
+    __tablename__ = "tags"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(String, ForeignKey("users.id"), nullable=False)
+    meeting_id = Column(String, ForeignKey("meetings.id"), nullable=False)
+    
+    name = Column(String(50), nullable=False)  # Trimmed and lower-cased
+    
+    # Tagged item (exactly one is set)
+    summary_id = Column(String, ForeignKey("summaries.id"), nullable=True)
+    notes_id = Column(String, ForeignKey("comprehensive_notes.id"), nullable=True)
+    
+    __table_args__ = (
+        # Items with a tag, and a user's tag counts
+        Index("ix_tags_user_id_name", "user_id", "name"),
+        # Rewriting an item's tags
+        Index("ix_tags_summary_id", "summary_id"),
+        Index("ix_tags_notes_id", "notes_id"),
+        # Removing a meeting's tags
+        Index("ix_tags_meeting_id", "meeting_id"),
+    )
+
+
+class ActionItem(Base):
+    """
+    One action item of a summary
+    
+    Derived from the summary's `action_items` JSON and rewritten by crud
+    whenever that changes; a task keeps its status across rewrites as long
+    as its name is unchanged.
+    """
+    __tablename__ = "action_items"
+    
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    user_id = Column(String, ForeignKey("users.id"), nullable=False)
+    meeting_id = Column(String, ForeignKey("meetings.id"), nullable=False)
+    summary_id = Column(String, ForeignKey("summaries.id"), nullable=False)
+    position = Column(Integer, nullable=False, default=0)  # Order within the summary
+    
+    # Task details
+    task_name = Column(String(255), nullable=False)
+    description = Column(Text, nullable=True)
+    assignee = Column(String(100), nullable=True)  # None when unassigned (TBD)
+    deadline = Column(Date, nullable=True)
+    
+    # Progress
+    status = Column(String(20), nullable=False, default="open")  # open, done
+    completed_at = Column(DateTime, nullable=True)
+    
+    # Timestamps
+    created_at = Column(DateTime, default=func.now())
+    
+    __table_args__ = (
+        # Task lists and open/done/overdue counts
+        Index("ix_action_items_user_id_status_deadline", "user_id", "status", "deadline"),
+        # Per-assignee lists and counts
+        Index("ix_action_items_user_id_assignee_status", "user_id", "assignee", "status"),
+        # Rewriting a summary's action items
+        Index("ix_action_items_summary_id", "summary_id"),
+        # Removing a meeting's action items
+        Index("ix_action_items_meeting_id", "meeting_id"),
+    )
+
+
+class LLMCacheEntry(Base):
+    """Content-addressed cache of OpenAI completions, keyed by a hash of the full request"""
+    __tablename__ = "llm_cache"
+    
+    key = Column(String(64), primary_key=True)  # SHA-256 of model, prompt messages and parameters
+    model = Column(String(50), nullable=False)
+    
+    # Cached completion (message text, or JSON for structured outputs)
+    response = Column(Text, nullable=False)
+    size_bytes = Column(Integer, nullable=False)
+    hit_count = Column(Integer, default=0)
+    
+    # Timestamps
+    created_at = Column(DateTime, default=func.now())
+    last_accessed_at = Column(DateTime, default=func.now(), index=True)
+    expires_at = Column(DateTime, nullable=False, index=True)
\ No newline at end of file
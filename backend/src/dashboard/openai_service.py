@@ -1,18 +1,51 @@
+import logging
+import asyncio
 import openai
-from typing import Dict, List, Optional
-from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from datetime import date, timedelta
 from settings import settings
+from .llm_cache import llm_cache
+from .transcript_chunking import count_tokens, chunk_transcript, group_sections
 from .schemas import OpenAISummaryRequest, OpenAISummaryResponse, TranscriptHighlight
 from .structured_notes_models import (
     StructuredNotesResponse, 
-    StructuredNotesContent
+    StructuredNotesContent,
+    TaskItem,
+    KeyUpdate,
+    BrainstormingIdea
 )
 import json
 
+logger = logging.getLogger(__name__)
+
 
 class OpenAIService:
     """Service for interacting with OpenAI API for meeting summarization"""
     
+    # Per-call timeouts in seconds (covering client retries)
+    TITLE_TIMEOUT = 20.0
+    HIGHLIGHTS_TIMEOUT = 45.0
+    SUMMARY_TIMEOUT = 90.0
+    NOTES_TIMEOUT = 120.0
+    ROLLING_TIMEOUT = 60.0
+    EMBEDDING_TIMEOUT = 30.0
+    
+    # Transcript token budgets per prompt; longer transcripts are condensed with map-reduce
+    SUMMARY_INPUT_TOKENS = 24000
+    NOTES_INPUT_TOKENS = 16000
+    HIGHLIGHTS_INPUT_TOKENS = 12000
+    TITLE_INPUT_TOKENS = 4000
+    ROLLING_INPUT_TOKENS = 8000
+    ROLLING_OUTPUT_TOKENS = 2000
+    
+    # Map-reduce settings
+    MAP_MODEL = "gpt-4o-mini"
+    MAP_CHUNK_TOKENS = 6000
+    MAP_OUTPUT_TOKENS = 1200
+    MAP_CONCURRENCY = 4  # Chunks condensed in parallel per transcript
+    
+    DEADLINE_WINDOW_DAYS = 30  # Structured notes suggest deadlines up to this long after the meeting
+    
     def __init__(self):
         self.api_key = settings.OPENAI_API_KEY
         self.is_available = False
@@ -25,22 +58,253 @@ class OpenAIService:
             )
         
         try:
-            # Configure OpenAI client
-            openai.api_key = self.api_key
-            self.client = openai.OpenAI(api_key=self.api_key)
+            # Configure async OpenAI client so LLM calls don't block the event loop
+            self.client = openai.AsyncOpenAI(
+                api_key=self.api_key,
+                max_retries=settings.OPENAI_MAX_RETRIES
+            )
+            # Bound in-flight requests so a burst of generations can't exhaust rate limits
+            self._semaphore = asyncio.Semaphore(settings.OPENAI_MAX_CONCURRENT_REQUESTS)
             self.is_available = True
-            print("✅ OpenAI service initialized successfully with GPT-4o")
+            logger.info("✅ OpenAI service initialized successfully with GPT-4o")
         except Exception as e:
             raise Exception(f"Failed to initialize OpenAI service: {str(e)}")
     
     def _check_availability(self):
         """Check if OpenAI service is available"""
         if not self.is_available:
-            print("❌ DEBUG: OpenAI service is not available")
-            print(f"   API Key present: {bool(self.api_key)}")
-            print(f"   Client initialized: {self.client is not None}")
+            logger.error("❌ DEBUG: OpenAI service is not available")
+            logger.error(f"   API Key present: {bool(self.api_key)}")
+            logger.error(f"   Client initialized: {self.client is not None}")
             raise Exception("OpenAI service is not available. API key not configured.")
     
+    async def _create_chat_completion(self, timeout: float, **kwargs) -> str:
+        """
+        Run a chat completion under the concurrency limit, consulting the LLM cache first
+        
+        Args:
+            timeout: Seconds allowed for the call once a slot is acquired
+            **kwargs: Arguments for chat.completions.create
+            
+        Returns:
+            Message content of the first choice
+            
+        Raises:
+            Exception: If the call exceeds the timeout (the request is cancelled)
+        """
+        cache_key = llm_cache.make_key(kwargs)
+        cached = await llm_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"♻️ LLM cache hit ({kwargs.get('model')})")
+            return cached
+        
+        async with self._semaphore:
+            try:
+                response = await asyncio.wait_for(
+                    self.client.chat.completions.create(timeout=timeout, **kwargs),
+                    timeout=timeout
+                )
+            except asyncio.TimeoutError:
+                raise Exception(f"OpenAI request timed out after {timeout:g}s")
+        
+        content = response.choices[0].message.content or ""
+        await llm_cache.set(cache_key, kwargs.get("model", ""), content)
+        return content
+    
+    async def _parse_chat_completion(self, timeout: float, response_format, **kwargs):
+        """
+        Run a structured-output chat completion under the concurrency limit, consulting the LLM cache first
+        
+        Returns:
+            Parsed response_format instance, or None if the model produced no valid output
+        """
+        # Key on the output schema so changes to the Pydantic model invalidate old entries
+        cache_key = llm_cache.make_key({**kwargs, "response_format": response_format.model_json_schema()})
+        cached = await llm_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"♻️ LLM cache hit ({kwargs.get('model')})")
+            return response_format.model_validate_json(cached)
+        
+        async with self._semaphore:
+            try:
+                response = await asyncio.wait_for(
+                    self.client.beta.chat.completions.parse(
+                        timeout=timeout, response_format=response_format, **kwargs
+                    ),
+                    timeout=timeout
+                )
+            except asyncio.TimeoutError:
+                raise Exception(f"OpenAI request timed out after {timeout:g}s")
+        
+        parsed = response.choices[0].message.parsed
+        if parsed is not None:
+            await llm_cache.set(cache_key, kwargs.get("model", ""), parsed.model_dump_json())
+        return parsed
+    
+    async def _stream_chat_completion(
+        self, timeout: float, response_format=None, **kwargs
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Stream a chat completion under the concurrency limit, consulting the LLM cache first
+        
+        Shares cache entries with _create_chat_completion (or _parse_chat_completion
+        when response_format is given); a cache hit is replayed as a single chunk.
+        The concurrency slot is held until the stream ends or the consumer stops.
+        
+        Args:
+            timeout: Seconds allowed for the whole stream once a slot is acquired
+            response_format: Optional Pydantic model for structured output
+            **kwargs: Arguments for chat.completions.stream
+            
+        Yields:
+            (content delta, partial parse of the content so far) tuples; the partial
+            parse is a dict for structured output and None otherwise
+            
+        Raises:
+            Exception: If the stream exceeds the timeout (the request is cancelled)
+        """
+        if response_format is not None:
+            cache_key = llm_cache.make_key({**kwargs, "response_format": response_format.model_json_schema()})
+            kwargs["response_format"] = response_format
+        else:
+            cache_key = llm_cache.make_key(kwargs)
+        
+        cached = await llm_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"♻️ LLM cache hit ({kwargs.get('model')})")
+            yield cached, json.loads(cached) if response_format is not None else None
+            return
+        
+        loop = asyncio.get_running_loop()
+        async with self._semaphore:
+            deadline = loop.time() + timeout
+            try:
+                async with self.client.beta.chat.completions.stream(timeout=timeout, **kwargs) as stream:
+                    events = stream.__aiter__()
+                    while True:
+                        try:
+                            event = await asyncio.wait_for(events.__anext__(), timeout=max(deadline - loop.time(), 0))
+                        except StopAsyncIteration:
+                            break
+                        if event.type == "content.delta":
+                            yield event.delta, event.parsed
+                    
+                    completion = await stream.get_final_completion()
+            except asyncio.TimeoutError:
+                raise Exception(f"OpenAI request timed out after {timeout:g}s")
+        
+        message = completion.choices[0].message
+        if response_format is None:
+            await llm_cache.set(cache_key, kwargs.get("model", ""), message.content or "")
+        elif message.parsed is not None:
+            await llm_cache.set(cache_key, kwargs.get("model", ""), message.parsed.model_dump_json())
+    
+    async def create_embeddings(self, texts: List[str], model: str, dimensions: int) -> List[List[float]]:
+        """
+        Embed texts under the concurrency limit
+        
+        Args:
+            texts: Texts to embed (one request)
+            model: Embedding model
+            dimensions: Requested vector size
+            
+        Returns:
+            One vector per text, in input order
+            
+        Raises:
+            Exception: If the call exceeds the timeout (the request is cancelled)
+        """
+        self._check_availability()
+        
+        async with self._semaphore:
+            try:
+                response = await asyncio.wait_for(
+                    self.client.embeddings.create(
+                        input=texts, model=model, dimensions=dimensions, timeout=self.EMBEDDING_TIMEOUT
+                    ),
+                    timeout=self.EMBEDDING_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                raise Exception(f"OpenAI request timed out after {self.EMBEDDING_TIMEOUT:g}s")
+        
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+    
+    async def shutdown(self) -> None:
+        """Close the underlying HTTP client; called from the application lifespan"""
+        await self.client.close()
+    
+    async def _condense_section(self, section: str, instruction: str) -> str:
+        """Condense one transcript chunk (map) or group of partial notes (reduce)"""
+        content = await self._create_chat_completion(
+            timeout=self.SUMMARY_TIMEOUT,
+            model=self.MAP_MODEL,
+            messages=[
+                {
+                    "role": "system",
+                    "content": "You condense meeting transcripts into dense, faithful notes for a later summarization step. Never invent content."
+                },
+                {
+                    "role": "user",
+                    "content": f"{instruction}\n\n{section}"
+                }
+            ],
+            max_tokens=self.MAP_OUTPUT_TOKENS,
+            temperature=0.2
+        )
+        return content.strip()
+    
+    async def _condense_sections(self, sections: List[str], instruction: str) -> List[str]:
+        """Condense sections concurrently with a bounded fan-out, preserving order"""
+        fan_out = asyncio.Semaphore(self.MAP_CONCURRENCY)
+        
+        async def condense(section: str) -> str:
+            async with fan_out:
+                return await self._condense_section(section, instruction)
+        
+        return list(await asyncio.gather(*(condense(section) for section in sections)))
+    
+    async def _fit_transcript(self, transcript_text: str, max_tokens: int) -> str:
+        """
+        Return the transcript unchanged if it fits the budget, otherwise condense it
+        
+        Long transcripts are split on speaker turns, each chunk is condensed
+        concurrently (map), and the partial notes are merged level by level
+        (hierarchical reduce) until they fit, so the whole meeting is covered.
+        
+        Args:
+            transcript_text: Transcript with one speaker turn per line
+            max_tokens: Token budget for the transcript part of the final prompt
+            
+        Returns:
+            Transcript text, or condensed chronological notes covering all of it
+        """
+        if count_tokens(transcript_text) <= max_tokens:
+            return transcript_text
+        
+        chunks = chunk_transcript(transcript_text, self.MAP_CHUNK_TOKENS)
+        logger.info(f"🧩 Condensing long transcript in {len(chunks)} chunks")
+        
+        partials = await self._condense_sections(
+            chunks,
+            "Condense this part of a meeting transcript into chronological notes. "
+            "Keep speaker names, timestamps, decisions, action items with owners and deadlines, "
+            "numbers, and short verbatim quotes of the most important statements."
+        )
+        
+        while True:
+            condensed = "\n\n".join(partials)
+            if len(partials) == 1 or count_tokens(condensed) <= max_tokens:
+                return condensed
+            
+            groups = group_sections(partials, self.MAP_CHUNK_TOKENS, separator="\n\n")
+            logger.info(f"🧩 Merging {len(partials)} partial notes into {len(groups)}")
+            partials = await self._condense_sections(
+                groups,
+                "Merge these consecutive sets of meeting notes into one chronological set. "
+                "Keep speaker names, decisions, action items with owners and deadlines, "
+                "and the most important verbatim quotes; drop repetition."
+            )
+    
     def _get_template_prompt(self, template_type: str) -> str:
         """Get the appropriate prompt template based on template type"""
         templates = {
@@ -205,47 +469,146 @@ Please analyze the following meeting transcript:
         self._check_availability()
         
         try:
-            print(f"🤖 Generating AI summary for meeting transcript ({len(transcript_text)} characters)")
-            
-            # Create the prompt
-            prompt = self._create_summarization_prompt(transcript_text, meeting_context)
+            logger.info(f"🤖 Generating AI summary for meeting transcript ({len(transcript_text)} characters)")
             
             # Call OpenAI API
-            response = self.client.chat.completions.create(
-                model="gpt-4o",
+            request = await self._summary_request(transcript_text, meeting_context)
+            content = await self._create_chat_completion(timeout=self.SUMMARY_TIMEOUT, **request)
+            
+            logger.info(f"✅ AI summary generated successfully")
+            
+            return self._build_summary_response(content)
+            
+        except Exception as e:
+            logger.error(f"❌ Error generating AI summary: {str(e)}")
+            raise Exception(f"Failed to generate AI summary: {str(e)}")
+    
+    async def stream_summary(
+        self,
+        transcript_text: str,
+        meeting_context: Optional[str] = None
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Stream an AI meeting summary token by token
+        
+        Uses the same prompt and LLM cache entry as summarize_meeting.
+        
+        Args:
+            transcript_text: Full transcript of the meeting
+            meeting_context: Optional context about the meeting
+            
+        Yields:
+            ("delta", text) for each content chunk, then ("done", OpenAISummaryResponse)
+            
+        Raises:
+            Exception: If summarization fails
+        """
+        self._check_availability()
+        
+        try:
+            logger.info(f"🤖 Streaming AI summary for meeting transcript ({len(transcript_text)} characters)")
+            
+            request = await self._summary_request(transcript_text, meeting_context)
+            content = ""
+            async for delta, _ in self._stream_chat_completion(timeout=self.SUMMARY_TIMEOUT, **request):
+                content += delta
+                yield "delta", delta
+            
+            logger.info(f"✅ AI summary streamed successfully")
+            
+            yield "done", self._build_summary_response(content)
+            
+        except Exception as e:
+            logger.error(f"❌ Error streaming AI summary: {str(e)}")
+            raise Exception(f"Failed to generate AI summary: {str(e)}")
+    
+    async def _summary_request(self, transcript_text: str, meeting_context: Optional[str]) -> Dict[str, Any]:
+        """Build the chat completion arguments for a meeting summary"""
+        transcript_text = await self._fit_transcript(transcript_text, self.SUMMARY_INPUT_TOKENS)
+        prompt = self._create_summarization_prompt(transcript_text, meeting_context)
+        
+        return dict(
+            model="gpt-4o",
+            messages=[
+                {
+                    "role": "system",
+                    "content": "You are an expert meeting analyst who creates comprehensive, well-structured meeting summaries. Always provide detailed, actionable insights and maintain a professional tone."
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            max_tokens=2000,
+            temperature=0.3,  # Lower temperature for more consistent, factual output
+            top_p=0.9
+        )
+    
+    def _build_summary_response(self, content: str) -> OpenAISummaryResponse:
+        """Parse a generated summary into the structured summary response"""
+        # Extract the summary
+        summary_text = content.strip()
+        
+        # Parse the summary to extract structured data
+        parsed_summary = self._parse_summary_response(summary_text)
+        
+        return OpenAISummaryResponse(
+            summary=summary_text,
+            key_points=parsed_summary.get("key_points", []),
+            action_items=parsed_summary.get("action_items", []),
+            participants=parsed_summary.get("participants", [])
+        )
+    
+    async def update_rolling_summary(self, previous_notes: Optional[str], new_transcript_text: str) -> str:
+        """
+        Fold new transcript segments of a live meeting into its running notes
+        
+        Args:
+            previous_notes: Running notes so far (None for the first fold)
+            new_transcript_text: Transcript segments stored since the last fold
+            
+        Returns:
+            Updated running notes covering the whole meeting so far
+            
+        Raises:
+            Exception: If the update fails
+        """
+        self._check_availability()
+        
+        try:
+            new_transcript_text = await self._fit_transcript(new_transcript_text, self.ROLLING_INPUT_TOKENS)
+            
+            prompt = (
+                "Update the running notes of a live meeting with the new transcript segments below. "
+                "Return the complete updated notes in chronological order. Keep speaker names, decisions, "
+                "action items with owners and deadlines, numbers, and short verbatim quotes of the most "
+                "important statements. Merge repetition; never drop earlier decisions or action items.\n\n"
+                f"**Running Notes:**\n{previous_notes or '(none yet)'}\n\n"
+                f"**New Transcript Segments:**\n{new_transcript_text}"
+            )
+            
+            content = await self._create_chat_completion(
+                timeout=self.ROLLING_TIMEOUT,
+                model=self.MAP_MODEL,
                 messages=[
                     {
                         "role": "system",
-                        "content": "You are an expert meeting analyst who creates comprehensive, well-structured meeting summaries. Always provide detailed, actionable insights and maintain a professional tone."
+                        "content": "You maintain dense, faithful running notes of a live meeting for a later summarization step. Never invent content."
                     },
                     {
                         "role": "user",
                         "content": prompt
                     }
                 ],
-                max_tokens=2000,
-                temperature=0.3,  # Lower temperature for more consistent, factual output
-                top_p=0.9
+                max_tokens=self.ROLLING_OUTPUT_TOKENS,
+                temperature=0.2
             )
             
-            # Extract the summary
-            summary_text = response.choices[0].message.content.strip()
-            
-            # Parse the summary to extract structured data
-            parsed_summary = self._parse_summary_response(summary_text)
-            
-            print(f"✅ AI summary generated successfully")
-            
-            return OpenAISummaryResponse(
-                summary=summary_text,
-                key_points=parsed_summary.get("key_points", []),
-                action_items=parsed_summary.get("action_items", []),
-                participants=parsed_summary.get("participants", [])
-            )
+            return content.strip()
             
         except Exception as e:
-            print(f"❌ Error generating AI summary: {str(e)}")
-            raise Exception(f"Failed to generate AI summary: {str(e)}")
+            logger.error(f"❌ Error updating rolling summary: {str(e)}")
+            raise Exception(f"Failed to update rolling summary: {str(e)}")
     
     def _parse_summary_response(self, summary_text: str) -> Dict[str, List[str]]:
         """
@@ -308,7 +671,7 @@ Please analyze the following meeting transcript:
             return parsed_data
             
         except Exception as e:
-            print(f"⚠️ Error parsing summary response: {str(e)}")
+            logger.warning(f"⚠️ Error parsing summary response: {str(e)}")
             # Return empty structure if parsing fails
             return {
                 "key_points": [],
@@ -329,7 +692,9 @@ Please analyze the following meeting transcript:
         self._check_availability()
         
         try:
-            print(f"📝 Generating meeting title from transcript")
+            logger.info(f"📝 Generating meeting title from transcript")
+            
+            transcript_text = await self._fit_transcript(transcript_text, self.TITLE_INPUT_TOKENS)
             
             # Create a simple prompt for title generation
             prompt = f"""
@@ -342,12 +707,13 @@ Examples of good titles:
 - "Weekly Team Standup - Engineering"
 - "Client Onboarding Discussion"
 
-Transcript (first 1000 characters):
-{transcript_text[:1000]}...
+Transcript:
+{transcript_text}
 
 Meeting Title:"""
 
-            response = self.client.chat.completions.create(
+            content = await self._create_chat_completion(
+                timeout=self.TITLE_TIMEOUT,
                 model="gpt-4o",
                 messages=[
                     {
@@ -359,7 +725,7 @@ Meeting Title:"""
                 temperature=0.5
             )
             
-            title = response.choices[0].message.content.strip()
+            title = content.strip()
             
             # Clean up the title (remove quotes if present)
             title = title.strip('"').strip("'")
@@ -368,12 +734,12 @@ Meeting Title:"""
             if len(title) > 60:
                 title = title[:57] + "..."
             
-            print(f"✅ Generated meeting title: {title}")
+            logger.info(f"✅ Generated meeting title: {title}")
             
             return title
             
         except Exception as e:
-            print(f"❌ Error generating meeting title: {str(e)}")
+            logger.error(f"❌ Error generating meeting title: {str(e)}")
             return "Meeting Summary"
 
     async def generate_comprehensive_notes(
@@ -404,63 +770,127 @@ Meeting Title:"""
         self._check_availability()
         
         try:
-            print(f"🤖 Generating comprehensive notes using {template_type} template")
-            
-            # Build the comprehensive prompt
-            prompt = custom_prompt if custom_prompt else self._get_template_prompt(template_type)
+            logger.info(f"🤖 Generating comprehensive notes using {template_type} template")
             
-            # Add data sources
-            prompt += "\n\n---\n\n"
-            prompt += "Based on the following information, create comprehensive meeting notes:\n\n"
+            # Call OpenAI API
+            request = await self._comprehensive_notes_request(
+                transcript_text, user_notes, ai_summary, transcript_highlights,
+                template_type, custom_prompt, meeting_context
+            )
+            content = await self._create_chat_completion(timeout=self.NOTES_TIMEOUT, **request)
             
-            if meeting_context:
-                prompt += f"**Meeting Context:**\n{meeting_context}\n\n"
+            comprehensive_notes = content.strip()
             
-            if ai_summary:
-                prompt += f"**AI-Generated Summary:**\n{ai_summary}\n\n"
+            logger.info(f"✅ Comprehensive notes generated successfully ({len(comprehensive_notes)} characters)")
             
-            if user_notes:
-                prompt += f"**User Notes:**\n{user_notes}\n\n"
+            return comprehensive_notes
             
-            if transcript_highlights:
-                prompt += "**Key Transcript Moments:**\n"
-                for highlight in transcript_highlights:
-                    speaker = highlight.speaker or "Unknown Speaker"
-                    timestamp = f" ({highlight.timestamp})" if highlight.timestamp else ""
-                    reason = f" - {highlight.highlight_reason}" if highlight.highlight_reason else ""
-                    prompt += f"- {speaker}{timestamp}: {highlight.text}{reason}\n"
-                prompt += "\n"
+        except Exception as e:
+            logger.error(f"❌ Error generating comprehensive notes: {str(e)}")
+            raise Exception(f"Failed to generate comprehensive notes: {str(e)}")
+    
+    async def stream_comprehensive_notes(
+        self,
+        transcript_text: str,
+        user_notes: Optional[str] = None,
+        ai_summary: Optional[str] = None,
+        transcript_highlights: Optional[List[TranscriptHighlight]] = None,
+        template_type: str = "general",
+        custom_prompt: Optional[str] = None,
+        meeting_context: Optional[str] = None
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Stream comprehensive notes token by token
+        
+        Takes the same arguments and shares the prompt and LLM cache entry
+        with generate_comprehensive_notes.
+        
+        Yields:
+            ("delta", text) for each content chunk, then ("done", full notes text)
             
-            # Add full transcript for context
-            prompt += f"**Full Transcript:**\n{transcript_text[:3000]}..."  # Limit to avoid token limits
+        Raises:
+            Exception: If generation fails
+        """
+        self._check_availability()
+        
+        try:
+            logger.info(f"🤖 Streaming comprehensive notes using {template_type} template")
             
-            # Call OpenAI API
-            response = self.client.chat.completions.create(
-                model="gpt-4o",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": f"You are an expert meeting analyst creating {template_type} meeting notes. Combine all provided information into comprehensive, actionable notes that provide maximum value to the reader."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                max_tokens=3000,
-                temperature=0.3,
-                top_p=0.9
+            request = await self._comprehensive_notes_request(
+                transcript_text, user_notes, ai_summary, transcript_highlights,
+                template_type, custom_prompt, meeting_context
             )
+            content = ""
+            async for delta, _ in self._stream_chat_completion(timeout=self.NOTES_TIMEOUT, **request):
+                content += delta
+                yield "delta", delta
             
-            comprehensive_notes = response.choices[0].message.content.strip()
+            comprehensive_notes = content.strip()
             
-            print(f"✅ Comprehensive notes generated successfully ({len(comprehensive_notes)} characters)")
+            logger.info(f"✅ Comprehensive notes streamed successfully ({len(comprehensive_notes)} characters)")
             
-            return comprehensive_notes
+            yield "done", comprehensive_notes
             
         except Exception as e:
-            print(f"❌ Error generating comprehensive notes: {str(e)}")
+            logger.error(f"❌ Error streaming comprehensive notes: {str(e)}")
             raise Exception(f"Failed to generate comprehensive notes: {str(e)}")
+    
+    async def _comprehensive_notes_request(
+        self,
+        transcript_text: str,
+        user_notes: Optional[str],
+        ai_summary: Optional[str],
+        transcript_highlights: Optional[List[TranscriptHighlight]],
+        template_type: str,
+        custom_prompt: Optional[str],
+        meeting_context: Optional[str]
+    ) -> Dict[str, Any]:
+        """Build the chat completion arguments for comprehensive notes"""
+        # Build the comprehensive prompt
+        prompt = custom_prompt if custom_prompt else self._get_template_prompt(template_type)
+            
+        # Add data sources
+        prompt += "\n\n---\n\n"
+        prompt += "Based on the following information, create comprehensive meeting notes:\n\n"
+        
+        if meeting_context:
+            prompt += f"**Meeting Context:**\n{meeting_context}\n\n"
+        
+        if ai_summary:
+            prompt += f"**AI-Generated Summary:**\n{ai_summary}\n\n"
+        
+        if user_notes:
+            prompt += f"**User Notes:**\n{user_notes}\n\n"
+        
+        if transcript_highlights:
+            prompt += "**Key Transcript Moments:**\n"
+            for highlight in transcript_highlights:
+                speaker = highlight.speaker or "Unknown Speaker"
+                timestamp = f" ({highlight.timestamp})" if highlight.timestamp else ""
+                reason = f" - {highlight.highlight_reason}" if highlight.highlight_reason else ""
+                prompt += f"- {speaker}{timestamp}: {highlight.text}{reason}\n"
+            prompt += "\n"
+        
+        # Add full transcript for context
+        transcript_text = await self._fit_transcript(transcript_text, self.NOTES_INPUT_TOKENS)
+        prompt += f"**Full Transcript:**\n{transcript_text}"
+        
+        return dict(
+            model="gpt-4o",
+            messages=[
+                {
+                    "role": "system",
+                    "content": f"You are an expert meeting analyst creating {template_type} meeting notes. Combine all provided information into comprehensive, actionable notes that provide maximum value to the reader."
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            max_tokens=3000,
+            temperature=0.3,
+            top_p=0.9
+        )
 
     async def generate_smart_highlights(self, transcript_text: str, max_highlights: int = 5) -> List[Dict]:
         """
@@ -478,6 +908,12 @@ Meeting Title:"""
         if not transcript_text or len(transcript_text.strip()) < 50:
             return []
         
+        try:
+            transcript_text = await self._fit_transcript(transcript_text, self.HIGHLIGHTS_INPUT_TOKENS)
+        except Exception as e:
+            logger.error(f"❌ Error condensing transcript for highlights: {str(e)}")
+            return []
+        
         prompt = f"""
 Analyze this meeting transcript and identify the {max_highlights} most important moments or statements.
 For each highlight, provide the speaker (if available), the exact text, and a brief reason why it's important.
@@ -488,13 +924,14 @@ Format your response as a JSON array of objects with these fields:
 - reason: Why this moment is significant
 
 Transcript:
-{transcript_text[:3000]}  # Limit to avoid token limits
+{transcript_text}
 
 Return only the JSON array, no other text.
 """
         
         try:
-            response = await self.client.chat.completions.create(
+            content = await self._create_chat_completion(
+                timeout=self.HIGHLIGHTS_TIMEOUT,
                 model="gpt-4o-mini",
                 messages=[
                     {
@@ -510,7 +947,7 @@ Return only the JSON array, no other text.
                 temperature=0.3
             )
             
-            response_text = response.choices[0].message.content.strip()
+            response_text = content.strip()
             
             # Parse JSON response
             import json
@@ -529,13 +966,21 @@ Return only the JSON array, no other text.
             return cleaned_highlights
             
         except Exception as e:
-            print(f"❌ Error generating smart highlights: {str(e)}")
+            logger.error(f"❌ Error generating smart highlights: {str(e)}")
             return []
 
+    # Sections of StructuredNotesContent in schema order, with their item models
+    STRUCTURED_SECTIONS = (
+        ("to_do", TaskItem),
+        ("key_updates", KeyUpdate),
+        ("brainstorming_ideas", BrainstormingIdea),
+    )
+    
     async def generate_structured_notes(
         self, 
         transcript_text: str,
-        meeting_context: Optional[str] = None
+        meeting_context: Optional[str] = None,
+        meeting_date: Optional[date] = None
     ) -> Dict:
         """
         Generate structured notes from meeting transcript using GPT-4o with Pydantic validation
@@ -543,13 +988,143 @@ Return only the JSON array, no other text.
         Args:
             transcript_text: Full transcript of the meeting
             meeting_context: Optional context about the meeting
+            meeting_date: Date of the meeting, anchoring suggested deadlines (defaults to today)
             
         Returns:
             Structured notes with to_do, key_updates, and brainstorming_ideas
         """
-        print(f"🚀 Generating high-quality structured notes with GPT-4o")
-        print(f"   Transcript length: {len(transcript_text) if transcript_text else 0} characters")
+        logger.info(f"🚀 Generating high-quality structured notes with GPT-4o")
+        logger.info(f"   Transcript length: {len(transcript_text) if transcript_text else 0} characters")
+        
+        request = await self._structured_notes_request(transcript_text, meeting_context, meeting_date)
+        
+        try:
+            logger.info("🤖 Calling GPT-4o with enhanced structured analysis...")
+            
+            structured_notes = await self._parse_chat_completion(
+                timeout=self.NOTES_TIMEOUT,
+                response_format=StructuredNotesResponse,
+                **request
+            )
+            
+            if structured_notes is None:
+                raise Exception("GPT-4o failed to generate valid structured content")
+            
+            self._check_structured_notes(structured_notes)
+            
+            # Return as dictionary for API compatibility
+            return structured_notes.model_dump()
+            
+        except Exception as e:
+            logger.error(f"❌ Failed to generate structured notes: {str(e)}")
+            raise Exception(f"Unable to generate structured notes: {str(e)}")
+    
+    async def stream_structured_notes(
+        self,
+        transcript_text: str,
+        meeting_context: Optional[str] = None,
+        meeting_date: Optional[date] = None
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Stream structured notes, emitting each item as soon as it is complete
         
+        The JSON output is parsed as it arrives; every item that can no longer
+        change is validated against its model in StructuredNotesResponse and
+        emitted, and the stream aborts on the first invalid one. The complete
+        document is validated again once the stream ends. Shares the prompt and
+        LLM cache entry with generate_structured_notes.
+        
+        Args:
+            transcript_text: Full transcript of the meeting
+            meeting_context: Optional context about the meeting
+            meeting_date: Date of the meeting, anchoring suggested deadlines (defaults to today)
+            
+        Yields:
+            ("item", {"section": ..., "item": ...}) per validated item, then
+            ("done", structured notes dict as returned by generate_structured_notes)
+            
+        Raises:
+            Exception: If generation or validation fails
+        """
+        logger.info(f"🚀 Streaming structured notes with GPT-4o")
+        
+        request = await self._structured_notes_request(transcript_text, meeting_context, meeting_date)
+        
+        try:
+            emitted = {section: 0 for section, _ in self.STRUCTURED_SECTIONS}
+            content = ""
+            async for delta, partial in self._stream_chat_completion(
+                timeout=self.NOTES_TIMEOUT,
+                response_format=StructuredNotesResponse,
+                **request
+            ):
+                content += delta
+                for section, item in self._complete_structured_items(partial, emitted, final=False):
+                    yield "item", {"section": section, "item": item}
+            
+            structured_notes = StructuredNotesResponse.model_validate_json(content)
+            for section, item in self._complete_structured_items(structured_notes.model_dump(), emitted, final=True):
+                yield "item", {"section": section, "item": item}
+            
+            self._check_structured_notes(structured_notes)
+            
+            yield "done", structured_notes.model_dump()
+            
+        except Exception as e:
+            logger.error(f"❌ Failed to stream structured notes: {str(e)}")
+            raise Exception(f"Unable to generate structured notes: {str(e)}")
+    
+    def _complete_structured_items(self, snapshot: Optional[Dict], emitted: Dict[str, int], final: bool):
+        """
+        Validate and yield the items of a partial structured notes document that are complete
+        
+        An item is complete once another item follows it in its list or a later
+        section has started (or the document is final). `emitted` counts the
+        items already yielded per section and is advanced in place.
+        
+        Raises:
+            ValidationError: If a complete item does not match its model
+        """
+        notes = (snapshot or {}).get("notes") or {}
+        for position, (section, item_model) in enumerate(self.STRUCTURED_SECTIONS):
+            items = notes.get(section) or []
+            closed = final or any(later in notes for later, _ in self.STRUCTURED_SECTIONS[position + 1:])
+            complete = len(items) if closed else len(items) - 1
+            
+            for item in items[emitted[section]:complete]:
+                validated = item_model.model_validate(item)
+                emitted[section] += 1
+                yield section, validated.model_dump()
+    
+    def _check_structured_notes(self, structured_notes: StructuredNotesResponse) -> None:
+        """Reject empty structured notes and log what was generated"""
+        # Validate content quality
+        notes_content = structured_notes.notes
+        total_items = len(notes_content.to_do) + len(notes_content.key_updates) + len(notes_content.brainstorming_ideas)
+        
+        if total_items == 0:
+            raise Exception("Generated notes are empty - transcript may not contain sufficient actionable content")
+        
+        logger.info(f"✅ Successfully generated high-quality structured notes:")
+        logger.info(f"   📋 {len(notes_content.to_do)} action items")
+        logger.info(f"   🔄 {len(notes_content.key_updates)} key updates") 
+        logger.info(f"   💡 {len(notes_content.brainstorming_ideas)} ideas & insights")
+    
+    async def _structured_notes_request(
+        self,
+        transcript_text: str,
+        meeting_context: Optional[str],
+        meeting_date: Optional[date]
+    ) -> Dict[str, Any]:
+        """
+        Build the chat completion arguments for structured notes
+        
+        Suggested deadlines are anchored to the meeting date rather than the
+        clock, so the prompt (and its LLM cache key) is the same every day.
+        
+        Raises:
+            Exception: If the transcript is too short or cannot be condensed
+        """
         # Validate inputs
         if not transcript_text or len(transcript_text.strip()) < 50:
             raise Exception("Transcript is too short or empty. Need at least 50 characters to generate meaningful notes.")
@@ -558,6 +1133,16 @@ Return only the JSON array, no other text.
         if not self.is_available:
             raise Exception("OpenAI service is not available. Cannot generate structured notes without API access.")
         
+        # Condense very long transcripts so the prompt stays within the context window
+        try:
+            transcript_text = await self._fit_transcript(transcript_text, self.NOTES_INPUT_TOKENS)
+        except Exception as e:
+            logger.error(f"❌ Failed to condense transcript: {str(e)}")
+            raise Exception(f"Unable to generate structured notes: {str(e)}")
+        
+        deadlines_from = meeting_date or date.today()
+        deadlines_until = deadlines_from + timedelta(days=self.DEADLINE_WINDOW_DAYS)
+        
         # Enhanced system prompt for GPT-4o
         system_prompt = """You are an expert meeting analyst and note-taker with years of experience in extracting actionable insights from business conversations.
 
@@ -604,53 +1189,24 @@ QUALITY STANDARDS:
 - Capture innovative ideas and strategic insights in brainstorming_ideas
 - Use professional language and be specific about details
 - Prioritize quality over quantity - better to have fewer high-quality items
-- Set realistic deadlines between {datetime.now().strftime('%Y-%m-%d')} and {(datetime.now().replace(month=datetime.now().month+1) if datetime.now().month < 12 else datetime.now().replace(year=datetime.now().year+1, month=1)).strftime('%Y-%m-%d')}"""
+- Set realistic deadlines between {deadlines_from.isoformat()} and {deadlines_until.isoformat()}"""
         
-        try:
-            print("🤖 Calling GPT-4o with enhanced structured analysis...")
-            
-            response = self.client.beta.chat.completions.parse(
-                model="gpt-4o",  # Using GPT-4o for superior analysis
-                messages=[
-                    {
-                        "role": "system", 
-                        "content": system_prompt
-                    },
-                    {
-                        "role": "user",
-                        "content": user_prompt
-                    }
-                ],
-                response_format=StructuredNotesResponse,
-                max_tokens=3000,        # Increased for comprehensive analysis
-                temperature=0.1,        # Very low temperature for consistent, focused output
-                top_p=0.9               # Slightly focused sampling
-            )
-            
-            # Get the parsed response
-            structured_notes = response.choices[0].message.parsed
-            
-            if structured_notes is None:
-                raise Exception("GPT-4o failed to generate valid structured content")
-            
-            # Validate content quality
-            notes_content = structured_notes.notes
-            total_items = len(notes_content.to_do) + len(notes_content.key_updates) + len(notes_content.brainstorming_ideas)
-            
-            if total_items == 0:
-                raise Exception("Generated notes are empty - transcript may not contain sufficient actionable content")
-            
-            print(f"✅ Successfully generated high-quality structured notes:")
-            print(f"   📋 {len(notes_content.to_do)} action items")
-            print(f"   🔄 {len(notes_content.key_updates)} key updates") 
-            print(f"   💡 {len(notes_content.brainstorming_ideas)} ideas & insights")
-            
-            # Return as dictionary for API compatibility
-            return structured_notes.model_dump()
-            
-        except Exception as e:
-            print(f"❌ Failed to generate structured notes: {str(e)}")
-            raise Exception(f"Unable to generate structured notes: {str(e)}")
+        return dict(
+            model="gpt-4o",  # Using GPT-4o for superior analysis
+            messages=[
+                {
+                    "role": "system", 
+                    "content": system_prompt
+                },
+                {
+                    "role": "user",
+                    "content": user_prompt
+                }
+            ],
+            max_tokens=3000,        # Increased for comprehensive analysis
+            temperature=0.1,        # Very low temperature for consistent, focused output
+            top_p=0.9               # Slightly focused sampling
+        )
     
 
 
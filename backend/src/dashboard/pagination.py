@@ -0,0 +1,30 @@
+import base64
+import json
+from datetime import datetime
+from typing import Tuple
+
+# Keyset pagination over (created_at DESC, id DESC). A cursor is the sort key
+# of the last row on the previous page; the next page is every row that sorts
+# strictly after it, which the (user_id, created_at, id) indexes serve as a
+# range scan no matter how deep the page is.
+
+
+def encode_cursor(created_at: datetime, row_id: str) -> str:
+    """Encode the sort key of a row as an opaque, URL-safe cursor"""
+    raw = json.dumps({"c": created_at.isoformat(), "i": row_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    Decode a cursor produced by encode_cursor
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(data["c"]), str(data["i"])
+    except Exception:
+        raise ValueError("Invalid cursor")
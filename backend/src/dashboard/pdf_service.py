@@ -1,3 +1,4 @@
+import logging
 import io
 import markdown
 from reportlab.lib.pagesizes import A4
@@ -13,6 +14,8 @@ from typing import Optional
 from . import crud
 from .models import Summary, Meeting
 
+logger = logging.getLogger(__name__)
+
 
 class PDFService:
     """Service for generating PDF documents from meeting summaries using ReportLab"""
@@ -112,7 +115,7 @@ class PDFService:
             return pdf_buffer.getvalue()
             
         except Exception as e:
-            print(f"❌ Error generating PDF: {str(e)}")
+            logger.error(f"❌ Error generating PDF: {str(e)}")
             return None
     
     async def generate_meeting_pdf(
@@ -153,7 +156,7 @@ class PDFService:
             return pdf_buffer.getvalue()
             
         except Exception as e:
-            print(f"❌ Error generating meeting PDF: {str(e)}")
+            logger.error(f"❌ Error generating meeting PDF: {str(e)}")
             return None
     
     def _build_pdf_content(self, summary: Summary, meeting: Meeting) -> list:
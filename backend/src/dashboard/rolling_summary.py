@@ -0,0 +1,116 @@
+import logging
+import asyncio
+from datetime import datetime
+from typing import Dict, Optional
+
+from database import AsyncSessionLocal
+from . import crud
+from .openai_service import openai_service
+
+logger = logging.getLogger(__name__)
+
+# Cursor used before anything has been folded into a meeting's running notes
+_EPOCH = datetime(1970, 1, 1)
+
+
+def format_transcript_lines(transcripts) -> str:
+    """Format transcript rows the way summary prompts expect them"""
+    return "\n".join([
+        f"[{transcript.timestamp or 'Unknown'}] {transcript.speaker or 'Unknown'}: {transcript.text}"
+        for transcript in transcripts
+    ])
+
+
+class RollingSummarizer:
+    """
+    Maintains running notes for live meetings
+
+    The ingestion worker notifies the summarizer whenever new segments are
+    stored. Notifications are debounced per meeting, and each fold sends only
+    the segments stored since the last fold together with the current notes.
+    When the meeting ends, `flush` folds whatever is left so the final summary
+    is a short pass over the notes instead of the whole transcript.
+    """
+
+    DEBOUNCE_SECONDS = 45.0
+
+    def __init__(self):
+        self._pending: Dict[str, asyncio.Task] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    def notify(self, meeting_id: str, user_id: str) -> None:
+        """Schedule a fold for a meeting unless one is already pending"""
+        task = self._pending.get(meeting_id)
+        if task is None or task.done():
+            self._pending[meeting_id] = asyncio.create_task(self._debounced_fold(meeting_id, user_id))
+
+    async def _debounced_fold(self, meeting_id: str, user_id: str) -> None:
+        try:
+            await asyncio.sleep(self.DEBOUNCE_SECONDS)
+            await self.fold(meeting_id, user_id)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.warning(f"⚠️ Rolling summary update failed for meeting {meeting_id}: {str(e)}")
+        finally:
+            if self._pending.get(meeting_id) is asyncio.current_task():
+                del self._pending[meeting_id]
+
+    async def fold(self, meeting_id: str, user_id: str) -> Optional[str]:
+        """
+        Fold transcripts stored since the last fold into the meeting's running notes
+
+        Args:
+            meeting_id: Meeting ID
+            user_id: Owner of the meeting
+
+        Returns:
+            Up-to-date running notes, or None if the meeting has no transcripts
+        """
+        lock = self._locks.setdefault(meeting_id, asyncio.Lock())
+        async with lock:
+            async with AsyncSessionLocal() as db:
+                meeting = await crud.get_meeting_by_id(db, meeting_id, user_id)
+                if not meeting:
+                    return None
+
+                since = meeting.rolling_summary_until or _EPOCH
+                transcripts = await crud.get_transcripts_since(db, meeting_id, user_id, since)
+                if not transcripts:
+                    return meeting.rolling_summary
+
+                notes = await openai_service.update_rolling_summary(
+                    meeting.rolling_summary,
+                    format_transcript_lines(transcripts)
+                )
+                await crud.update_rolling_summary(db, meeting_id, notes, transcripts[-1].created_at)
+
+                logger.info(f"🧾 Folded {len(transcripts)} transcript segments into rolling summary for meeting {meeting_id}")
+                return notes
+
+    def cancel(self, meeting_id: str) -> None:
+        """Drop a meeting's pending fold, if any"""
+        task = self._pending.pop(meeting_id, None)
+        if task is not None and not task.done():
+            task.cancel()
+
+    async def flush(self, meeting_id: str, user_id: str) -> Optional[str]:
+        """Cancel any pending debounce and fold the remaining delta now"""
+        self.cancel(meeting_id)
+        try:
+            return await self.fold(meeting_id, user_id)
+        finally:
+            self._locks.pop(meeting_id, None)
+
+    async def shutdown(self) -> None:
+        """Cancel pending folds; called from the application lifespan"""
+        tasks = list(self._pending.values())
+        self._pending.clear()
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+# Global summarizer instance
+rolling_summarizer = RollingSummarizer()
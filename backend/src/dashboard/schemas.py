@@ -29,6 +29,8 @@ class TranscriptBase(BaseModel):
     speaker: Optional[str] = Field(None, description="Name of the speaker")
     text: str = Field(..., description="Transcript text")
     timestamp: Optional[str] = Field(None, description="Timestamp within the meeting")
+    start_seconds: Optional[float] = Field(None, description="Segment start in seconds from the start of the recording")
+    end_seconds: Optional[float] = Field(None, description="Segment end in seconds from the start of the recording")
 
 
 # Request schemas
@@ -133,19 +135,21 @@ class MeetingWithSummaries(MeetingResponse):
 
 
 class MeetingListResponse(BaseModel):
-    """Schema for meeting list response"""
+    """Schema for meeting list response (keyset paginated)"""
     meetings: List[MeetingResponse]
-    total: int
-    page: int
     per_page: int
+    next_cursor: Optional[str] = None  # Pass back as `cursor` for the next page
+    has_more: bool = False
+    total: Optional[int] = None  # Only when requested with include_total
 
 
 class SummaryListResponse(BaseModel):
-    """Schema for summary list response"""
+    """Schema for summary list response (keyset paginated)"""
     summaries: List[SummaryResponse]
-    total: int
-    page: int
     per_page: int
+    next_cursor: Optional[str] = None  # Pass back as `cursor` for the next page
+    has_more: bool = False
+    total: Optional[int] = None  # Only when requested with include_total
 
 
 # Dashboard analytics schemas
@@ -153,7 +157,8 @@ class DashboardStats(BaseModel):
     """Schema for dashboard statistics"""
     total_meetings: int
     total_summaries: int
-    total_tasks: int  # Can be derived from action_items
+    total_tasks: int  # Action items across all summaries
+    open_tasks: int = 0  # Action items not marked done
     meetings_this_month: int
     summaries_this_month: int
     avg_meeting_duration_minutes: float
@@ -172,6 +177,50 @@ class DashboardResponse(BaseModel):
     heatmap_data: List[HeatmapData]
 
 
+# Action item and tag schemas
+class ActionItemResponse(BaseModel):
+    """Schema for an action item extracted from a summary"""
+    id: str
+    meeting_id: str
+    summary_id: str
+    task_name: str
+    description: Optional[str] = None
+    assignee: Optional[str] = None
+    deadline: Optional[date] = None
+    status: str = Field(..., description="open or done")
+    completed_at: Optional[datetime] = None
+    created_at: datetime
+    
+    class Config:
+        from_attributes = True
+
+
+class ActionItemUpdate(BaseModel):
+    """Schema for updating an action item"""
+    status: str = Field(..., pattern="^(open|done)$", description="open or done")
+
+
+class AssigneeTaskCount(BaseModel):
+    """Schema for one assignee's action item counts"""
+    assignee: Optional[str] = Field(None, description="None for unassigned tasks")
+    open: int
+    done: int
+
+
+class ActionItemStats(BaseModel):
+    """Schema for action item counts"""
+    open: int
+    done: int
+    overdue: int
+    by_assignee: List[AssigneeTaskCount]
+
+
+class TagCount(BaseModel):
+    """Schema for a tag and how many summaries and notes carry it"""
+    name: str
+    count: int
+
+
 # Vexa API schemas
 class VexaBotRequest(BaseModel):
     """Schema for Vexa bot creation request"""
@@ -225,6 +274,8 @@ class VexaTranscriptItem(BaseModel):
     time: str
     speaker: str
     text: str
+    start: Optional[float] = None  # Segment start offset in seconds
+    end: Optional[float] = None  # Segment end offset in seconds
 
 
 # OpenAI API schemas
@@ -303,6 +354,8 @@ class NotesSearchRequest(BaseModel):
     favorites_only: bool = Field(default=False, description="Show only favorite notes")
     date_from: Optional[datetime] = Field(default=None, description="Filter from date")
     date_to: Optional[datetime] = Field(default=None, description="Filter to date")
+    page: int = Field(default=1, ge=1, description="1-based page number")
+    per_page: int = Field(default=50, ge=1, le=100, description="Notes per page")
 
 
 class NotesExportRequest(BaseModel):
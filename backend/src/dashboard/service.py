@@ -1,6 +1,7 @@
+import logging
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Tuple, Optional
-from datetime import datetime, date
+from typing import Any, AsyncIterator, Dict, List, Tuple, Optional
+from datetime import datetime, date, timezone
 
 from .models import Meeting, Transcript
 from .schemas import (
@@ -11,7 +12,16 @@ from .schemas import (
 from . import crud
 from .vexa_service import vexa_service
 from .openai_service import openai_service
+from .rolling_summary import rolling_summarizer, format_transcript_lines
+from .transcript_stream import transcript_broadcaster
+from .dashboard_cache import dashboard_cache
+from .pagination import encode_cursor, decode_cursor
+from jobs.models import Job
+from jobs.queue import job_queue
 from auth.models import User
+from settings import settings
+
+logger = logging.getLogger(__name__)
 
 
 class DashboardService:
@@ -45,7 +55,7 @@ class DashboardService:
             # Create meeting in database
             meeting = await crud.create_meeting(db, meeting_data, user_id)
             
-            print(f"📅 Created meeting {meeting.id} for user {user_id}")
+            logger.info(f"📅 Created meeting {meeting.id} for user {user_id}")
             
             # Start Vexa bot
             try:
@@ -73,12 +83,12 @@ class DashboardService:
                         meeting.status = updated_meeting.status
                         meeting.started_at = updated_meeting.started_at
                     
-                    print(f"🤖 Vexa bot started successfully for meeting {meeting.id}")
+                    logger.info(f"🤖 Vexa bot started successfully for meeting {meeting.id}")
                 else:
-                    print(f"⚠️ Vexa bot created but no meeting_id returned")
+                    logger.warning(f"⚠️ Vexa bot created but no meeting_id returned")
                     
             except Exception as vexa_error:
-                print(f"❌ Failed to start Vexa bot: {str(vexa_error)}")
+                logger.error(f"❌ Failed to start Vexa bot: {str(vexa_error)}")
                 # Update meeting status to error
                 await crud.update_meeting(
                     db, meeting.id, user_id, 
@@ -90,44 +100,60 @@ class DashboardService:
             return MeetingResponse.from_orm(meeting)
             
         except Exception as e:
-            print(f"❌ Error creating meeting: {str(e)}")
+            logger.error(f"❌ Error creating meeting: {str(e)}")
             raise Exception(f"Failed to create meeting: {str(e)}")
     
     async def get_user_meetings(
         self, 
         db: AsyncSession, 
         user_id: str, 
-        page: int = 1, 
-        per_page: int = 20
+        per_page: int = 20, 
+        cursor: Optional[str] = None, 
+        include_total: bool = False
     ) -> MeetingListResponse:
         """
-        Get all meetings for a user with pagination
+        Get a page of a user's meetings, newest first
         
         Args:
             db: Database session
             user_id: User ID
-            page: Page number (1-based)
             per_page: Items per page
+            cursor: next_cursor of the previous page, None for the first page
+            include_total: Also return the total meeting count (cached)
             
         Returns:
-            Paginated list of meetings
+            Page of meetings with the cursor for the next one
+            
+        Raises:
+            ValueError: If the cursor is invalid
         """
+        after = decode_cursor(cursor) if cursor else None
+        
         try:
-            skip = (page - 1) * per_page
-            meetings = await crud.get_meetings_by_user(db, user_id, skip, per_page)
-            total_count = await crud.count_meetings_by_user(db, user_id)
+            # Fetch one extra row to learn whether another page exists
+            meetings = await crud.get_meetings_by_user(db, user_id, per_page + 1, after)
+            has_more = len(meetings) > per_page
+            meetings = meetings[:per_page]
+            
+            total_count = None
+            if include_total:
+                total_count = await dashboard_cache.get_or_compute(
+                    user_id, "meetings_total", {},
+                    lambda: crud.count_meetings_by_user(db, user_id)
+                )
             
             meeting_responses = [MeetingResponse.from_orm(meeting) for meeting in meetings]
             
             return MeetingListResponse(
                 meetings=meeting_responses,
-                total=total_count,
-                page=page,
-                per_page=per_page
+                per_page=per_page,
+                next_cursor=encode_cursor(meetings[-1].created_at, meetings[-1].id) if has_more else None,
+                has_more=has_more,
+                total=total_count
             )
             
         except Exception as e:
-            print(f"❌ Error getting user meetings: {str(e)}")
+            logger.error(f"❌ Error getting user meetings: {str(e)}")
             raise Exception(f"Failed to get meetings: {str(e)}")
     
     async def get_meeting_with_transcripts(
@@ -148,11 +174,11 @@ class DashboardService:
             Meeting with transcripts or None if not found
         """
         try:
-            meeting = await crud.get_meeting_by_id(db, meeting_id, user_id)
-            if not meeting:
+            found = await crud.get_meeting_with_transcripts(db, meeting_id, user_id)
+            if not found:
                 return None
             
-            transcripts = await crud.get_transcripts_by_meeting(db, meeting_id, user_id)
+            meeting, transcripts = found
             transcript_responses = [TranscriptResponse.from_orm(t) for t in transcripts]
             
             meeting_response = MeetingResponse.from_orm(meeting)
@@ -163,14 +189,15 @@ class DashboardService:
             )
             
         except Exception as e:
-            print(f"❌ Error getting meeting with transcripts: {str(e)}")
+            logger.error(f"❌ Error getting meeting with transcripts: {str(e)}")
             raise Exception(f"Failed to get meeting: {str(e)}")
     
     async def sync_transcripts(
         self, 
         db: AsyncSession, 
         meeting_id: str, 
-        user_id: str
+        user_id: str, 
+        final: bool = False
     ) -> List[TranscriptResponse]:
         """
         Sync transcripts from Vexa for a meeting
@@ -179,9 +206,18 @@ class DashboardService:
             db: Database session
             meeting_id: Meeting ID
             user_id: User ID
-            
+            final: Last sync after the meeting ended (allowed once, from the finalize job)
+            
+        Vexa finalises segments out of order and revises them, so each sync
+        reconciles Vexa's segments starting within TRANSCRIPT_SYNC_LOOKBACK_SECONDS
+        of the high-water mark against the stored ones, keyed by start offset:
+        missing segments are added and changed ones replaced. Only that window is
+        read and written, so the cost of a sync stays flat as the meeting grows.
+        The final sync reconciles the whole transcript, also dropping stored
+        segments Vexa no longer reports.
+        
         Returns:
-            List of new transcript items
+            List of new or revised transcript items (the delta)
             
         Raises:
             Exception: If sync fails or meeting is ended
@@ -192,13 +228,13 @@ class DashboardService:
                 raise Exception("Meeting not found or Vexa bot not started")
             
             # 🛑 STOP SYNCING FOR ENDED MEETINGS
-            if meeting.status == "ended":
-                print(f"🛑 Meeting {meeting_id} has ended. Stopping transcript sync to reduce server load.")
+            if meeting.status == "ended" and not final:
+                logger.info(f"🛑 Meeting {meeting_id} has ended. Stopping transcript sync to reduce server load.")
                 raise Exception("Meeting has ended. No longer syncing transcripts to avoid server overload.")
             
             # Only sync for active meetings
-            if meeting.status != "active":
-                print(f"⚠️ Meeting {meeting_id} status is '{meeting.status}'. Skipping transcript sync.")
+            if meeting.status not in ("active", "ended"):
+                logger.warning(f"⚠️ Meeting {meeting_id} status is '{meeting.status}'. Skipping transcript sync.")
                 return []
             
             # Get transcripts from Vexa using the native meeting ID
@@ -209,36 +245,176 @@ class DashboardService:
             if not vexa_transcripts:
                 return []
             
+            high_water_mark = meeting.transcript_synced_until
+            revised_segments = []
+            dropped_segments = []
+            
+            if high_water_mark is None:
+                # First sync for this meeting (or one stored before high-water marks
+                # existed): start from a clean slate so old rows are not duplicated
+                await crud.clear_meeting_transcripts(db, meeting_id, user_id)
+                new_segments = list(vexa_transcripts)
+            else:
+                window_start = None if final else high_water_mark - settings.TRANSCRIPT_SYNC_LOOKBACK_SECONDS
+                stored_rows: Dict[float, List[Tuple[Optional[str], str]]] = {}
+                for start, speaker, text in await crud.get_transcript_segments_from(db, meeting_id, window_start):
+                    stored_rows.setdefault(start, []).append((speaker, text))
+                
+                new_segments = []
+                vexa_starts = set()
+                for vexa_transcript in vexa_transcripts:
+                    start = vexa_transcript.start
+                    if start is None or (window_start is not None and start < window_start):
+                        continue
+                    vexa_starts.add(start)
+                    
+                    stored = stored_rows.get(start)
+                    if stored is None:
+                        new_segments.append(vexa_transcript)
+                    elif stored != [(vexa_transcript.speaker, vexa_transcript.text)]:
+                        # Revised by Vexa (or stored twice): replace whatever is stored
+                        revised_segments.append(vexa_transcript)
+                
+                if final:
+                    dropped_segments = [start for start in stored_rows if start not in vexa_starts]
+            
+            if not new_segments and not revised_segments and not dropped_segments:
+                return []
+            
+            delta = sorted(revised_segments + new_segments, key=lambda t: t.start or 0.0)
+            
             # Convert Vexa transcripts to our format
             transcript_data = []
-            for vexa_transcript in vexa_transcripts:
+            for vexa_transcript in delta:
                 transcript_data.append(TranscriptBase(
                     speaker=vexa_transcript.speaker,
                     text=vexa_transcript.text,
-                    timestamp=vexa_transcript.time
+                    timestamp=vexa_transcript.time,
+                    start_seconds=vexa_transcript.start,
+                    end_seconds=vexa_transcript.end
                 ))
             
-            # Clear existing transcripts and add new ones
-            await crud.clear_meeting_transcripts(db, meeting_id, user_id)
-            new_transcripts = await crud.bulk_create_transcripts(db, meeting_id, transcript_data)
+            new_transcripts = await crud.append_transcripts(
+                db, meeting_id, transcript_data,
+                synced_until=max(t.start or 0.0 for t in vexa_transcripts),
+                replaced_segments=[t.start for t in revised_segments] + dropped_segments
+            )
             
-            print(f"📝 Synced {len(new_transcripts)} transcripts for meeting {meeting_id}")
+            logger.info(f"📝 Synced {len(new_transcripts)} new transcripts for meeting {meeting_id}")
             
             return [TranscriptResponse.from_orm(t) for t in new_transcripts]
             
         except Exception as e:
-            print(f"❌ Error syncing transcripts: {str(e)}")
+            logger.error(f"❌ Error syncing transcripts: {str(e)}")
             raise Exception(f"Failed to sync transcripts: {str(e)}")
     
+    async def read_transcripts(
+        self, 
+        db: AsyncSession, 
+        meeting_id: str, 
+        user_id: str, 
+        since: Optional[datetime] = None
+    ) -> List[TranscriptResponse]:
+        """
+        Read a live meeting's transcripts from the database
+        
+        Ingestion is owned by the background worker; this only joins a sync that
+        is already running (or triggers one if the stored data is stale) before
+        reading, so concurrent viewers never fan out into extra Vexa calls.
+        
+        Args:
+            db: Database session
+            meeting_id: Meeting ID
+            user_id: User ID
+            since: created_at of the newest transcript the client already has
+            
+        Returns:
+            Transcript items stored after `since`, or all of them without a cursor
+            
+        Raises:
+            Exception: If the meeting is not found or has ended
+        """
+        # Imported here to avoid a circular import with the ingestion worker
+        from .transcript_ingestion import transcript_ingestion
+        
+        meeting = await crud.get_meeting_by_id(db, meeting_id, user_id)
+        if not meeting:
+            raise Exception("Meeting not found")
+        
+        if meeting.status == "ended":
+            raise Exception("Meeting has ended. No longer syncing transcripts to avoid server overload.")
+        
+        if meeting.status == "active" and meeting.vexa_meeting_id:
+            await transcript_ingestion.ensure_fresh(meeting_id, user_id)
+        
+        if since is not None:
+            return await self.get_transcripts_since(db, meeting_id, user_id, since)
+        
+        transcripts = await crud.get_transcripts_by_meeting(db, meeting_id, user_id)
+        return [TranscriptResponse.from_orm(t) for t in transcripts]
+    
+    async def get_transcripts_since(
+        self, 
+        db: AsyncSession, 
+        meeting_id: str, 
+        user_id: str, 
+        since: datetime
+    ) -> List[TranscriptResponse]:
+        """
+        Get transcripts stored after a client-side cursor
+        
+        Args:
+            db: Database session
+            meeting_id: Meeting ID
+            user_id: User ID
+            since: created_at of the newest transcript the client already has
+            
+        Returns:
+            Transcript items stored after the cursor
+        """
+        # Stored timestamps are naive UTC
+        if since.tzinfo is not None:
+            since = since.astimezone(timezone.utc).replace(tzinfo=None)
+        
+        transcripts = await crud.get_transcripts_since(db, meeting_id, user_id, since)
+        return [TranscriptResponse.from_orm(t) for t in transcripts]
+    
+    async def get_transcripts_in_range(
+        self, 
+        db: AsyncSession, 
+        meeting_id: str, 
+        user_id: str, 
+        start_seconds: float, 
+        end_seconds: float
+    ) -> List[TranscriptResponse]:
+        """
+        Get the transcript segments of a time window of the meeting (live or ended)
+        
+        Args:
+            db: Database session
+            meeting_id: Meeting ID
+            user_id: User ID
+            start_seconds: Window start, in seconds from the start of the recording
+            end_seconds: Window end (exclusive)
+            
+        Returns:
+            Transcript items starting inside the window, in meeting-time order
+        """
+        transcripts = await crud.get_transcripts_in_range(db, meeting_id, user_id, start_seconds, end_seconds)
+        return [TranscriptResponse.from_orm(t) for t in transcripts]
+    
     async def end_meeting(
         self, 
         db: AsyncSession, 
         meeting_id: str, 
         user_id: str, 
         end_data: MeetingEnd
-    ) -> MeetingResponse:
+    ) -> Tuple[MeetingResponse, Job]:
         """
-        End a meeting, stop the bot, and generate AI summary
+        End a meeting and queue its post-processing
+        
+        The meeting is marked ended right away; stopping the bot, the final
+        transcript sync and the AI summary run in a `finalize_meeting` job.
         
         Args:
             db: Database session
@@ -247,80 +423,127 @@ class DashboardService:
             end_data: Meeting end data
             
         Returns:
-            Updated meeting with summary
+            Updated meeting and the queued finalize job
             
         Raises:
             Exception: If ending meeting fails
         """
         try:
-            print(f"🔍 DEBUG: Attempting to end meeting - meeting_id: {meeting_id}, user_id: {user_id}")
-            print(f"🔍 DEBUG: end_data: {end_data}, type: {type(end_data)}")
-            
             # Handle case where end_data might be None
             if end_data is None:
-                print(f"⚠️ DEBUG: end_data is None, creating default")
                 end_data = MeetingEnd(user_notes=None)
             
-            print(f"🔍 DEBUG: end_data.user_notes: {getattr(end_data, 'user_notes', 'ATTRIBUTE_NOT_FOUND')}")
-            
             meeting = await crud.get_meeting_by_id(db, meeting_id, user_id)
-            print(f"🔍 DEBUG: Meeting found: {meeting is not None}")
             
             if not meeting:
-                print(f"❌ DEBUG: Meeting not found - meeting_id: {meeting_id}, user_id: {user_id}")
-                # Let's try to get the meeting without user_id check
-                from sqlalchemy import select
-                from .models import Meeting
-                result = await db.execute(select(Meeting).where(Meeting.id == meeting_id))
-                meeting_any_user = result.scalar_one_or_none()
-                if meeting_any_user:
-                    print(f"🔍 DEBUG: Meeting exists but with different user_id: {meeting_any_user.user_id}")
-                else:
-                    print(f"🔍 DEBUG: Meeting does not exist in database at all")
+                logger.warning("Meeting not found - meeting_id: %s, user_id: %s", meeting_id, user_id)
                 raise Exception("Meeting not found")
             
-            print(f"🔍 DEBUG: Meeting details - status: {meeting.status}, vexa_id: {meeting.vexa_meeting_id}")
+            logger.debug("🔍 Ending meeting %s - status: %s, vexa_id: %s", meeting_id, meeting.status, meeting.vexa_meeting_id)
             
-            # Stop Vexa bot if it's running
-            if meeting.vexa_meeting_id and meeting.status == "active":
-                try:
-                    # Use native meeting ID for stopping the bot
-                    native_meeting_id = vexa_service.extract_meeting_id_from_url(meeting.meeting_url)
-                    await vexa_service.stop_bot(native_meeting_id)
-                    print(f"🛑 Stopped Vexa bot for meeting {meeting_id}")
-                except Exception as e:
-                    print(f"⚠️ Failed to stop Vexa bot: {str(e)}")
-                    # Continue even if stopping bot fails
+            bot_running = bool(meeting.vexa_meeting_id) and meeting.status == "active"
             
             # End the meeting - safely get user_notes
             user_notes = None
             if end_data and hasattr(end_data, 'user_notes'):
                 user_notes = end_data.user_notes
             
-            print(f"🔍 DEBUG: Calling crud.end_meeting with user_notes: {user_notes}")
             meeting = await crud.end_meeting(db, meeting_id, user_id, user_notes)
-            print(f"🔍 DEBUG: Meeting after ending: {meeting is not None}")
             
-            # Sync final transcripts
-            try:
-                await self.sync_transcripts(db, meeting_id, user_id)
-            except Exception as e:
-                print(f"⚠️ Failed to sync final transcripts: {str(e)}")
-            
-            # Generate AI summary
-            try:
-                await self.generate_meeting_summary(db, meeting_id, user_id)
-            except Exception as e:
-                print(f"⚠️ Failed to generate AI summary: {str(e)}")
+            # Post-processing runs in the job queue; the key makes repeated end calls share one job
+            job = await job_queue.enqueue(
+                user_id,
+                "finalize_meeting",
+                {"meeting_id": meeting_id, "stop_bot": bot_running},
+                idempotency_key=f"finalize_meeting:{meeting_id}"
+            )
             
-            print(f"✅ Meeting {meeting_id} ended successfully")
+            logger.info(f"✅ Meeting {meeting_id} ended successfully, finalize job {job.id} queued")
             
-            return MeetingResponse.from_orm(meeting)
+            return MeetingResponse.from_orm(meeting), job
             
         except Exception as e:
-            print(f"❌ Error ending meeting: {str(e)}")
+            logger.error(f"❌ Error ending meeting: {str(e)}")
             raise Exception(f"Failed to end meeting: {str(e)}")
     
+    async def finalize_meeting(
+        self, 
+        db: AsyncSession, 
+        meeting_id: str, 
+        user_id: str, 
+        stop_bot: bool
+    ) -> None:
+        """
+        Post-meeting processing: stop the bot, sync final transcripts, generate the summary
+        
+        Runs from the `finalize_meeting` job. Every step is safe to repeat, so a
+        retried job does not duplicate work.
+        
+        Args:
+            db: Database session
+            meeting_id: Meeting ID
+            user_id: User ID
+            stop_bot: Whether the Vexa bot was still running when the meeting ended
+            
+        Raises:
+            Exception: If summary generation fails (the job is retried)
+        """
+        meeting = await crud.get_meeting_by_id(db, meeting_id, user_id)
+        if not meeting:
+            raise Exception("Meeting not found")
+        
+        # Stop Vexa bot if it's running
+        if stop_bot:
+            try:
+                # Use native meeting ID for stopping the bot
+                native_meeting_id = vexa_service.extract_meeting_id_from_url(meeting.meeting_url)
+                await vexa_service.stop_bot(native_meeting_id)
+                logger.info(f"🛑 Stopped Vexa bot for meeting {meeting_id}")
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to stop Vexa bot: {str(e)}")
+                # Continue even if stopping bot fails
+        
+        # Sync final transcripts (publishing them to live streams), then close the streams
+        if meeting.vexa_meeting_id:
+            from .transcript_ingestion import transcript_ingestion
+            try:
+                await transcript_ingestion.ingest(meeting_id, user_id, final=True)
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to sync final transcripts: {str(e)}")
+        transcript_broadcaster.publish(meeting_id, None)
+        
+        # The transcript is complete: compact its rows into the meeting's archive
+        if settings.TRANSCRIPT_ARCHIVE_ENABLED:
+            try:
+                archive = await crud.archive_meeting_transcripts(db, meeting_id, user_id)
+                if archive:
+                    logger.info(f"🗜️ Archived {archive.segment_count} transcript segments for meeting {meeting_id} ({len(archive.data)} bytes)")
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to archive transcripts: {str(e)}")
+        
+        # Make the finished transcript searchable
+        try:
+            indexed = await crud.index_meeting_transcript(db, meeting_id, user_id)
+            if indexed:
+                logger.info(f"🔎 Indexed transcript of meeting {meeting_id} as {indexed} search documents")
+        except Exception as e:
+            await db.rollback()
+            logger.warning(f"⚠️ Failed to index transcript for search: {str(e)}")
+        
+        # Generate AI summary
+        await self.generate_meeting_summary(db, meeting_id, user_id)
+        
+        # Embed the transcript and summary for semantic search
+        try:
+            await job_queue.enqueue(
+                user_id,
+                "embed_meeting",
+                {"meeting_id": meeting_id},
+                idempotency_key=f"embed_meeting:{meeting_id}"
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to queue embedding of meeting {meeting_id}: {str(e)}")
+    
     async def update_meeting_notes(
         self, 
         db: AsyncSession, 
@@ -352,7 +575,7 @@ class DashboardService:
             return MeetingResponse.from_orm(meeting)
             
         except Exception as e:
-            print(f"❌ Error updating meeting notes: {str(e)}")
+            logger.error(f"❌ Error updating meeting notes: {str(e)}")
             raise Exception(f"Failed to update notes: {str(e)}")
     
     async def delete_meeting(
@@ -381,9 +604,9 @@ class DashboardService:
             if meeting.vexa_meeting_id and meeting.status == "active":
                 try:
                     await vexa_service.stop_bot(meeting.vexa_meeting_id)
-                    print(f"🛑 Stopped Vexa bot before deleting meeting {meeting_id}")
+                    logger.info(f"🛑 Stopped Vexa bot before deleting meeting {meeting_id}")
                 except Exception as e:
-                    print(f"⚠️ Failed to stop Vexa bot: {str(e)}")
+                    logger.warning(f"⚠️ Failed to stop Vexa bot: {str(e)}")
             
             # Delete the meeting
             success = await crud.delete_meeting(db, meeting_id, user_id)
@@ -391,12 +614,12 @@ class DashboardService:
             if not success:
                 raise Exception("Failed to delete meeting")
             
-            print(f"🗑️ Deleted meeting {meeting_id}")
+            logger.info(f"🗑️ Deleted meeting {meeting_id}")
             
             return MessageResponse(message="Meeting deleted successfully")
             
         except Exception as e:
-            print(f"❌ Error deleting meeting: {str(e)}")
+            logger.error(f"❌ Error deleting meeting: {str(e)}")
             raise Exception(f"Failed to delete meeting: {str(e)}")
 
     async def generate_meeting_summary(
@@ -408,6 +631,10 @@ class DashboardService:
         """
         Generate AI-powered meeting summary and save to database
         
+        If running notes were maintained while the meeting was live, only the
+        remaining delta is folded in and the summary is written from the notes;
+        otherwise the full transcript is summarized.
+        
         Args:
             db: Database session
             meeting_id: Meeting ID
@@ -422,21 +649,13 @@ class DashboardService:
             if not meeting:
                 raise Exception("Meeting not found")
             
-            # Get all transcripts for the meeting
-            transcripts = await crud.get_transcripts_by_meeting(db, meeting_id, user_id)
-            
-            if not transcripts:
-                print(f"⚠️ No transcripts found for meeting {meeting_id}, skipping summary generation")
+            transcript_text = await self._summary_source_text(db, meeting)
+            if not transcript_text:
+                logger.warning(f"⚠️ No transcripts found for meeting {meeting_id}, skipping summary generation")
                 return
             
-            # Format transcripts for AI processing
-            transcript_text = "\n".join([
-                f"[{transcript.timestamp or 'Unknown'}] {transcript.speaker or 'Unknown'}: {transcript.text}"
-                for transcript in transcripts
-            ])
-            
             # Generate AI summary using GPT-4o
-            print(f"🤖 Generating AI summary for meeting {meeting_id}")
+            logger.info(f"🤖 Generating AI summary for meeting {meeting_id}")
             summary_response = await openai_service.summarize_meeting(
                 transcript_text=transcript_text,
                 meeting_context=f"Meeting URL: {meeting.meeting_url}, Platform: {meeting.meeting_platform}"
@@ -450,16 +669,104 @@ class DashboardService:
                 summary_response.summary
             )
             
-            print(f"✅ AI summary generated successfully for meeting {meeting_id}")
+            logger.info(f"✅ AI summary generated successfully for meeting {meeting_id}")
             
         except Exception as e:
-            print(f"❌ Error generating meeting summary: {str(e)}")
+            logger.error(f"❌ Error generating meeting summary: {str(e)}")
             raise Exception(f"Failed to generate summary: {str(e)}")
 
-    async def get_dashboard_overview(
+    async def stream_meeting_summary(
         self, 
         db: AsyncSession, 
+        meeting_id: str, 
         user_id: str
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Generate the meeting summary, streaming the text as it is written
+        
+        Follows GET /meetings/{id}/summary: the summary is only generated for an
+        ended meeting without one, and it is saved once the stream completes. In
+        every other case the current summary is returned straight away.
+        
+        Args:
+            db: Database session
+            meeting_id: Meeting ID
+            user_id: User ID
+            
+        Yields:
+            ("delta", text) chunks of the summary, then ("done", {"meeting_id", "summary", "summary_generated_at"})
+            
+        Raises:
+            Exception: If the meeting is not found or summary generation fails
+        """
+        meeting = await crud.get_meeting_by_id(db, meeting_id, user_id)
+        if not meeting:
+            raise Exception("Meeting not found")
+        
+        if not meeting.summary and meeting.status == "ended":
+            try:
+                transcript_text = await self._summary_source_text(db, meeting)
+                if transcript_text:
+                    logger.info(f"🤖 Streaming AI summary for meeting {meeting_id}")
+                    async for event, data in openai_service.stream_summary(
+                        transcript_text=transcript_text,
+                        meeting_context=f"Meeting URL: {meeting.meeting_url}, Platform: {meeting.meeting_platform}"
+                    ):
+                        if event == "delta":
+                            yield event, data
+                        else:
+                            meeting = await crud.update_meeting_summary(db, meeting_id, user_id, data.summary)
+                    
+                    logger.info(f"✅ AI summary streamed successfully for meeting {meeting_id}")
+                else:
+                    logger.warning(f"⚠️ No transcripts found for meeting {meeting_id}, skipping summary generation")
+            except Exception as e:
+                logger.error(f"❌ Error streaming meeting summary: {str(e)}")
+                raise Exception(f"Failed to generate summary: {str(e)}")
+        
+        yield "done", {
+            "meeting_id": meeting_id,
+            "summary": meeting.summary,
+            "summary_generated_at": meeting.summary_generated_at
+        }
+
+    async def _summary_source_text(self, db: AsyncSession, meeting: Meeting) -> Optional[str]:
+        """
+        Text to summarize for a meeting
+        
+        If running notes were maintained while the meeting was live, the remaining
+        delta is folded in and the notes are returned; otherwise the full transcript.
+        
+        Returns:
+            Text to summarize, or None if the meeting has no transcripts
+        """
+        transcript_text = None
+        if meeting.rolling_summary:
+            # Finalization pass: fold the last delta, then summarize the running notes
+            try:
+                transcript_text = await rolling_summarizer.flush(meeting.id, meeting.user_id)
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to finalize rolling summary, summarizing full transcript: {str(e)}")
+        
+        if not transcript_text:
+            rolling_summarizer.cancel(meeting.id)
+            
+            # Get all transcripts for the meeting
+            transcripts = await crud.get_transcripts_by_meeting(db, meeting.id, meeting.user_id)
+            
+            if not transcripts:
+                return None
+            
+            # Format transcripts for AI processing
+            transcript_text = format_transcript_lines(transcripts)
+        
+        return transcript_text
+
+    async def get_dashboard_overview(
+        self, 
+        db: AsyncSession, 
+        user_id: str, 
+        timezone: Optional[str] = None
     ) -> dict:
         """
         Get dashboard overview with stats, recent meetings, and heatmap data
@@ -467,50 +774,41 @@ class DashboardService:
         Args:
             db: Database session
             user_id: User ID
+            timezone: User's IANA timezone for month and year boundaries
             
         Returns:
             Dictionary with dashboard overview data
         """
-        try:
-            # Get statistics
-            total_meetings = await crud.count_meetings_by_user(db, user_id)
-            total_summaries = await crud.count_summaries_by_user(db, user_id)
-            total_tasks = await crud.count_action_items_by_user(db, user_id)
-            meetings_this_month = await crud.count_meetings_by_user_this_month(db, user_id)
-            summaries_this_month = await crud.count_summaries_by_user_this_month(db, user_id)
-            avg_meeting_duration = await crud.get_avg_meeting_duration_by_user(db, user_id)
+        async def compute() -> dict:
+            # Get statistics in one aggregated query
+            stats = await crud.get_dashboard_stats(db, user_id, timezone)
             
             # Get recent meetings (last 5)
-            recent_meetings = await crud.get_meetings_by_user(db, user_id, skip=0, limit=5)
+            recent_meetings = await crud.get_meetings_by_user(db, user_id, limit=5)
             recent_meetings_response = [MeetingResponse.from_orm(meeting) for meeting in recent_meetings]
             
             # Get heatmap data for current year
-            heatmap_data = await crud.get_meeting_heatmap_data(db, user_id)
-            
-            stats = {
-                "total_meetings": total_meetings,
-                "total_summaries": total_summaries,
-                "total_tasks": total_tasks,
-                "meetings_this_month": meetings_this_month,
-                "summaries_this_month": summaries_this_month,
-                "avg_meeting_duration_minutes": avg_meeting_duration
-            }
+            heatmap_data = await crud.get_meeting_heatmap_data(db, user_id, timezone=timezone)
             
             return {
                 "stats": stats,
                 "recent_meetings": recent_meetings_response,
                 "heatmap_data": heatmap_data
             }
+        
+        try:
+            return await dashboard_cache.get_or_compute(user_id, "overview", {"timezone": timezone}, compute)
             
         except Exception as e:
-            print(f"❌ Error getting dashboard overview: {str(e)}")
+            logger.error(f"❌ Error getting dashboard overview: {str(e)}")
             raise Exception(f"Failed to get dashboard overview: {str(e)}")
 
 
     async def get_dashboard_stats(
         self, 
         db: AsyncSession, 
-        user_id: str
+        user_id: str, 
+        timezone: Optional[str] = None
     ) -> dict:
         """
         Get dashboard statistics only
@@ -518,31 +816,106 @@ class DashboardService:
         Args:
             db: Database session
             user_id: User ID
+            timezone: User's IANA timezone for month boundaries
             
         Returns:
             Dictionary with dashboard statistics
         """
         try:
-            total_meetings = await crud.count_meetings_by_user(db, user_id)
-            total_summaries = await crud.count_summaries_by_user(db, user_id)
-            total_tasks = await crud.count_action_items_by_user(db, user_id)
-            meetings_this_month = await crud.count_meetings_by_user_this_month(db, user_id)
-            summaries_this_month = await crud.count_summaries_by_user_this_month(db, user_id)
-            avg_meeting_duration = await crud.get_avg_meeting_duration_by_user(db, user_id)
-            
-            return {
-                "total_meetings": total_meetings,
-                "total_summaries": total_summaries,
-                "total_tasks": total_tasks,
-                "meetings_this_month": meetings_this_month,
-                "summaries_this_month": summaries_this_month,
-                "avg_meeting_duration_minutes": avg_meeting_duration
-            }
+            return await dashboard_cache.get_or_compute(
+                user_id, "stats", {"timezone": timezone},
+                lambda: crud.get_dashboard_stats(db, user_id, timezone)
+            )
             
         except Exception as e:
-            print(f"❌ Error getting dashboard stats: {str(e)}")
+            logger.error(f"❌ Error getting dashboard stats: {str(e)}")
             raise Exception(f"Failed to get dashboard stats: {str(e)}")
 
+    async def get_action_item_stats(
+        self, 
+        db: AsyncSession, 
+        user_id: str, 
+        timezone: Optional[str] = None
+    ) -> dict:
+        """
+        Get open, done and overdue action item counts, overall and per assignee
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            timezone: User's IANA timezone for the overdue cutoff
+            
+        Returns:
+            Dictionary with action item counts
+        """
+        try:
+            return await dashboard_cache.get_or_compute(
+                user_id, "action_item_stats", {"timezone": timezone},
+                lambda: crud.get_action_item_stats(db, user_id, timezone)
+            )
+            
+        except Exception as e:
+            logger.error(f"❌ Error getting action item stats: {str(e)}")
+            raise Exception(f"Failed to get action item stats: {str(e)}")
+
+    async def get_heatmap_data(
+        self, 
+        db: AsyncSession, 
+        user_id: str, 
+        year: Optional[int] = None, 
+        timezone: Optional[str] = None
+    ) -> List[dict]:
+        """
+        Get meeting counts by date for the heatmap
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            year: Year to show (defaults to the user's current year)
+            timezone: User's IANA timezone
+            
+        Returns:
+            List of {date, meeting_count}
+        """
+        try:
+            return await dashboard_cache.get_or_compute(
+                user_id, "heatmap", {"year": year, "timezone": timezone},
+                lambda: crud.get_meeting_heatmap_data(db, user_id, year, timezone)
+            )
+            
+        except Exception as e:
+            logger.error(f"❌ Error getting heatmap data: {str(e)}")
+            raise Exception(f"Failed to get heatmap data: {str(e)}")
+
+    async def get_trends_data(
+        self, 
+        db: AsyncSession, 
+        user_id: str, 
+        days: int = 7, 
+        timezone: Optional[str] = None
+    ) -> List[dict]:
+        """
+        Get meeting and summary counts for the last N days
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            days: Number of days, ending today
+            timezone: User's IANA timezone for day buckets
+            
+        Returns:
+            List of per-day counts
+        """
+        try:
+            return await dashboard_cache.get_or_compute(
+                user_id, "trends", {"days": days, "timezone": timezone},
+                lambda: crud.get_meeting_trends_data(db, user_id, days, timezone)
+            )
+            
+        except Exception as e:
+            logger.error(f"❌ Error getting trends data: {str(e)}")
+            raise Exception(f"Failed to get trends data: {str(e)}")
+
 
 # Global service instance
 dashboard_service = DashboardService() 
\ No newline at end of file
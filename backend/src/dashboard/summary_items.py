@@ -0,0 +1,103 @@
+import json
+import re
+from datetime import date
+from typing import Dict, List, Optional
+
+# Parsing of the free-form text columns that back the normalized tags and
+# action_items tables. Summaries store action items as JSON written by
+# several producers: structured notes (TaskItem dicts), the summary
+# endpoints (whatever the client sent) and older rows, so parsing accepts
+# dicts under a few key spellings, plain strings, and non-JSON text with
+# one task per line. The tags strings also carry markers the application
+# writes for itself (SYSTEM_TAGS); those are not user tags and are skipped.
+
+TAG_MAX_LENGTH = 50
+TASK_NAME_MAX_LENGTH = 255
+ASSIGNEE_MAX_LENGTH = 100
+
+# Written into summaries.tags to mark generated structured notes
+SYSTEM_TAGS = frozenset({"ai_generated", "structured_notes"})
+
+# Assignee values that mean nobody in particular
+_UNASSIGNED = {"", "tbd", "n/a", "none", "unassigned"}
+
+_LIST_MARKER = re.compile(r"^\s*(?:[-*•]|\d+[.)])\s*")
+
+
+def parse_tags(raw: Optional[str]) -> List[str]:
+    """
+    Split a comma-separated tag string into normalized tag names
+    
+    Returns:
+        Distinct trimmed, lower-cased tags in their original order, without SYSTEM_TAGS
+    """
+    tags = []
+    for part in (raw or "").split(","):
+        tag = part.strip().lower()[:TAG_MAX_LENGTH]
+        if tag and tag not in SYSTEM_TAGS and tag not in tags:
+            tags.append(tag)
+    return tags
+
+
+def _parse_deadline(value) -> Optional[date]:
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(str(value).strip()[:10])
+    except ValueError:
+        return None
+
+
+def _parse_assignee(value) -> Optional[str]:
+    assignee = str(value or "").strip()
+    if assignee.lower() in _UNASSIGNED:
+        return None
+    return assignee[:ASSIGNEE_MAX_LENGTH]
+
+
+def _first(item: Dict, *keys: str):
+    for key in keys:
+        if item.get(key):
+            return item[key]
+    return None
+
+
+def parse_action_items(raw: Optional[str]) -> List[Dict]:
+    """
+    Parse a summary's action_items column into task fields
+    
+    Returns:
+        One dict per task with task_name, description, assignee and deadline,
+        in their original order
+    """
+    if not raw or not raw.strip():
+        return []
+    
+    try:
+        items = json.loads(raw)
+    except ValueError:
+        items = [_LIST_MARKER.sub("", line).strip() for line in raw.splitlines()]
+    if not isinstance(items, list):
+        items = [items]
+    
+    tasks = []
+    for item in items:
+        if isinstance(item, dict):
+            name = _first(item, "task_name", "task", "title", "name", "description", "task_description")
+            if not name:
+                continue
+            description = _first(item, "task_description", "description", "details")
+            tasks.append({
+                "task_name": str(name).strip()[:TASK_NAME_MAX_LENGTH],
+                "description": str(description) if description else None,
+                "assignee": _parse_assignee(_first(item, "assignee", "owner", "assigned_to")),
+                "deadline": _parse_deadline(_first(item, "deadline", "due_date", "due")),
+            })
+        elif isinstance(item, str) and item.strip():
+            tasks.append({
+                "task_name": item.strip()[:TASK_NAME_MAX_LENGTH],
+                "description": None,
+                "assignee": None,
+                "deadline": None,
+            })
+    return tasks
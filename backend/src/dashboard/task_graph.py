@@ -0,0 +1,139 @@
+import logging
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Marks a step without a fallback: its failure fails the whole graph
+_REQUIRED = object()
+
+
+class StepLimiter:
+    """
+    Bounds the pipeline steps running at once, globally and per user
+
+    A step may issue several OpenAI requests (map-reduce condensing), so these
+    limits sit above the OpenAI client's request semaphore rather than sharing
+    it. Per-user semaphores exist only while that user has steps in flight.
+    """
+
+    def __init__(self, max_steps: int, max_steps_per_user: int):
+        self.max_steps_per_user = max_steps_per_user
+        self._global = asyncio.Semaphore(max_steps)
+        self._users: Dict[str, asyncio.Semaphore] = {}
+        self._holders: Dict[str, int] = {}
+
+    @asynccontextmanager
+    async def slot(self, user_id: str):
+        """Hold one of the user's step slots and one global slot"""
+        semaphore = self._users.get(user_id)
+        if semaphore is None:
+            semaphore = self._users[user_id] = asyncio.Semaphore(self.max_steps_per_user)
+        self._holders[user_id] = self._holders.get(user_id, 0) + 1
+        try:
+            async with semaphore:
+                async with self._global:
+                    yield
+        finally:
+            self._holders[user_id] -= 1
+            if not self._holders[user_id]:
+                del self._holders[user_id]
+                del self._users[user_id]
+
+
+class _Step:
+    def __init__(self, name: str, func: Callable[..., Awaitable[Any]], depends_on: Sequence[str], fallback: Any):
+        self.name = name
+        self.func = func
+        self.depends_on = tuple(depends_on)
+        self.fallback = fallback
+
+
+class TaskGraph:
+    """
+    Runs the steps of a generation pipeline as a dependency graph
+
+    Each step starts as soon as the steps it depends on have finished, so
+    independent steps (typically separate LLM calls) run concurrently and the
+    pipeline takes as long as its longest path rather than the sum of its steps.
+    A failing step with a fallback yields the fallback instead, and the error
+    is kept in `errors`; the remaining steps still produce their results.
+    """
+
+    def __init__(self, user_id: str, limiter: Optional[StepLimiter] = None):
+        self.user_id = user_id
+        self.limiter = limiter or step_limiter
+        self.errors: Dict[str, str] = {}
+        self._steps: List[_Step] = []
+
+    def add(
+        self,
+        name: str,
+        func: Callable[..., Awaitable[Any]],
+        depends_on: Sequence[str] = (),
+        fallback: Any = _REQUIRED
+    ) -> None:
+        """
+        Add a step to the graph
+
+        Args:
+            name: Step name, used as its key in the results
+            func: Coroutine function called with the results of its dependencies as keyword arguments
+            depends_on: Names of previously added steps whose results the step needs
+            fallback: Result used if the step fails; without one, a failure fails the graph
+
+        Raises:
+            ValueError: If the name is taken or a dependency has not been added
+        """
+        names = {step.name for step in self._steps}
+        if name in names:
+            raise ValueError(f"Duplicate step: {name}")
+        missing = [dependency for dependency in depends_on if dependency not in names]
+        if missing:
+            raise ValueError(f"Step {name} depends on unknown steps: {', '.join(missing)}")
+        self._steps.append(_Step(name, func, depends_on, fallback))
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        Run every step, independent ones concurrently
+
+        Returns:
+            Step results (or fallbacks) by name
+
+        Raises:
+            Exception: The error of the first failed step without a fallback;
+                the other steps are cancelled
+        """
+        tasks: Dict[str, asyncio.Future] = {}
+
+        async def run_step(step: _Step) -> Any:
+            # Wait for dependencies before taking a slot so waiting steps don't hold one
+            inputs = {dependency: await tasks[dependency] for dependency in step.depends_on}
+            try:
+                async with self.limiter.slot(self.user_id):
+                    return await step.func(**inputs)
+            except Exception as e:
+                if step.fallback is _REQUIRED:
+                    raise
+                logger.warning(f"⚠️ Step '{step.name}' failed, continuing with partial results: {str(e)}")
+                self.errors[step.name] = str(e)
+                return step.fallback
+
+        for step in self._steps:
+            tasks[step.name] = asyncio.ensure_future(run_step(step))
+
+        try:
+            results = await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            raise
+
+        return dict(zip(tasks.keys(), results))
+
+
+# Global step limiter instance
+step_limiter = StepLimiter(settings.NOTES_MAX_CONCURRENT_STEPS, settings.NOTES_MAX_CONCURRENT_STEPS_PER_USER)
@@ -0,0 +1,109 @@
+import json
+import zlib
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence
+
+from .models import Transcript
+
+# Archive format of an ended meeting's transcript: one zlib-compressed JSON
+# document holding parallel columns instead of one object per segment.
+# Speakers are dictionary-encoded (a meeting has a handful of speakers and
+# thousands of lines) and created_at is stored as microsecond deltas from the
+# previous segment, so the repetitive parts compress to almost nothing and
+# the text column dominates the size. Version 2 added the start/end offset
+# columns; version 1 archives decode with no offsets.
+
+ARCHIVE_FORMAT_VERSION = 2
+_READABLE_VERSIONS = (1, 2)
+
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def encode_transcripts(transcripts: Sequence[Transcript]) -> bytes:
+    """
+    Encode transcript segments (in display order) into an archive blob
+
+    Args:
+        transcripts: Transcript rows or decoded archive segments
+
+    Returns:
+        Compressed archive payload
+    """
+    speakers: List[str] = []
+    speaker_codes: Dict[str, int] = {}
+    speaker_column: List[int] = []
+    created_at_deltas: List[int] = []
+    previous: Optional[datetime] = None
+
+    for transcript in transcripts:
+        if transcript.speaker is None:
+            speaker_column.append(-1)
+        else:
+            if transcript.speaker not in speaker_codes:
+                speaker_codes[transcript.speaker] = len(speakers)
+                speakers.append(transcript.speaker)
+            speaker_column.append(speaker_codes[transcript.speaker])
+
+        created_at = transcript.created_at
+        created_at_deltas.append(0 if previous is None else (created_at - previous) // _MICROSECOND)
+        previous = created_at
+
+    payload = {
+        "version": ARCHIVE_FORMAT_VERSION,
+        "id": [transcript.id for transcript in transcripts],
+        "speakers": speakers,
+        "speaker": speaker_column,
+        "timestamp": [transcript.timestamp for transcript in transcripts],
+        "start": [transcript.start_seconds for transcript in transcripts],
+        "end": [transcript.end_seconds for transcript in transcripts],
+        "text": [transcript.text for transcript in transcripts],
+        "created_at_start": transcripts[0].created_at.isoformat() if transcripts else None,
+        "created_at_delta_us": created_at_deltas,
+    }
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return zlib.compress(raw, 9)
+
+
+def decode_transcripts(meeting_id: str, data: bytes) -> List[Transcript]:
+    """
+    Decode an archive blob back into transcript segments
+
+    The segments are transient Transcript instances (never added to a
+    session), so code written against transcript rows reads them unchanged.
+
+    Args:
+        meeting_id: Meeting the archive belongs to
+        data: Compressed archive payload
+
+    Returns:
+        Transcript segments in display order
+
+    Raises:
+        ValueError: If the archive was written in an unknown format
+    """
+    payload = json.loads(zlib.decompress(data))
+    if payload.get("version") not in _READABLE_VERSIONS:
+        raise ValueError(f"Unsupported transcript archive version: {payload.get('version')}")
+
+    speakers = payload["speakers"]
+    no_offsets = [None] * len(payload["id"])
+    starts = payload.get("start", no_offsets)
+    ends = payload.get("end", no_offsets)
+    transcripts = []
+    created_at = datetime.fromisoformat(payload["created_at_start"]) if payload["created_at_start"] else None
+
+    for position, segment_id in enumerate(payload["id"]):
+        created_at += payload["created_at_delta_us"][position] * _MICROSECOND
+        speaker_code = payload["speaker"][position]
+        transcripts.append(Transcript(
+            id=segment_id,
+            meeting_id=meeting_id,
+            speaker=speakers[speaker_code] if speaker_code >= 0 else None,
+            text=payload["text"][position],
+            timestamp=payload["timestamp"][position],
+            start_seconds=starts[position],
+            end_seconds=ends[position],
+            created_at=created_at
+        ))
+
+    return transcripts
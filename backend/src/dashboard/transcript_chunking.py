@@ -0,0 +1,91 @@
+import re
+from typing import List
+
+# tiktoken is optional; without it token counts are estimated from characters
+try:
+    import tiktoken
+    _ENCODING = tiktoken.get_encoding("o200k_base")
+    TIKTOKEN_AVAILABLE = True
+except Exception:
+    _ENCODING = None
+    TIKTOKEN_AVAILABLE = False
+
+# Rough characters-per-token ratio for English text when tiktoken is unavailable
+CHARS_PER_TOKEN = 4
+
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+
+
+def count_tokens(text: str) -> int:
+    """Count (or estimate) the GPT-4o tokens in a piece of text"""
+    if not text:
+        return 0
+    if _ENCODING is not None:
+        return len(_ENCODING.encode(text, disallowed_special=()))
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def _split_oversized(turn: str, max_tokens: int) -> List[str]:
+    """Split a single speaker turn that is larger than a chunk on sentence, then word, boundaries"""
+    pieces = []
+    current = ""
+    for sentence in _SENTENCE_BOUNDARY.split(turn):
+        units = [sentence] if count_tokens(sentence) <= max_tokens else sentence.split(" ")
+        for unit in units:
+            candidate = f"{current} {unit}" if current else unit
+            if current and count_tokens(candidate) > max_tokens:
+                pieces.append(current)
+                current = unit
+            else:
+                current = candidate
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def group_sections(sections: List[str], max_tokens: int, separator: str = "\n") -> List[str]:
+    """
+    Pack consecutive sections into chunks of at most max_tokens without splitting a section
+
+    Sections larger than max_tokens are split on sentence boundaries first.
+    """
+    chunks = []
+    current: List[str] = []
+    current_tokens = 0
+    separator_tokens = count_tokens(separator)
+
+    for section in sections:
+        section_tokens = count_tokens(section)
+        if section_tokens > max_tokens:
+            if current:
+                chunks.append(separator.join(current))
+                current, current_tokens = [], 0
+            chunks.extend(_split_oversized(section, max_tokens))
+            continue
+
+        if current and current_tokens + separator_tokens + section_tokens > max_tokens:
+            chunks.append(separator.join(current))
+            current, current_tokens = [], 0
+
+        current.append(section)
+        current_tokens += section_tokens + (separator_tokens if len(current) > 1 else 0)
+
+    if current:
+        chunks.append(separator.join(current))
+
+    return chunks
+
+
+def chunk_transcript(transcript_text: str, max_tokens: int) -> List[str]:
+    """
+    Split a transcript into chunks of at most max_tokens on speaker-turn boundaries
+
+    Args:
+        transcript_text: Transcript with one speaker turn per line
+        max_tokens: Token budget per chunk
+
+    Returns:
+        List of transcript chunks, in order
+    """
+    turns = [line for line in transcript_text.splitlines() if line.strip()]
+    return group_sections(turns, max_tokens)
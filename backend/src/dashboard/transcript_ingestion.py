@@ -0,0 +1,201 @@
+import logging
+import asyncio
+import time
+from typing import Dict, List, Optional
+
+from database import AsyncSessionLocal
+from . import crud
+from .schemas import TranscriptResponse
+from .transcript_stream import transcript_broadcaster
+from .rolling_summary import rolling_summarizer
+
+logger = logging.getLogger(__name__)
+
+
+class TranscriptIngestionWorker:
+    """
+    Background scheduler that owns transcript ingestion for every active meeting
+
+    Each active meeting is polled on an adaptive interval: quickly while new
+    segments keep arriving and someone is watching, backing off when the
+    meeting is quiet or unwatched. All syncs for a meeting are single-flighted,
+    so concurrent API reads join the in-progress fetch instead of starting
+    their own. Upstream load scales with active meetings, not with viewers.
+    """
+
+    TICK_SECONDS = 1.0
+    MIN_POLL_INTERVAL_SECONDS = 2.0
+    WATCHED_MAX_POLL_INTERVAL_SECONDS = 5.0
+    IDLE_MAX_POLL_INTERVAL_SECONDS = 30.0
+    BACKOFF_FACTOR = 1.5
+    WATCH_WINDOW_SECONDS = 30.0  # A meeting counts as watched this long after an API read
+    MAX_CONCURRENT_SYNCS = 20
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SYNCS)
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self._intervals: Dict[str, float] = {}
+        self._next_poll_at: Dict[str, float] = {}
+        self._last_synced_at: Dict[str, float] = {}
+        self._last_read_at: Dict[str, float] = {}
+
+    async def start(self) -> None:
+        """Start the scheduler loop; called from the application lifespan"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the scheduler and wait for in-flight syncs to finish"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight.values(), return_exceptions=True)
+
+    async def ingest(self, meeting_id: str, user_id: str, final: bool = False) -> List[TranscriptResponse]:
+        """
+        Sync a meeting now, or join the sync already in progress for it
+
+        A final sync never joins a regular one: it waits for any sync in
+        progress to finish, then runs under the same single-flight, so it
+        cannot interleave its writes with a poll's.
+
+        Args:
+            meeting_id: Meeting ID
+            user_id: Owner of the meeting
+            final: Last sync after the meeting ended (from the finalize job)
+
+        Returns:
+            Transcript items written by the sync (the delta)
+
+        Raises:
+            Exception: If the sync fails or the meeting has ended
+        """
+        if final:
+            while meeting_id in self._in_flight:
+                await asyncio.gather(asyncio.shield(self._in_flight[meeting_id]), return_exceptions=True)
+
+        task = self._in_flight.get(meeting_id)
+        if task is None:
+            task = asyncio.create_task(self._sync(meeting_id, user_id, final))
+            self._in_flight[meeting_id] = task
+            task.add_done_callback(lambda t: self._forget_in_flight(meeting_id, t))
+
+        # Shield so a cancelled caller doesn't cancel the fetch others are waiting on
+        return await asyncio.shield(task)
+
+    async def ensure_fresh(self, meeting_id: str, user_id: str, max_age_seconds: Optional[float] = None) -> None:
+        """
+        Called before API reads: join an in-progress sync, or trigger one if the
+        stored transcripts are older than max_age_seconds. Errors are swallowed;
+        the caller reads whatever is in the database.
+        """
+        now = time.monotonic()
+        self._last_read_at[meeting_id] = now
+        max_age = max_age_seconds if max_age_seconds is not None else self.WATCHED_MAX_POLL_INTERVAL_SECONDS
+
+        last_synced = self._last_synced_at.get(meeting_id)
+        if meeting_id not in self._in_flight and last_synced is not None and now - last_synced < max_age:
+            return
+
+        try:
+            await self.ingest(meeting_id, user_id)
+        except Exception as e:
+            logger.warning(f"⚠️ On-demand transcript sync failed for meeting {meeting_id}: {str(e)}")
+
+    def _forget_in_flight(self, meeting_id: str, task: asyncio.Task) -> None:
+        if self._in_flight.get(meeting_id) is task:
+            del self._in_flight[meeting_id]
+
+    def _is_watched(self, meeting_id: str, now: float) -> bool:
+        if transcript_broadcaster.subscriber_count(meeting_id) > 0:
+            return True
+        last_read = self._last_read_at.get(meeting_id)
+        return last_read is not None and now - last_read < self.WATCH_WINDOW_SECONDS
+
+    def _schedule_next(self, meeting_id: str, got_new_segments: bool) -> None:
+        """Adapt the meeting's poll interval to its activity and audience"""
+        now = time.monotonic()
+        if got_new_segments:
+            interval = self.MIN_POLL_INTERVAL_SECONDS
+        else:
+            interval = self._intervals.get(meeting_id, self.MIN_POLL_INTERVAL_SECONDS) * self.BACKOFF_FACTOR
+
+        max_interval = (
+            self.WATCHED_MAX_POLL_INTERVAL_SECONDS if self._is_watched(meeting_id, now)
+            else self.IDLE_MAX_POLL_INTERVAL_SECONDS
+        )
+        interval = min(interval, max_interval)
+
+        self._intervals[meeting_id] = interval
+        self._next_poll_at[meeting_id] = now + interval
+
+    def _forget(self, meeting_id: str) -> None:
+        for state in (self._intervals, self._next_poll_at, self._last_synced_at, self._last_read_at):
+            state.pop(meeting_id, None)
+
+    async def _sync(self, meeting_id: str, user_id: str, final: bool = False) -> List[TranscriptResponse]:
+        # Imported here to avoid a circular import with the dashboard service
+        from .service import dashboard_service
+
+        async with self._semaphore:
+            try:
+                async with AsyncSessionLocal() as db:
+                    delta = await dashboard_service.sync_transcripts(db, meeting_id, user_id, final=final)
+            except Exception as e:
+                if "Meeting has ended" in str(e):
+                    transcript_broadcaster.publish(meeting_id, None)
+                    self._forget(meeting_id)
+                else:
+                    self._schedule_next(meeting_id, got_new_segments=False)
+                raise
+
+        self._last_synced_at[meeting_id] = time.monotonic()
+        self._schedule_next(meeting_id, got_new_segments=bool(delta))
+
+        if delta:
+            transcript_broadcaster.publish(meeting_id, delta)
+            rolling_summarizer.notify(meeting_id, user_id)
+
+        return delta
+
+    async def _poll(self, meeting_id: str, user_id: str) -> None:
+        try:
+            await self.ingest(meeting_id, user_id)
+        except Exception as e:
+            if "Meeting has ended" not in str(e):
+                logger.warning(f"⚠️ Transcript ingestion failed for meeting {meeting_id}: {str(e)}")
+
+    async def _run(self) -> None:
+        logger.info("📡 Transcript ingestion worker started")
+        while True:
+            try:
+                async with AsyncSessionLocal() as db:
+                    active_meetings = await crud.get_active_meetings(db)
+
+                now = time.monotonic()
+                active_ids = set()
+                for meeting_id, user_id in active_meetings:
+                    active_ids.add(meeting_id)
+                    if meeting_id in self._in_flight:
+                        continue
+                    if now >= self._next_poll_at.get(meeting_id, 0.0):
+                        asyncio.create_task(self._poll(meeting_id, user_id))
+
+                # Drop state for meetings that are no longer active
+                for meeting_id in list(self._next_poll_at):
+                    if meeting_id not in active_ids and meeting_id not in self._in_flight:
+                        self._forget(meeting_id)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Error in transcript ingestion loop: {str(e)}")
+
+            await asyncio.sleep(self.TICK_SECONDS)
+
+
+# Global worker instance
+transcript_ingestion = TranscriptIngestionWorker()
@@ -0,0 +1,92 @@
+import logging
+import asyncio
+import json
+from typing import Dict, List, Optional, Set
+
+from .schemas import TranscriptResponse
+
+logger = logging.getLogger(__name__)
+
+# Comment line sent on idle streams so proxies don't close them
+SSE_HEARTBEAT_SECONDS = 15.0
+
+# Queued in place of the backlog of a subscriber that fell too far behind
+RESYNC = object()
+
+
+class TranscriptBroadcaster:
+    """
+    Fans out live transcript segments to every subscriber of a meeting
+
+    Deltas are published by the transcript ingestion worker, which owns the
+    single upstream sync per meeting; N viewers of a meeting cost nothing extra.
+    Subscribers receive only the new or revised segments of each sync.
+    """
+
+    SUBSCRIBER_QUEUE_SIZE = 100
+
+    def __init__(self):
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+
+    def subscribe(self, meeting_id: str) -> asyncio.Queue:
+        """
+        Register a subscriber for a meeting
+
+        Args:
+            meeting_id: Meeting ID
+
+        Returns:
+            Queue receiving lists of TranscriptResponse, None once the meeting has
+            ended, or RESYNC if the subscriber was dropped for falling behind
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.setdefault(meeting_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, meeting_id: str, queue: asyncio.Queue) -> None:
+        """Remove a subscriber"""
+        subscribers = self._subscribers.get(meeting_id)
+        if subscribers is None:
+            return
+
+        subscribers.discard(queue)
+        if not subscribers:
+            del self._subscribers[meeting_id]
+
+    def subscriber_count(self, meeting_id: str) -> int:
+        """Number of live subscribers for a meeting"""
+        return len(self._subscribers.get(meeting_id, ()))
+
+    def publish(self, meeting_id: str, transcripts: Optional[List[TranscriptResponse]]) -> None:
+        """
+        Push a transcript delta (or None to signal the end of the meeting) to all subscribers
+
+        Subscribers that fall too far behind are dropped: their backlog is
+        replaced with RESYNC, so the stream tells the client to reconnect with
+        a `since` cursor and catch up from the database.
+        """
+        for queue in list(self._subscribers.get(meeting_id, ())):
+            try:
+                queue.put_nowait(transcripts)
+            except asyncio.QueueFull:
+                logger.warning(f"⚠️ Dropping slow transcript subscriber for meeting {meeting_id}")
+                self.unsubscribe(meeting_id, queue)
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(RESYNC)
+
+    async def shutdown(self) -> None:
+        """Signal end-of-stream to all subscribers; called from the application lifespan"""
+        for meeting_id in list(self._subscribers):
+            self.publish(meeting_id, None)
+        self._subscribers.clear()
+
+
+def format_sse_event(event: str, transcripts: List[TranscriptResponse]) -> str:
+    """Format a transcript batch as a Server-Sent Events message"""
+    data = json.dumps([t.model_dump(mode="json") for t in transcripts])
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+# Global broadcaster instance
+transcript_broadcaster = TranscriptBroadcaster()
@@ -1,3 +1,4 @@
+import logging
 import httpx
 import re
 from typing import Optional, Dict, Any, List
@@ -5,13 +6,28 @@ from urllib.parse import urlparse
 from settings import settings
 from .schemas import VexaBotRequest, VexaBotResponse, VexaTranscriptResponse, VexaTranscriptItem, VexaTranscriptSegment
 
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional h2 package (installed with httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 
 class VexaService:
     """Service for interacting with Vexa.ai API"""
     
+    # Per-operation timeouts
+    CREATE_BOT_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+    GET_TRANSCRIPTS_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+    STOP_BOT_TIMEOUT = httpx.Timeout(15.0, connect=5.0)
+    
     def __init__(self):
         self.base_url = "http://74.161.160.54:18056"
         self.api_key = settings.VEXA_ADMIN_KEY
+        self._client: Optional[httpx.AsyncClient] = None
         
         if not self.api_key or self.api_key == "your-vexa-admin-key-here":
             raise ValueError(
@@ -20,6 +36,39 @@ class VexaService:
                 "Get your API key from: https://vexa.ai/get-started"
             )
     
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create the pooled keep-alive client shared by all Vexa calls"""
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self._get_headers(),
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=settings.VEXA_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.VEXA_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.VEXA_KEEPALIVE_EXPIRY
+            ),
+            timeout=self.CREATE_BOT_TIMEOUT
+        )
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared HTTP client (opened lazily if used outside the app lifespan)"""
+        if self._client is None or self._client.is_closed:
+            self._client = self._create_client()
+        return self._client
+    
+    async def startup(self) -> None:
+        """Open the shared HTTP client; called from the application lifespan"""
+        if self._client is None or self._client.is_closed:
+            self._client = self._create_client()
+        logger.info(f"🔌 Vexa HTTP client ready (HTTP/2: {HTTP2_AVAILABLE})")
+    
+    async def shutdown(self) -> None:
+        """Close the shared HTTP client and its pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
     def _get_headers(self) -> Dict[str, str]:
         """Get headers for Vexa API requests"""
         return {
@@ -92,43 +141,42 @@ class VexaService:
                 bot_name=bot_name
             )
             
-            print(f"🤖 Creating Vexa bot for meeting: {native_meeting_id}")
+            logger.info(f"🤖 Creating Vexa bot for meeting: {native_meeting_id}")
+            
+            response = await self.client.post(
+                "/bots",
+                json=request_data.model_dump(),
+                timeout=self.CREATE_BOT_TIMEOUT
+            )
+            
+            if response.status_code not in [200, 201]:
+                error_detail = response.text
+                logger.error(f"❌ Vexa bot creation failed: {response.status_code} - {error_detail}")
+                raise Exception(f"Failed to create bot: {response.status_code} - {error_detail}")
+            
+            result = response.json()
+            logger.info(f"✅ Vexa bot created successfully: {result}")
+            
+            # Parse the real API response format
+            bot_response = VexaBotResponse(**result)
+            
+            # Return the result in the expected format for internal use
+            return {
+                "meeting_id": str(bot_response.id),  # Use the bot ID as meeting_id
+                "bot_id": bot_response.bot_container_id or f"bot_{native_meeting_id}",
+                "status": bot_response.status,
+                "platform": bot_response.platform,
+                "native_meeting_id": bot_response.native_meeting_id,
+                "bot_name": bot_name,
+                "vexa_bot_id": bot_response.id,
+                "constructed_meeting_url": bot_response.constructed_meeting_url
+            }
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    f"{self.base_url}/bots",
-                    headers=self._get_headers(),
-                    json=request_data.model_dump()
-                )
-                
-                if response.status_code not in [200, 201]:
-                    error_detail = response.text
-                    print(f"❌ Vexa bot creation failed: {response.status_code} - {error_detail}")
-                    raise Exception(f"Failed to create bot: {response.status_code} - {error_detail}")
-                
-                result = response.json()
-                print(f"✅ Vexa bot created successfully: {result}")
-                
-                # Parse the real API response format
-                bot_response = VexaBotResponse(**result)
-                
-                # Return the result in the expected format for internal use
-                return {
-                    "meeting_id": str(bot_response.id),  # Use the bot ID as meeting_id
-                    "bot_id": bot_response.bot_container_id or f"bot_{native_meeting_id}",
-                    "status": bot_response.status,
-                    "platform": bot_response.platform,
-                    "native_meeting_id": bot_response.native_meeting_id,
-                    "bot_name": bot_name,
-                    "vexa_bot_id": bot_response.id,
-                    "constructed_meeting_url": bot_response.constructed_meeting_url
-                }
-                
         except httpx.RequestError as e:
-            print(f"❌ Network error creating Vexa bot: {str(e)}")
+            logger.error(f"❌ Network error creating Vexa bot: {str(e)}")
             raise Exception(f"Network error: {str(e)}")
         except Exception as e:
-            print(f"❌ Error creating Vexa bot: {str(e)}")
+            logger.error(f"❌ Error creating Vexa bot: {str(e)}")
             raise
     
     async def get_transcripts(self, native_meeting_id: str) -> List[VexaTranscriptItem]:
@@ -145,60 +193,60 @@ class VexaService:
             Exception: If transcript retrieval fails
         """
         try:
-            print(f"📝 Fetching transcripts for meeting: {native_meeting_id}")
+            logger.debug(f"📝 Fetching transcripts for meeting: {native_meeting_id}")
             
+            response = await self.client.get(
+                f"/transcripts/google_meet/{native_meeting_id}",
+                timeout=self.GET_TRANSCRIPTS_TIMEOUT
+            )
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(
-                    f"{self.base_url}/transcripts/google_meet/{native_meeting_id}",
-                    headers=self._get_headers()
-                )
-                
-                if response.status_code == 404:
-                    # No transcripts yet - this is normal for new meetings
-                    print(f"📝 No transcripts available yet for meeting: {native_meeting_id}")
-                    return []
-                
-                if response.status_code != 200:
-                    error_detail = response.text
-                    print(f"❌ Failed to get transcripts: {response.status_code} - {error_detail}")
-                    raise Exception(f"Failed to get transcripts: {response.status_code} - {error_detail}")
-                
-                result = response.json()
-                
-                # Parse the real API response format
-                transcript_response = VexaTranscriptResponse(**result)
-                
-                # Convert segments to legacy VexaTranscriptItem format for backward compatibility
-                transcripts = []
-                unknown_speaker_count = 0
-                for segment in transcript_response.segments:
-                    # Use absolute_start_time if available, otherwise use start time
-                    time_str = segment.absolute_start_time or f"{segment.start}s"
-                    
-                    # Handle None speaker values with fallback
-                    speaker_name = segment.speaker or "Unknown Speaker"
-                    if not segment.speaker:
-                        unknown_speaker_count += 1
-                    
-                    transcript_item = VexaTranscriptItem(
-                        time=time_str,
-                        speaker=speaker_name,
-                        text=segment.text
-                    )
-                    transcripts.append(transcript_item)
-                
-                if unknown_speaker_count > 0:
-                    print(f"⚠️ Found {unknown_speaker_count} segments with unknown speakers, using fallback names")
+            if response.status_code == 404:
+                # No transcripts yet - this is normal for new meetings
+                logger.debug(f"📝 No transcripts available yet for meeting: {native_meeting_id}")
+                return []
+            
+            if response.status_code != 200:
+                error_detail = response.text
+                logger.error(f"❌ Failed to get transcripts: {response.status_code} - {error_detail}")
+                raise Exception(f"Failed to get transcripts: {response.status_code} - {error_detail}")
+            
+            result = response.json()
+            
+            # Parse the real API response format
+            transcript_response = VexaTranscriptResponse(**result)
+            
+            # Convert segments to legacy VexaTranscriptItem format for backward compatibility
+            transcripts = []
+            unknown_speaker_count = 0
+            for segment in transcript_response.segments:
+                # Use absolute_start_time if available, otherwise use start time
+                time_str = segment.absolute_start_time or f"{segment.start}s"
                 
-                print(f"✅ Retrieved {len(transcripts)} transcript items from {len(transcript_response.segments)} segments")
-                return transcripts
+                # Handle None speaker values with fallback
+                speaker_name = segment.speaker or "Unknown Speaker"
+                if not segment.speaker:
+                    unknown_speaker_count += 1
                 
+                transcript_item = VexaTranscriptItem(
+                    time=time_str,
+                    speaker=speaker_name,
+                    text=segment.text,
+                    start=segment.start,
+                    end=segment.end
+                )
+                transcripts.append(transcript_item)
+            
+            if unknown_speaker_count > 0:
+                logger.warning(f"⚠️ Found {unknown_speaker_count} segments with unknown speakers, using fallback names")
+            
+            logger.debug(f"✅ Retrieved {len(transcripts)} transcript items from {len(transcript_response.segments)} segments")
+            return transcripts
+            
         except httpx.RequestError as e:
-            print(f"❌ Network error getting transcripts: {str(e)}")
+            logger.error(f"❌ Network error getting transcripts: {str(e)}")
             raise Exception(f"Network error: {str(e)}")
         except Exception as e:
-            print(f"❌ Error getting transcripts: {str(e)}")
+            logger.error(f"❌ Error getting transcripts: {str(e)}")
             raise
     
     async def stop_bot(self, native_meeting_id: str) -> bool:
@@ -215,28 +263,26 @@ class VexaService:
             Exception: If stopping bot fails
         """
         try:
-            print(f"🛑 Stopping Vexa bot for meeting: {native_meeting_id}")
+            logger.info(f"🛑 Stopping Vexa bot for meeting: {native_meeting_id}")
             
+            response = await self.client.delete(
+                f"/bots/google_meet/{native_meeting_id}",
+                timeout=self.STOP_BOT_TIMEOUT
+            )
+            
+            if response.status_code not in [200, 204]:
+                error_detail = response.text
+                logger.error(f"❌ Failed to stop bot: {response.status_code} - {error_detail}")
+                raise Exception(f"Failed to stop bot: {response.status_code} - {error_detail}")
+            
+            logger.info(f"✅ Vexa bot stopped successfully")
+            return True
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.delete(
-                    f"{self.base_url}/bots/google_meet/{native_meeting_id}",
-                    headers=self._get_headers()
-                )
-                
-                if response.status_code not in [200, 204]:
-                    error_detail = response.text
-                    print(f"❌ Failed to stop bot: {response.status_code} - {error_detail}")
-                    raise Exception(f"Failed to stop bot: {response.status_code} - {error_detail}")
-                
-                print(f"✅ Vexa bot stopped successfully")
-                return True
-                
         except httpx.RequestError as e:
-            print(f"❌ Network error stopping bot: {str(e)}")
+            logger.error(f"❌ Network error stopping bot: {str(e)}")
             raise Exception(f"Network error: {str(e)}")
         except Exception as e:
-            print(f"❌ Error stopping bot: {str(e)}")
+            logger.error(f"❌ Error stopping bot: {str(e)}")
             raise
 
 
@@ -1,11 +1,78 @@
+import logging
 from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 import os
+import time
 from pathlib import Path
 
 from settings import settings
 
+logger = logging.getLogger(__name__)
+
+
+class PoolMetrics:
+    """Counters for connection checkouts: how often and how long callers waited for a connection"""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def record(self, wait_seconds: float, timed_out: bool) -> None:
+        if timed_out:
+            self.timeouts += 1
+        else:
+            self.checkouts += 1
+        self.total_wait_seconds += wait_seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+    def snapshot(self) -> dict:
+        attempts = self.checkouts + self.timeouts
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": round(self.total_wait_seconds / attempts * 1000, 3) if attempts else 0.0,
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+        }
+
+
+class _TimedPoolMixin:
+    # One engine per pool class, so metrics live on the class and survive pool.recreate()
+    metrics: PoolMetrics
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.metrics.record(time.perf_counter() - start, timed_out=False)
+        return connection
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    metrics = PoolMetrics()
+
+
+class TimedAsyncAdaptedQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    metrics = PoolMetrics()
+
+
+# Pool sizing shared by both engines; SQL echo is off unless DB_ECHO=true
+engine_options = {
+    "echo": settings.DB_ECHO,
+    "pool_size": settings.DB_POOL_SIZE,
+    "max_overflow": settings.DB_MAX_OVERFLOW,
+    "pool_timeout": settings.DB_POOL_TIMEOUT,
+    "pool_recycle": settings.DB_POOL_RECYCLE,
+    "pool_pre_ping": settings.DB_POOL_PRE_PING,
+}
+
 # Get the absolute path to the backend directory
 backend_dir = Path(__file__).parent.parent
 database_path = backend_dir / "aftertalk.db"
@@ -16,26 +83,28 @@ if settings.DATABASE_URL and 'postgresql' in settings.DATABASE_URL:
     async_database_url = settings.DATABASE_URL.replace('postgresql://', 'postgresql+asyncpg://')
     async_engine = create_async_engine(
         async_database_url,
-        echo=True
+        poolclass=TimedAsyncAdaptedQueuePool,
+        **engine_options
     )
     
     # For sync PostgreSQL connection using psycopg2
     sync_database_url = settings.DATABASE_URL.replace('postgresql://', 'postgresql+psycopg2://')
-    sync_engine = create_engine(sync_database_url, echo=True)
+    sync_engine = create_engine(sync_database_url, poolclass=TimedQueuePool, **engine_options)
 else:
     # Fallback to SQLite for development
-    print(f"⚠️  No PostgreSQL DATABASE_URL found, using SQLite for development")
-    print(f"📁 Database path: {database_path}")
+    logger.warning(f"⚠️  No PostgreSQL DATABASE_URL found, using SQLite for development")
+    logger.info(f"📁 Database path: {database_path}")
     
     sqlite_url = f"sqlite+aiosqlite:///{database_path}"
     sqlite_sync_url = f"sqlite:///{database_path}"
     
     async_engine = create_async_engine(
         sqlite_url,
-        echo=True
+        poolclass=TimedAsyncAdaptedQueuePool,
+        **engine_options
     )
     
-    sync_engine = create_engine(sqlite_sync_url, echo=True)
+    sync_engine = create_engine(sqlite_sync_url, poolclass=TimedQueuePool, **engine_options)
 
 AsyncSessionLocal = sessionmaker(
     bind=async_engine,
@@ -62,4 +131,26 @@ def get_sync_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+def get_pool_stats() -> dict:
+    """
+    Snapshot of both connection pools
+
+    Returns:
+        Per-engine pool size, checked-in/checked-out connections, current
+        overflow, and checkout wait-time counters since startup
+    """
+    stats = {}
+    for name, engine in (("async", async_engine.sync_engine), ("sync", sync_engine)):
+        pool = engine.pool
+        stats[name] = {
+            "pool_size": pool.size(),
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),
+            **pool.metrics.snapshot(),
+        }
+    return stats
\ No newline at end of file
@@ -1,3 +1,4 @@
+import logging
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
@@ -8,6 +9,8 @@ from auth.models import User
 from .service import google_calendar_service
 from .schemas import UpcomingEventsResponse
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api/calendar", tags=["calendar"])
 
 
@@ -35,7 +38,7 @@ async def get_upcoming_events(
         return events_response
         
     except Exception as e:
-        print(f"❌ Error in get_upcoming_events: {str(e)}")
+        logger.error(f"❌ Error in get_upcoming_events: {str(e)}")
         raise HTTPException(
             status_code=500,
             detail=f"Failed to fetch upcoming events: {str(e)}"
@@ -1,3 +1,4 @@
+import logging
 import httpx
 import re
 from typing import List, Optional
@@ -7,6 +8,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from auth.crud import get_google_calendar_integration
 from .schemas import CalendarEvent, CalendarAttendee, UpcomingEventsResponse
 
+logger = logging.getLogger(__name__)
+
 
 class GoogleCalendarService:
     """Service for interacting with Google Calendar API"""
@@ -127,7 +130,7 @@ class GoogleCalendarService:
                 )
                 
                 if response.status_code != 200:
-                    print(f"❌ Calendar API error: {response.status_code} - {response.text}")
+                    logger.error(f"❌ Calendar API error: {response.status_code} - {response.text}")
                     return UpcomingEventsResponse(events=[], total_count=0)
                 
                 data = response.json()
@@ -182,7 +185,7 @@ class GoogleCalendarService:
                 )
                 
         except Exception as e:
-            print(f"❌ Error fetching calendar events: {str(e)}")
+            logger.error(f"❌ Error fetching calendar events: {str(e)}")
             return UpcomingEventsResponse(events=[], total_count=0)
 
 
@@ -0,0 +1 @@
+# Durable background job queue module
\ No newline at end of file
@@ -0,0 +1,45 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+
+from database import get_async_db
+from auth.dependencies import get_current_user
+from auth.models import User
+from . import crud
+from .schemas import JobResponse
+
+# Create jobs router
+jobs_router = APIRouter()
+
+
+@jobs_router.get("/{job_id}", response_model=JobResponse)
+async def get_job(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Get the status of a background job
+    
+    Poll until `status` is `succeeded` (the handler's output is in `result`)
+    or `failed` (the last error is in `last_error`).
+    """
+    job = await crud.get_job_by_id(db, job_id, current_user.id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+    return JobResponse.from_orm(job)
+
+
+@jobs_router.get("", response_model=List[JobResponse])
+async def list_jobs(
+    status_filter: Optional[str] = Query(None, alias="status", description="queued, running, succeeded or failed"),
+    limit: int = Query(50, ge=1, le=200, description="Maximum number of jobs to return"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """List the current user's most recent background jobs"""
+    jobs = await crud.get_jobs_by_user(db, current_user.id, status_filter, limit)
+    return [JobResponse.from_orm(job) for job in jobs]
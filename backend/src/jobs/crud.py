@@ -0,0 +1,184 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import select, and_, update
+from typing import Optional, List
+from datetime import datetime, timedelta
+import json
+
+from .models import Job
+
+
+async def get_job_by_id(db: AsyncSession, job_id: str, user_id: str) -> Optional[Job]:
+    """Get a job owned by the user"""
+    result = await db.execute(
+        select(Job).where(and_(Job.id == job_id, Job.user_id == user_id))
+    )
+    return result.scalar_one_or_none()
+
+
+async def get_job_by_idempotency_key(db: AsyncSession, idempotency_key: str) -> Optional[Job]:
+    """Get the job registered under an idempotency key"""
+    result = await db.execute(select(Job).where(Job.idempotency_key == idempotency_key))
+    return result.scalar_one_or_none()
+
+
+async def get_jobs_by_user(
+    db: AsyncSession,
+    user_id: str,
+    status: Optional[str] = None,
+    limit: int = 50
+) -> List[Job]:
+    """Get the user's most recent jobs, optionally filtered by status"""
+    query = select(Job).where(Job.user_id == user_id)
+    if status:
+        query = query.where(Job.status == status)
+    result = await db.execute(query.order_by(Job.created_at.desc()).limit(limit))
+    return result.scalars().all()
+
+
+async def create_job(
+    db: AsyncSession,
+    user_id: str,
+    job_type: str,
+    payload: dict,
+    max_attempts: int,
+    idempotency_key: Optional[str] = None
+) -> Job:
+    """
+    Create a queued job, or return the existing job for the idempotency key
+
+    A failed job with the same key is re-queued with fresh attempts.
+    """
+    if idempotency_key:
+        existing = await get_job_by_idempotency_key(db, idempotency_key)
+        if existing:
+            return await _requeue_failed(db, existing, max_attempts)
+
+    job = Job(
+        user_id=user_id,
+        job_type=job_type,
+        payload=json.dumps(payload),
+        idempotency_key=idempotency_key,
+        status="queued",
+        attempts=0,
+        max_attempts=max_attempts,
+        run_after=datetime.utcnow()
+    )
+    db.add(job)
+    try:
+        await db.commit()
+    except IntegrityError:
+        # Another request registered the same key concurrently
+        await db.rollback()
+        existing = await get_job_by_idempotency_key(db, idempotency_key)
+        return await _requeue_failed(db, existing, max_attempts)
+
+    await db.refresh(job)
+    return job
+
+
+async def _requeue_failed(db: AsyncSession, job: Job, max_attempts: int) -> Job:
+    if job.status != "failed":
+        return job
+
+    job.status = "queued"
+    job.attempts = 0
+    job.max_attempts = max_attempts
+    job.run_after = datetime.utcnow()
+    job.last_error = None
+    job.finished_at = None
+    await db.commit()
+    await db.refresh(job)
+    return job
+
+
+async def get_runnable_job_ids(db: AsyncSession, limit: int) -> List[str]:
+    """Get IDs of queued jobs that are due, oldest first"""
+    result = await db.execute(
+        select(Job.id)
+        .where(and_(Job.status == "queued", Job.run_after <= datetime.utcnow()))
+        .order_by(Job.run_after)
+        .limit(limit)
+    )
+    return [row[0] for row in result.all()]
+
+
+async def claim_job(db: AsyncSession, job_id: str) -> Optional[Job]:
+    """
+    Atomically move a queued job to running
+
+    The conditional UPDATE makes claiming safe across worker processes:
+    only one of them sees a row count of 1.
+    """
+    now = datetime.utcnow()
+    result = await db.execute(
+        update(Job)
+        .where(and_(Job.id == job_id, Job.status == "queued"))
+        .values(status="running", locked_at=now, attempts=Job.attempts + 1, updated_at=now)
+    )
+    await db.commit()
+    if result.rowcount != 1:
+        return None
+
+    result = await db.execute(select(Job).where(Job.id == job_id))
+    return result.scalar_one_or_none()
+
+
+async def heartbeat_job(db: AsyncSession, job_id: str) -> bool:
+    """
+    Refresh the lock of a running job so it is not re-queued as stale
+
+    Returns:
+        False if the job is no longer running (it was re-queued meanwhile)
+    """
+    now = datetime.utcnow()
+    result = await db.execute(
+        update(Job)
+        .where(and_(Job.id == job_id, Job.status == "running"))
+        .values(locked_at=now, updated_at=now)
+    )
+    await db.commit()
+    return result.rowcount == 1
+
+
+async def complete_job(db: AsyncSession, job_id: str, result: Optional[dict]) -> None:
+    """Mark a running job as succeeded and store its result"""
+    now = datetime.utcnow()
+    await db.execute(
+        update(Job)
+        .where(Job.id == job_id)
+        .values(
+            status="succeeded",
+            result=json.dumps(result) if result is not None else None,
+            last_error=None,
+            locked_at=None,
+            finished_at=now,
+            updated_at=now
+        )
+    )
+    await db.commit()
+
+
+async def fail_job(db: AsyncSession, job_id: str, error: str, retry_at: Optional[datetime]) -> None:
+    """Record a failed attempt: re-queue for retry_at, or mark failed when retry_at is None"""
+    now = datetime.utcnow()
+    values = {"last_error": error, "locked_at": None, "updated_at": now}
+    if retry_at is not None:
+        values.update(status="queued", run_after=retry_at)
+    else:
+        values.update(status="failed", finished_at=now)
+
+    await db.execute(update(Job).where(Job.id == job_id).values(**values))
+    await db.commit()
+
+
+async def requeue_stale_jobs(db: AsyncSession, lock_timeout: timedelta) -> int:
+    """Re-queue running jobs whose worker died (no heartbeat for longer than lock_timeout)"""
+    now = datetime.utcnow()
+    result = await db.execute(
+        update(Job)
+        .where(and_(Job.status == "running", Job.locked_at < now - lock_timeout))
+        .values(status="queued", locked_at=None, run_after=now, updated_at=now)
+    )
+    await db.commit()
+    return result.rowcount or 0
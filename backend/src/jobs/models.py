@@ -0,0 +1,38 @@
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Integer, Index
+from sqlalchemy.sql import func
+from database import Base
+import uuid
+
+
+class Job(Base):
+    """Durable background job (post-meeting processing, AI generation, Slack delivery)"""
+    __tablename__ = "jobs"
+    
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    user_id = Column(String, ForeignKey("users.id"), nullable=False, index=True)
+    
+    # What to run
+    job_type = Column(String(50), nullable=False)
+    payload = Column(Text, nullable=False)  # JSON arguments for the handler
+    idempotency_key = Column(String(255), nullable=True, unique=True)  # Same key -> same job
+    
+    # Execution state
+    status = Column(String(20), default="queued", nullable=False)  # queued, running, succeeded, failed
+    attempts = Column(Integer, default=0, nullable=False)
+    max_attempts = Column(Integer, default=5, nullable=False)
+    run_after = Column(DateTime, default=func.now(), nullable=False)  # Not picked up before this (retry backoff)
+    locked_at = Column(DateTime, nullable=True)  # Worker heartbeat: set on claim, refreshed while running
+    
+    # Outcome
+    result = Column(Text, nullable=True)  # JSON returned by the handler
+    last_error = Column(Text, nullable=True)
+    
+    # Timestamps
+    created_at = Column(DateTime, default=func.now())
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    finished_at = Column(DateTime, nullable=True)
+    
+    __table_args__ = (
+        # Worker claim query: next runnable job
+        Index("ix_jobs_status_run_after", "status", "run_after"),
+    )
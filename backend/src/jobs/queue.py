@@ -0,0 +1,209 @@
+import logging
+import asyncio
+import json
+import random
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from database import AsyncSessionLocal
+from settings import settings
+from . import crud
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[str, dict], Awaitable[Optional[dict]]]
+
+
+class JobQueue:
+    """
+    Durable, DB-backed job queue with an in-process asyncio worker pool
+
+    Jobs survive restarts because they live in the `jobs` table. Workers claim
+    a job with a conditional UPDATE, so several API processes can share one
+    queue. Failed attempts are retried with exponential backoff and jitter
+    until max_attempts. While a handler runs, its worker refreshes the job's
+    lock every JOB_HEARTBEAT_SECONDS; jobs left running by a crashed worker
+    are re-queued once their heartbeat is older than JOB_LOCK_TIMEOUT_SECONDS.
+
+    Handlers are registered per job type and receive (user_id, payload). They
+    must be idempotent, since a job can run more than once after a crash.
+    """
+
+    STALE_CHECK_INTERVAL_SECONDS = 60.0
+
+    def __init__(self):
+        self._handlers: Dict[str, JobHandler] = {}
+        self._workers: List[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._claimed: Optional[asyncio.Queue] = None
+        self._idle_workers = 0
+
+    def handler(self, job_type: str) -> Callable[[JobHandler], JobHandler]:
+        """Decorator registering the handler for a job type"""
+        def register(func: JobHandler) -> JobHandler:
+            self._handlers[job_type] = func
+            return func
+        return register
+
+    async def enqueue(
+        self,
+        user_id: str,
+        job_type: str,
+        payload: dict,
+        idempotency_key: Optional[str] = None,
+        max_attempts: Optional[int] = None
+    ) -> Job:
+        """
+        Persist a job and wake the workers
+
+        Args:
+            user_id: Owner of the job
+            job_type: Registered handler name
+            payload: JSON-serializable handler arguments
+            idempotency_key: Enqueuing twice with the same key returns the same job
+            max_attempts: Override for JOB_MAX_ATTEMPTS
+
+        Returns:
+            The queued (or existing) job
+
+        Raises:
+            Exception: If no handler is registered for job_type
+        """
+        if job_type not in self._handlers:
+            raise Exception(f"Unknown job type: {job_type}")
+
+        async with AsyncSessionLocal() as db:
+            job = await crud.create_job(
+                db, user_id, job_type, payload,
+                max_attempts or settings.JOB_MAX_ATTEMPTS,
+                idempotency_key
+            )
+
+        logger.info(f"📥 Queued job {job.id} ({job_type}), status: {job.status}")
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return job
+
+    async def start(self) -> None:
+        """Start the dispatcher and worker pool; called from the application lifespan"""
+        if self._workers:
+            return
+
+        self._wakeup = asyncio.Event()
+        self._claimed = asyncio.Queue()
+        self._idle_workers = settings.JOB_WORKER_CONCURRENCY
+
+        self._workers.append(asyncio.create_task(self._dispatch()))
+        for _ in range(settings.JOB_WORKER_CONCURRENCY):
+            self._workers.append(asyncio.create_task(self._work()))
+        logger.info(f"✅ Job queue started with {settings.JOB_WORKER_CONCURRENCY} workers")
+
+    async def stop(self) -> None:
+        """Stop the workers; interrupted jobs are re-queued once their lock times out"""
+        workers = self._workers
+        self._workers = []
+        for worker in workers:
+            worker.cancel()
+        if workers:
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    def _retry_at(self, attempts: int) -> datetime:
+        """Exponential backoff with jitter, capped at JOB_RETRY_MAX_SECONDS"""
+        delay = min(settings.JOB_RETRY_MAX_SECONDS, settings.JOB_RETRY_BASE_SECONDS * (2 ** (attempts - 1)))
+        return datetime.utcnow() + timedelta(seconds=random.uniform(delay / 2, delay))
+
+    async def _dispatch(self) -> None:
+        """Claim due jobs and hand them to idle workers"""
+        last_stale_check = 0.0
+        loop = asyncio.get_running_loop()
+
+        while True:
+            try:
+                if loop.time() - last_stale_check > self.STALE_CHECK_INTERVAL_SECONDS:
+                    last_stale_check = loop.time()
+                    async with AsyncSessionLocal() as db:
+                        requeued = await crud.requeue_stale_jobs(
+                            db, timedelta(seconds=settings.JOB_LOCK_TIMEOUT_SECONDS)
+                        )
+                    if requeued:
+                        logger.info(f"♻️ Re-queued {requeued} stale jobs")
+
+                # Only claim what idle workers can start right away
+                free_slots = self._idle_workers - self._claimed.qsize()
+                claimed_any = False
+                if free_slots > 0:
+                    async with AsyncSessionLocal() as db:
+                        for job_id in await crud.get_runnable_job_ids(db, free_slots):
+                            job = await crud.claim_job(db, job_id)
+                            if job is not None:
+                                self._claimed.put_nowait(job)
+                                claimed_any = True
+
+                if claimed_any:
+                    continue
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Error in job dispatcher: {str(e)}")
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=settings.JOB_POLL_INTERVAL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _work(self) -> None:
+        while True:
+            job = await self._claimed.get()
+            self._idle_workers -= 1
+            try:
+                await self._run(job)
+            finally:
+                self._idle_workers += 1
+                self._wakeup.set()
+
+    async def _heartbeat(self, job: Job) -> None:
+        """Keep a running job's lock fresh until cancelled"""
+        while True:
+            await asyncio.sleep(settings.JOB_HEARTBEAT_SECONDS)
+            try:
+                async with AsyncSessionLocal() as db:
+                    if not await crud.heartbeat_job(db, job.id):
+                        logger.warning(f"⚠️ Job {job.id} ({job.job_type}) is no longer running; it was re-queued")
+                        return
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to refresh lock of job {job.id}: {str(e)}")
+
+    async def _run(self, job: Job) -> None:
+        handler = self._handlers.get(job.job_type)
+        heartbeat = asyncio.create_task(self._heartbeat(job))
+        try:
+            if handler is None:
+                raise Exception(f"No handler registered for job type {job.job_type}")
+
+            logger.info(f"⚙️ Running job {job.id} ({job.job_type}), attempt {job.attempts}/{job.max_attempts}")
+            result = await handler(job.user_id, json.loads(job.payload))
+
+            async with AsyncSessionLocal() as db:
+                await crud.complete_job(db, job.id, result)
+            logger.info(f"✅ Job {job.id} ({job.job_type}) succeeded")
+
+        except asyncio.CancelledError:
+            # Shutdown: leave the job running; it is re-queued once its lock times out
+            raise
+        except Exception as e:
+            logger.error(f"❌ Job {job.id} ({job.job_type}) failed: {str(e)}")
+            retry_at = self._retry_at(job.attempts) if job.attempts < job.max_attempts else None
+            try:
+                async with AsyncSessionLocal() as db:
+                    await crud.fail_job(db, job.id, str(e), retry_at)
+            except Exception as db_error:
+                logger.error(f"❌ Failed to record job failure: {str(db_error)}")
+        finally:
+            heartbeat.cancel()
+
+
+# Global queue instance
+job_queue = JobQueue()
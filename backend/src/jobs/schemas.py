@@ -0,0 +1,28 @@
+from pydantic import BaseModel, Field, validator
+from typing import Optional, Any
+from datetime import datetime
+import json
+
+
+class JobResponse(BaseModel):
+    """Schema for background job status"""
+    id: str
+    job_type: str
+    status: str = Field(..., description="queued, running, succeeded or failed")
+    attempts: int
+    max_attempts: int
+    result: Optional[Any] = Field(None, description="Handler result once the job has succeeded")
+    last_error: Optional[str] = None
+    run_after: datetime
+    created_at: datetime
+    updated_at: datetime
+    finished_at: Optional[datetime] = None
+    
+    @validator('result', pre=True)
+    def parse_result(cls, value):
+        if isinstance(value, str):
+            return json.loads(value)
+        return value
+    
+    class Config:
+        from_attributes = True
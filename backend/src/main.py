@@ -1,43 +1,91 @@
-from fastapi import FastAPI, HTTPException
+import logging
+from fastapi import FastAPI, HTTPException, Header
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import uvicorn
+import secrets
 from contextlib import asynccontextmanager
+from typing import Optional
 
 from settings import settings
-from database import Base, async_engine
+from logging_config import configure_logging, shutdown_logging
+
+# Configure logging before the application modules create their loggers
+configure_logging()
+
+from database import async_engine, get_pool_stats
+from migrations.runner import run_migrations, find_missing_indexes
 from auth.api import auth_router
 from auth.two_factor_api import router as two_factor_router
 from auth.two_factor import init_cleanup_task
 from dashboard.api import dashboard_router
+from dashboard.vexa_service import vexa_service
+from dashboard.openai_service import openai_service
+from dashboard.transcript_stream import transcript_broadcaster
+from dashboard.transcript_ingestion import transcript_ingestion
+from dashboard.rolling_summary import rolling_summarizer
+from dashboard.dashboard_cache import dashboard_cache
 from slack.api import slack_router
+from jobs.api import jobs_router
+from jobs.queue import job_queue
+from search.api import search_router
 from google_calendar.api import router as calendar_router
 from user.api import user_router
 
 # Import models to register them with SQLAlchemy
 from auth.models import User, PasswordReset, SlackIntegration, GoogleCalendarIntegration
 from dashboard.models import Meeting, Transcript
+from jobs.models import Job
+from search.models import SearchDocument
+
+# Import job handlers to register them with the queue
+import dashboard.job_handlers
+import slack.job_handlers
+import search.job_handlers
+
+logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
-    print("🚀 Starting AfterTalk API...")
+    logger.info("🚀 Starting AfterTalk API...")
     
-    # Create database tables
+    # Apply pending schema migrations
     async with async_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(run_migrations)
+        missing_indexes = await conn.run_sync(find_missing_indexes)
     
-    print("✅ Database tables created successfully")
+    logger.info("✅ Database migrations applied successfully")
+    for entry in missing_indexes:
+        logger.warning(f"⚠️ No index on {entry['table']}({entry['columns']}) for {entry['query']}")
     
     # Initialize 2FA cleanup task
     init_cleanup_task()
-    print("✅ 2FA cleanup task initialized")
+    logger.info("✅ 2FA cleanup task initialized")
+    
+    # Open the shared Vexa HTTP client
+    await vexa_service.startup()
+    
+    # Start background transcript ingestion for active meetings
+    await transcript_ingestion.start()
+    
+    # Start the durable job queue workers
+    await job_queue.start()
     
     yield
     
     # Shutdown
-    print("🔄 Shutting down AfterTalk API...")
+    logger.info("🔄 Shutting down AfterTalk API...")
+    
+    await job_queue.stop()
+    await transcript_ingestion.stop()
+    await rolling_summarizer.shutdown()
+    await transcript_broadcaster.shutdown()
+    await vexa_service.shutdown()
+    await openai_service.shutdown()
+    await dashboard_cache.close()
+    shutdown_logging()
 
 
 # Create FastAPI application
@@ -55,6 +103,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Job-Id"],
 )
 
 
@@ -70,6 +119,15 @@ async def health_check():
     }
 
 
+# Internal database pool metrics
+@app.get("/internal/pool-stats", tags=["Internal"], include_in_schema=False)
+async def pool_stats(x_internal_key: Optional[str] = Header(None)):
+    """Connection pool usage for sizing workers against database connections; requires INTERNAL_API_KEY"""
+    if not settings.INTERNAL_API_KEY or not x_internal_key or not secrets.compare_digest(x_internal_key, settings.INTERNAL_API_KEY):
+        raise HTTPException(status_code=404, detail="Not found")
+    return get_pool_stats()
+
+
 # Include authentication routes
 app.include_router(auth_router, prefix="/api/auth", tags=["Authentication"])
 
@@ -82,6 +140,12 @@ app.include_router(dashboard_router, prefix="/api/dashboard", tags=["Dashboard"]
 # Include Slack integration routes
 app.include_router(slack_router, prefix="/api/slack", tags=["Slack Integration"])
 
+# Include background job routes
+app.include_router(jobs_router, prefix="/api/jobs", tags=["Jobs"])
+
+# Include full-text search routes
+app.include_router(search_router, prefix="/api/search", tags=["Search"])
+
 # Include calendar routes
 app.include_router(calendar_router, tags=["Calendar"])
 
@@ -0,0 +1 @@
+# Database schema migrations module
\ No newline at end of file
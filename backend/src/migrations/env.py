@@ -0,0 +1,78 @@
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import engine_from_config, pool
+
+from database import Base, sync_engine
+
+# Import models to register them with SQLAlchemy
+import auth.models
+import dashboard.models
+import jobs.models
+import search.models
+
+config = context.config
+target_metadata = Base.metadata
+
+# Full-text index objects created by hand in revision 0006; they have no
+# ORM counterpart, so autogenerate must not try to drop them
+_UNMANAGED_NAMES = ("search_documents_fts", "search_vector", "ix_search_documents_search_vector")
+
+
+def include_object(obj, name, type_, reflected, compare_to) -> bool:
+    """Leave the hand-written full-text search objects out of autogenerate"""
+    return not (reflected and compare_to is None and name and name.startswith(_UNMANAGED_NAMES))
+
+
+def run_migrations_offline() -> None:
+    """Emit migration SQL without a database connection (`alembic upgrade --sql`)"""
+    context.configure(
+        url=str(sync_engine.url),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        include_object=include_object,
+        render_as_batch=sync_engine.dialect.name == "sqlite",
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """
+    Run migrations on a live connection
+
+    The application passes its own connection through config.attributes
+    (see migrations.runner); the alembic CLI falls back to a fresh engine.
+    """
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _run(connection)
+        return
+
+    if config.config_file_name is not None:
+        fileConfig(config.config_file_name)
+    engine = engine_from_config(
+        {"sqlalchemy.url": sync_engine.url.render_as_string(hide_password=False)},
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool,
+    )
+    with engine.connect() as connection:
+        _run(connection)
+
+
+def _run(connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+        # SQLite can only ALTER tables through batch (copy-and-move) operations
+        render_as_batch=connection.dialect.name == "sqlite",
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
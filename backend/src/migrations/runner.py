@@ -0,0 +1,91 @@
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection
+
+MIGRATIONS_DIR = Path(__file__).parent
+
+# Known hot query shapes: (table, leading index columns, query it serves).
+# An index covers a shape when its leading columns match in order.
+QUERY_INDEXES: List[Tuple[str, Tuple[str, ...], str]] = [
+    ("meetings", ("user_id", "created_at"), "get_meetings_by_user / count_meetings_by_user"),
+    ("meetings", ("user_id", "meeting_date"), "get_meeting_heatmap_data / get_meeting_trends_data"),
+    ("meetings", ("status",), "get_active_meetings"),
+    ("summaries", ("user_id", "created_at"), "get_summaries_by_user / count_summaries_by_user"),
+    ("summaries", ("meeting_id", "created_at"), "get_summaries_by_meeting"),
+    ("transcripts", ("meeting_id", "created_at"), "get_transcripts_since"),
+    ("transcripts", ("meeting_id", "start_seconds"), "get_transcripts_by_meeting / get_transcripts_in_range / get_transcript_segments_from"),
+    ("comprehensive_notes", ("meeting_id", "user_id"), "get_comprehensive_notes_by_meeting"),
+    ("tags", ("user_id", "name"), "get_tag_counts / search_comprehensive_notes (tag filter)"),
+    ("action_items", ("user_id", "status"), "get_action_items / get_action_item_stats / get_dashboard_stats"),
+    ("action_items", ("user_id", "assignee"), "get_action_items / get_action_item_stats (per assignee)"),
+    ("jobs", ("status", "run_after"), "get_runnable_job_ids"),
+    ("jobs", ("user_id",), "get_jobs_by_user"),
+    ("llm_cache", ("expires_at",), "prune_llm_cache"),
+    ("search_documents", ("source_type", "source_id"), "search.indexer.remove_source"),
+    ("search_documents", ("meeting_id",), "delete_meeting"),
+    ("search_documents", ("user_id", "embedding_model"), "search.semantic.SemanticIndex._load"),
+]
+
+
+def _alembic_config(connection: Connection = None) -> Config:
+    config = Config()
+    config.set_main_option("script_location", str(MIGRATIONS_DIR))
+    if connection is not None:
+        config.attributes["connection"] = connection
+    return config
+
+
+def run_migrations(connection: Connection) -> None:
+    """
+    Upgrade the database to the latest revision
+
+    Runs on the application's own connection, e.g.
+    `await conn.run_sync(run_migrations)` from the lifespan.
+    """
+    command.upgrade(_alembic_config(connection), "head")
+
+
+def find_missing_indexes(connection: Connection) -> List[Dict[str, str]]:
+    """
+    Check the live schema against QUERY_INDEXES
+
+    Args:
+        connection: Sync connection (use `conn.run_sync` from async code)
+
+    Returns:
+        One entry per query shape with no index whose leading columns match
+    """
+    inspector = inspect(connection)
+    tables = set(inspector.get_table_names())
+    missing = []
+
+    for table, columns, query in QUERY_INDEXES:
+        if table not in tables:
+            missing.append({"table": table, "columns": ", ".join(columns), "query": query})
+            continue
+
+        prefixes = [tuple(index["column_names"][:len(columns)]) for index in inspector.get_indexes(table)]
+        prefixes += [tuple(constraint["column_names"][:len(columns)]) for constraint in inspector.get_unique_constraints(table)]
+        prefixes.append(tuple(inspector.get_pk_constraint(table)["constrained_columns"][:len(columns)]))
+
+        if columns not in prefixes:
+            missing.append({"table": table, "columns": ", ".join(columns), "query": query})
+
+    return missing
+
+
+if __name__ == "__main__":
+    # python -m migrations.runner: apply migrations and report uncovered query shapes
+    from database import sync_engine
+
+    with sync_engine.begin() as connection:
+        run_migrations(connection)
+        missing_indexes = find_missing_indexes(connection)
+
+    for entry in missing_indexes:
+        print(f"⚠️ No index on {entry['table']}({entry['columns']}) for {entry['query']}")
+    print("✅ Schema is up to date" if not missing_indexes else f"❌ {len(missing_indexes)} query shapes without an index")
@@ -0,0 +1,256 @@
+"""baseline schema
+
+Schema as it stood when migrations were introduced. Databases created
+earlier by `Base.metadata.create_all` and `migrate_db.py` are adopted: tables
+that already exist are left alone, and the columns `migrate_db.py` used to
+add are added where missing.
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-17 00:07:12.470789
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# Columns added by the former migrate_db.py to databases created before them
+LEGACY_COLUMNS = {
+    'users': [
+        sa.Column('surname', sa.String(length=100), nullable=True),
+        sa.Column('job_title', sa.String(length=150), nullable=True),
+        sa.Column('company', sa.String(length=150), nullable=True),
+        sa.Column('timezone', sa.String(length=50), nullable=True, server_default='UTC'),
+    ],
+    'meetings': [
+        sa.Column('name', sa.String(length=255), nullable=True),
+        sa.Column('transcript_synced_until', sa.Float(), nullable=True),
+        sa.Column('rolling_summary', sa.Text(), nullable=True),
+        sa.Column('rolling_summary_until', sa.DateTime(), nullable=True),
+    ],
+}
+
+
+def upgrade() -> None:
+    existing_tables = set(sa.inspect(op.get_bind()).get_table_names())
+
+    def create_table(name, *columns, indexes=()):
+        if name in existing_tables:
+            return
+        op.create_table(name, *columns)
+        for index_name, index_columns, unique in indexes:
+            op.create_index(index_name, name, index_columns, unique=unique)
+
+    create_table('llm_cache',
+        sa.Column('key', sa.String(length=64), nullable=False),
+        sa.Column('model', sa.String(length=50), nullable=False),
+        sa.Column('response', sa.Text(), nullable=False),
+        sa.Column('size_bytes', sa.Integer(), nullable=False),
+        sa.Column('hit_count', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('last_accessed_at', sa.DateTime(), nullable=True),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('key'),
+        indexes=[
+            ('ix_llm_cache_expires_at', ['expires_at'], False),
+            ('ix_llm_cache_last_accessed_at', ['last_accessed_at'], False),
+        ]
+    )
+    create_table('users',
+        sa.Column('id', sa.String(), nullable=False),
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('surname', sa.String(length=100), nullable=True),
+        sa.Column('email', sa.String(length=255), nullable=False),
+        sa.Column('hashed_password', sa.String(length=255), nullable=False),
+        sa.Column('avatar_url', sa.String(length=500), nullable=True),
+        sa.Column('job_title', sa.String(length=150), nullable=True),
+        sa.Column('company', sa.String(length=150), nullable=True),
+        sa.Column('timezone', sa.String(length=50), nullable=True),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+        sa.Column('is_email_verified', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        indexes=[
+            ('ix_users_email', ['email'], True),
+            ('ix_users_id', ['id'], False),
+        ]
+    )
+    create_table('google_calendar_integrations',
+        sa.Column('id', sa.String(), nullable=False),
+        sa.Column('user_id', sa.String(), nullable=False),
+        sa.Column('access_token', sa.String(), nullable=False),
+        sa.Column('refresh_token', sa.String(), nullable=True),
+        sa.Column('token_expires_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    create_table('jobs',
+        sa.Column('id', sa.String(), nullable=False),
+        sa.Column('user_id', sa.String(), nullable=False),
+        sa.Column('job_type', sa.String(length=50), nullable=False),
+        sa.Column('payload', sa.Text(), nullable=False),
+        sa.Column('idempotency_key', sa.String(length=255), nullable=True),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('max_attempts', sa.Integer(), nullable=False),
+        sa.Column('run_after', sa.DateTime(), nullable=False),
+        sa.Column('locked_at', sa.DateTime(), nullable=True),
+        sa.Column('result', sa.Text(), nullable=True),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('idempotency_key'),
+        indexes=[
+            ('ix_jobs_status_run_after', ['status', 'run_after'], False),
+            ('ix_jobs_user_id', ['user_id'], False),
+        ]
+    )
+    create_table('meetings',
+        sa.Column('id', sa.String(), nullable=False),
+        sa.Column('user_id', sa.String(), nullable=False),
+        sa.Column('name', sa.String(length=255), nullable=True),
+        sa.Column('meeting_url', sa.String(), nullable=False),
+        sa.Column('meeting_platform', sa.String(), nullable=True),
+        sa.Column('vexa_meeting_id', sa.String(), nullable=True),
+        sa.Column('bot_name', sa.String(), nullable=True),
+        sa.Column('status', sa.String(), nullable=True),
+        sa.Column('summary', sa.Text(), nullable=True),
+        sa.Column('summary_generated_at', sa.DateTime(), nullable=True),
+        sa.Column('user_notes', sa.Text(), nullable=True),
+        sa.Column('transcript_synced_until', sa.Float(), nullable=True),
+        sa.Column('rolling_summary', sa.Text(), nullable=True),
+        sa.Column('rolling_summary_until', sa.DateTime(), nullable=True),
+        sa.Column('meeting_date', sa.Date(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('ended_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    create_table('password_resets',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.String(), nullable=False),
+        sa.Column('token', sa.String(length=255), nullable=False),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('is_used', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        indexes=[
+            ('ix_password_resets_id', ['id'], False),
+            ('ix_password_resets_token', ['token'], True),
+        ]
+    )
+    create_table('slack_integrations',
+        sa.Column('id', sa.String(), nullable=False),
+        sa.Column('user_id', sa.String(), nullable=False),
+        sa.Column('workspace_id', sa.String(), nullable=False),
+        sa.Column('workspace_name', sa.String(), nullable=False),
+        sa.Column('workspace_url', sa.String(), nullable=True),
+        sa.Column('access_token', sa.String(), nullable=False),
+        sa.Column('user_access_token', sa.String(), nullable=True),
+        sa.Column('bot_user_id', sa.String(), nullable=False),
+        sa.Column('bot_access_token', sa.String(), nullable=False),
+        sa.Column('default_channel_id', sa.String(), nullable=True),
+        sa.Column('default_channel_name', sa.String(), nullable=True),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    create_table('comprehensive_notes',
+        sa.Column('id', sa.String(), nullable=False),
+        sa.Column('meeting_id', sa.String(), nullable=False),
+        sa.Column('user_id', sa.String(), nullable=False),
+        sa.Column('user_notes', sa.Text(), nullable=True),
+        sa.Column('ai_summary', sa.Text(), nullable=True),
+        sa.Column('transcript_highlights', sa.Text(), nullable=True),
+        sa.Column('comprehensive_notes', sa.Text(), nullable=True),
+        sa.Column('notes_version', sa.Integer(), nullable=True),
+        sa.Column('template_type', sa.String(), nullable=True),
+        sa.Column('tags', sa.String(), nullable=True),
+        sa.Column('is_favorite', sa.Boolean(), nullable=True),
+        sa.Column('include_ai_summary', sa.Boolean(), nullable=True),
+        sa.Column('include_user_notes', sa.Boolean(), nullable=True),
+        sa.Column('include_transcript_highlights', sa.Boolean(), nullable=True),
+        sa.Column('custom_prompt', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['meeting_id'], ['meetings.id'], ),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    create_table('summaries',
+        sa.Column('id', sa.String(), nullable=False),
+        sa.Column('meeting_id', sa.String(), nullable=False),
+        sa.Column('user_id', sa.String(), nullable=False),
+        sa.Column('title', sa.String(length=255), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('summary_type', sa.String(), nullable=True),
+        sa.Column('key_points', sa.Text(), nullable=True),
+        sa.Column('action_items', sa.Text(), nullable=True),
+        sa.Column('decisions', sa.Text(), nullable=True),
+        sa.Column('participants', sa.Text(), nullable=True),
+        sa.Column('tags', sa.String(), nullable=True),
+        sa.Column('is_favorite', sa.Boolean(), nullable=True),
+        sa.Column('word_count', sa.Integer(), nullable=True),
+        sa.Column('reading_time_minutes', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['meeting_id'], ['meetings.id'], ),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    create_table('transcripts',
+        sa.Column('id', sa.String(), nullable=False),
+        sa.Column('meeting_id', sa.String(), nullable=False),
+        sa.Column('speaker', sa.String(), nullable=True),
+        sa.Column('text', sa.Text(), nullable=False),
+        sa.Column('timestamp', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['meeting_id'], ['meetings.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+    # Bring pre-migration databases up to the baseline
+    inspector = sa.inspect(op.get_bind())
+    for table_name, columns in LEGACY_COLUMNS.items():
+        if table_name not in existing_tables:
+            continue
+        present = {column['name'] for column in inspector.get_columns(table_name)}
+        for column in columns:
+            if column.name not in present:
+                op.add_column(table_name, column)
+
+
+def downgrade() -> None:
+    op.drop_table('transcripts')
+    op.drop_table('summaries')
+    op.drop_table('comprehensive_notes')
+    op.drop_table('slack_integrations')
+    op.drop_index('ix_password_resets_token', table_name='password_resets')
+    op.drop_index('ix_password_resets_id', table_name='password_resets')
+    op.drop_table('password_resets')
+    op.drop_table('meetings')
+    op.drop_index('ix_jobs_user_id', table_name='jobs')
+    op.drop_index('ix_jobs_status_run_after', table_name='jobs')
+    op.drop_table('jobs')
+    op.drop_table('google_calendar_integrations')
+    op.drop_index('ix_users_id', table_name='users')
+    op.drop_index('ix_users_email', table_name='users')
+    op.drop_table('users')
+    op.drop_index('ix_llm_cache_last_accessed_at', table_name='llm_cache')
+    op.drop_index('ix_llm_cache_expires_at', table_name='llm_cache')
+    op.drop_table('llm_cache')
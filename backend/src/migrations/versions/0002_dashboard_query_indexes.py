@@ -0,0 +1,38 @@
+"""dashboard query indexes
+
+Composite indexes for the per-user dashboard queries: meeting lists and
+counts, heatmap/trends by meeting date, summaries and transcripts of a
+meeting, and the latest comprehensive notes of a meeting.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 00:07:57.901257
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_meetings_user_id_created_at', 'meetings', ['user_id', sa.text('created_at DESC')])
+    op.create_index('ix_meetings_user_id_meeting_date', 'meetings', ['user_id', 'meeting_date'])
+    op.create_index('ix_meetings_status', 'meetings', ['status'])
+    op.create_index('ix_summaries_user_id_created_at', 'summaries', ['user_id', sa.text('created_at DESC')])
+    op.create_index('ix_summaries_meeting_id_created_at', 'summaries', ['meeting_id', 'created_at'])
+    op.create_index('ix_transcripts_meeting_id_created_at', 'transcripts', ['meeting_id', 'created_at'])
+    op.create_index('ix_comprehensive_notes_meeting_id_user_id', 'comprehensive_notes', ['meeting_id', 'user_id', 'created_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_comprehensive_notes_meeting_id_user_id', table_name='comprehensive_notes')
+    op.drop_index('ix_transcripts_meeting_id_created_at', table_name='transcripts')
+    op.drop_index('ix_summaries_meeting_id_created_at', table_name='summaries')
+    op.drop_index('ix_summaries_user_id_created_at', table_name='summaries')
+    op.drop_index('ix_meetings_status', table_name='meetings')
+    op.drop_index('ix_meetings_user_id_meeting_date', table_name='meetings')
+    op.drop_index('ix_meetings_user_id_created_at', table_name='meetings')
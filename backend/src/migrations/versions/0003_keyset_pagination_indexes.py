@@ -0,0 +1,32 @@
+"""keyset pagination indexes
+
+Extend the (user_id, created_at DESC) indexes on meetings and summaries
+with id DESC, so keyset pages ordered by (created_at, id) are read
+straight from the index, ties included.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 00:48:12.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_meetings_user_id_created_at', table_name='meetings')
+    op.create_index('ix_meetings_user_id_created_at', 'meetings', ['user_id', sa.text('created_at DESC'), sa.text('id DESC')])
+    op.drop_index('ix_summaries_user_id_created_at', table_name='summaries')
+    op.create_index('ix_summaries_user_id_created_at', 'summaries', ['user_id', sa.text('created_at DESC'), sa.text('id DESC')])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_summaries_user_id_created_at', table_name='summaries')
+    op.create_index('ix_summaries_user_id_created_at', 'summaries', ['user_id', sa.text('created_at DESC')])
+    op.drop_index('ix_meetings_user_id_created_at', table_name='meetings')
+    op.create_index('ix_meetings_user_id_created_at', 'meetings', ['user_id', sa.text('created_at DESC')])
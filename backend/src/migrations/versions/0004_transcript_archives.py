@@ -0,0 +1,34 @@
+"""transcript archives
+
+One compressed columnar transcript per ended meeting, written by the
+finalize job in place of the meeting's transcripts rows.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 01:20:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'transcript_archives',
+        sa.Column('meeting_id', sa.String(), nullable=False),
+        sa.Column('format_version', sa.Integer(), nullable=False),
+        sa.Column('segment_count', sa.Integer(), nullable=False),
+        sa.Column('data', sa.LargeBinary(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['meeting_id'], ['meetings.id']),
+        sa.PrimaryKeyConstraint('meeting_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('transcript_archives')
@@ -0,0 +1,33 @@
+"""transcript timing columns
+
+Numeric segment start/end offsets on transcripts, indexed with the
+meeting so a transcript is read in meeting-time order, time ranges are
+index range scans and the sync looks segments up by start offset.
+Rows stored before this revision keep NULL offsets and sort by
+created_at.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 02:05:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('transcripts', sa.Column('start_seconds', sa.Float(), nullable=True))
+    op.add_column('transcripts', sa.Column('end_seconds', sa.Float(), nullable=True))
+    op.create_index('ix_transcripts_meeting_id_start_seconds', 'transcripts', ['meeting_id', 'start_seconds'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_transcripts_meeting_id_start_seconds', table_name='transcripts')
+    with op.batch_alter_table('transcripts') as batch_op:
+        batch_op.drop_column('end_seconds')
+        batch_op.drop_column('start_seconds')
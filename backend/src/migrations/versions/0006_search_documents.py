@@ -0,0 +1,136 @@
+"""search documents
+
+Searchable text of notes, summaries and ended meetings' transcripts,
+with a dialect-specific full-text index: a weighted tsvector generated
+column and GIN index on PostgreSQL, an external-content FTS5 table kept
+in sync by triggers on SQLite. Both live outside the ORM metadata
+(see include_object in migrations/env.py).
+
+Existing notes, summaries and meeting summaries are back-filled; transcripts are indexed
+when their meeting ends.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 03:10:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+
+POSTGRES_UPGRADE = [
+    """
+    ALTER TABLE search_documents ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('english', body), 'B')
+        ) STORED
+    """,
+    "CREATE INDEX ix_search_documents_search_vector ON search_documents USING gin (search_vector)",
+]
+
+SQLITE_UPGRADE = [
+    """
+    CREATE VIRTUAL TABLE search_documents_fts USING fts5(
+        title, body, content='search_documents', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER search_documents_ai AFTER INSERT ON search_documents BEGIN
+        INSERT INTO search_documents_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END
+    """,
+    """
+    CREATE TRIGGER search_documents_ad AFTER DELETE ON search_documents BEGIN
+        INSERT INTO search_documents_fts(search_documents_fts, rowid, title, body)
+        VALUES ('delete', old.id, old.title, old.body);
+    END
+    """,
+    """
+    CREATE TRIGGER search_documents_au AFTER UPDATE ON search_documents BEGIN
+        INSERT INTO search_documents_fts(search_documents_fts, rowid, title, body)
+        VALUES ('delete', old.id, old.title, old.body);
+        INSERT INTO search_documents_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END
+    """,
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS search_documents_au",
+    "DROP TRIGGER IF EXISTS search_documents_ad",
+    "DROP TRIGGER IF EXISTS search_documents_ai",
+    "DROP TABLE IF EXISTS search_documents_fts",
+]
+
+# Same text as search.indexer builds for notes and summaries
+BACKFILL = [
+    """
+    INSERT INTO search_documents (user_id, meeting_id, source_type, source_id, chunk, title, body, created_at)
+    SELECT user_id, meeting_id, 'notes', id, 0, tags,
+        CASE WHEN comprehensive_notes <> '' AND user_notes <> ''
+            THEN comprehensive_notes || '\n\n' || user_notes
+            ELSE coalesce(nullif(comprehensive_notes, ''), user_notes, '')
+        END,
+        created_at
+    FROM comprehensive_notes
+    WHERE coalesce(comprehensive_notes, '') <> '' OR coalesce(user_notes, '') <> '' OR coalesce(tags, '') <> ''
+    """,
+    """
+    INSERT INTO search_documents (user_id, meeting_id, source_type, source_id, chunk, title, body, created_at)
+    SELECT user_id, meeting_id, 'summary', id, 0, title, content, created_at
+    FROM summaries
+    """,
+    """
+    INSERT INTO search_documents (user_id, meeting_id, source_type, source_id, chunk, title, body, created_at)
+    SELECT user_id, id, 'summary', id, 0, name, summary, coalesce(summary_generated_at, created_at)
+    FROM meetings
+    WHERE coalesce(summary, '') <> ''
+    """,
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        'search_documents',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('user_id', sa.String(), nullable=False),
+        sa.Column('meeting_id', sa.String(), nullable=True),
+        sa.Column('source_type', sa.String(length=20), nullable=False),
+        sa.Column('source_id', sa.String(), nullable=False),
+        sa.Column('chunk', sa.Integer(), nullable=False),
+        sa.Column('title', sa.String(length=255), nullable=True),
+        sa.Column('body', sa.Text(), nullable=False),
+        sa.Column('start_seconds', sa.Float(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['meeting_id'], ['meetings.id']),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_search_documents_source_type_source_id', 'search_documents', ['source_type', 'source_id'])
+    op.create_index('ix_search_documents_meeting_id', 'search_documents', ['meeting_id'])
+    op.create_index('ix_search_documents_user_id', 'search_documents', ['user_id'])
+
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        statements = POSTGRES_UPGRADE
+    elif dialect == 'sqlite':
+        statements = SQLITE_UPGRADE
+    else:
+        statements = []
+    for statement in statements + BACKFILL:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'sqlite':
+        for statement in SQLITE_DOWNGRADE:
+            op.execute(statement)
+    op.drop_index('ix_search_documents_user_id', table_name='search_documents')
+    op.drop_index('ix_search_documents_meeting_id', table_name='search_documents')
+    op.drop_index('ix_search_documents_source_type_source_id', table_name='search_documents')
+    op.drop_table('search_documents')
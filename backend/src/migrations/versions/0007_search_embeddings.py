@@ -0,0 +1,56 @@
+"""search document embeddings
+
+Semantic search vectors on search documents, tagged with the embedder
+that produced them. The user index is widened to (user_id,
+embedding_model, id) so a user's vectors are loaded, and their
+freshness checked, without touching other rows. On SQLite the FTS5
+update trigger is narrowed to title/body changes, so storing a vector
+does not rewrite the full-text entry.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17 04:20:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+
+def _replace_sqlite_update_trigger(columns: str) -> None:
+    op.execute("DROP TRIGGER IF EXISTS search_documents_au")
+    op.execute(f"""
+    CREATE TRIGGER search_documents_au AFTER UPDATE {columns}ON search_documents BEGIN
+        INSERT INTO search_documents_fts(search_documents_fts, rowid, title, body)
+        VALUES ('delete', old.id, old.title, old.body);
+        INSERT INTO search_documents_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END
+    """)
+
+
+def upgrade() -> None:
+    op.add_column('search_documents', sa.Column('embedding', sa.LargeBinary(), nullable=True))
+    op.add_column('search_documents', sa.Column('embedding_model', sa.String(length=100), nullable=True))
+    op.create_index(
+        'ix_search_documents_user_id_embedding_model', 'search_documents', ['user_id', 'embedding_model', 'id']
+    )
+    op.drop_index('ix_search_documents_user_id', table_name='search_documents')
+
+    if op.get_bind().dialect.name == 'sqlite':
+        _replace_sqlite_update_trigger("OF title, body ")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'sqlite':
+        _replace_sqlite_update_trigger("")
+
+    op.create_index('ix_search_documents_user_id', 'search_documents', ['user_id'])
+    op.drop_index('ix_search_documents_user_id_embedding_model', table_name='search_documents')
+    # Not a batch (copy-and-move) operation: recreating the table would drop
+    # the FTS5 triggers. SQLite supports DROP COLUMN natively since 3.35.
+    op.drop_column('search_documents', 'embedding_model')
+    op.drop_column('search_documents', 'embedding')
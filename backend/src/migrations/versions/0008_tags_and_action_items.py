@@ -0,0 +1,125 @@
+"""tags and action items
+
+Normalized tags of summaries and comprehensive notes, and action items of
+summaries, derived from the comma-separated tags strings and the
+action_items JSON column. Existing rows are back-filled with the same
+parsers the application uses (dashboard.summary_items).
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17 05:30:00.000000
+"""
+import uuid
+
+from alembic import op
+import sqlalchemy as sa
+
+from dashboard.summary_items import parse_tags, parse_action_items
+
+
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    tags = op.create_table(
+        'tags',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('user_id', sa.String(), nullable=False),
+        sa.Column('meeting_id', sa.String(), nullable=False),
+        sa.Column('name', sa.String(length=50), nullable=False),
+        sa.Column('summary_id', sa.String(), nullable=True),
+        sa.Column('notes_id', sa.String(), nullable=True),
+        sa.ForeignKeyConstraint(['meeting_id'], ['meetings.id']),
+        sa.ForeignKeyConstraint(['notes_id'], ['comprehensive_notes.id']),
+        sa.ForeignKeyConstraint(['summary_id'], ['summaries.id']),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_tags_user_id_name', 'tags', ['user_id', 'name'])
+    op.create_index('ix_tags_summary_id', 'tags', ['summary_id'])
+    op.create_index('ix_tags_notes_id', 'tags', ['notes_id'])
+    op.create_index('ix_tags_meeting_id', 'tags', ['meeting_id'])
+
+    action_items = op.create_table(
+        'action_items',
+        sa.Column('id', sa.String(), nullable=False),
+        sa.Column('user_id', sa.String(), nullable=False),
+        sa.Column('meeting_id', sa.String(), nullable=False),
+        sa.Column('summary_id', sa.String(), nullable=False),
+        sa.Column('position', sa.Integer(), nullable=False),
+        sa.Column('task_name', sa.String(length=255), nullable=False),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('assignee', sa.String(length=100), nullable=True),
+        sa.Column('deadline', sa.Date(), nullable=True),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('completed_at', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['meeting_id'], ['meetings.id']),
+        sa.ForeignKeyConstraint(['summary_id'], ['summaries.id']),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_action_items_user_id_status_deadline', 'action_items', ['user_id', 'status', 'deadline'])
+    op.create_index('ix_action_items_user_id_assignee_status', 'action_items', ['user_id', 'assignee', 'status'])
+    op.create_index('ix_action_items_summary_id', 'action_items', ['summary_id'])
+    op.create_index('ix_action_items_meeting_id', 'action_items', ['meeting_id'])
+
+    # Typed table stubs, so created_at comes back as a datetime on every dialect
+    summaries_table = sa.table(
+        'summaries', sa.column('id'), sa.column('user_id'), sa.column('meeting_id'),
+        sa.column('tags'), sa.column('action_items'), sa.column('created_at', sa.DateTime())
+    )
+    notes_table = sa.table(
+        'comprehensive_notes', sa.column('id'), sa.column('user_id'), sa.column('meeting_id'), sa.column('tags')
+    )
+
+    bind = op.get_bind()
+    tag_rows = []
+    action_item_rows = []
+
+    summaries = bind.execute(sa.select(
+        summaries_table.c.id, summaries_table.c.user_id, summaries_table.c.meeting_id,
+        summaries_table.c.tags, summaries_table.c.action_items, summaries_table.c.created_at
+    )).all()
+    for summary_id, user_id, meeting_id, raw_tags, raw_action_items, created_at in summaries:
+        tag_rows += [
+            {'user_id': user_id, 'meeting_id': meeting_id, 'name': name, 'summary_id': summary_id, 'notes_id': None}
+            for name in parse_tags(raw_tags)
+        ]
+        action_item_rows += [
+            {
+                'id': str(uuid.uuid4()), 'user_id': user_id, 'meeting_id': meeting_id, 'summary_id': summary_id,
+                'position': position, 'status': 'open', 'completed_at': None, 'created_at': created_at, **task
+            }
+            for position, task in enumerate(parse_action_items(raw_action_items))
+        ]
+
+    notes = bind.execute(sa.select(
+        notes_table.c.id, notes_table.c.user_id, notes_table.c.meeting_id, notes_table.c.tags
+    ).where(notes_table.c.tags.isnot(None))).all()
+    for notes_id, user_id, meeting_id, raw_tags in notes:
+        tag_rows += [
+            {'user_id': user_id, 'meeting_id': meeting_id, 'name': name, 'summary_id': None, 'notes_id': notes_id}
+            for name in parse_tags(raw_tags)
+        ]
+
+    if tag_rows:
+        op.bulk_insert(tags, tag_rows)
+    if action_item_rows:
+        op.bulk_insert(action_items, action_item_rows)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_action_items_meeting_id', table_name='action_items')
+    op.drop_index('ix_action_items_summary_id', table_name='action_items')
+    op.drop_index('ix_action_items_user_id_assignee_status', table_name='action_items')
+    op.drop_index('ix_action_items_user_id_status_deadline', table_name='action_items')
+    op.drop_table('action_items')
+    op.drop_index('ix_tags_meeting_id', table_name='tags')
+    op.drop_index('ix_tags_notes_id', table_name='tags')
+    op.drop_index('ix_tags_summary_id', table_name='tags')
+    op.drop_index('ix_tags_user_id_name', table_name='tags')
+    op.drop_table('tags')
@@ -0,0 +1,39 @@
+"""keyset created_at precision
+
+meetings.created_at and summaries.created_at used to default to now()
+on the server, which SQLite stores as 'YYYY-MM-DD HH:MM:SS'. Keyset
+cursors bind as 'YYYY-MM-DD HH:MM:SS.ffffff', and SQLite compares the
+two as strings, so a second-precision row always sorted below its own
+cursor and paging never advanced. The models now set created_at
+client-side with microseconds; this pads the rows already stored to
+the same format. PostgreSQL stores real timestamps and is unaffected.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-17 09:30:00.000000
+"""
+from alembic import op
+
+
+revision = '0009'
+down_revision = '0008'
+branch_labels = None
+depends_on = None
+
+KEYSET_TABLES = ('meetings', 'summaries')
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    for table in KEYSET_TABLES:
+        op.execute(
+            f"UPDATE {table} SET created_at = created_at || '.000000' "
+            "WHERE length(created_at) = 19"
+        )
+
+
+def downgrade() -> None:
+    # Padded values remain valid timestamps
+    pass
@@ -0,0 +1,32 @@
+"""drop system tags
+
+The structured notes summaries carry the markers 'ai_generated' and
+'structured_notes' in their tags string. The 0008 back-fill and the
+application turned them into tag rows, so they were listed and counted
+as user tags. Tag parsing now skips them; this removes the rows already
+written. The summaries' tags strings keep the markers.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-17 11:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0010'
+down_revision = '0009'
+branch_labels = None
+depends_on = None
+
+SYSTEM_TAGS = ('ai_generated', 'structured_notes')
+
+
+def upgrade() -> None:
+    tags = sa.table('tags', sa.column('name'))
+    op.execute(tags.delete().where(tags.c.name.in_(SYSTEM_TAGS)))
+
+
+def downgrade() -> None:
+    # The markers are still in the summaries' tags strings; nothing to restore
+    pass
@@ -0,0 +1 @@
+# Full-text and semantic search over notes, summaries and transcripts
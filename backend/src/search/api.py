@@ -0,0 +1,81 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+
+from database import get_async_db
+from auth.dependencies import get_current_user
+from auth.models import User
+from .indexer import SOURCE_TYPES
+from .schemas import SearchResponse, SemanticSearchResponse
+from .service import search_service
+from .semantic import semantic_index
+
+# Create search router
+search_router = APIRouter()
+
+
+def _check_types(types: Optional[List[str]]) -> None:
+    """Reject source types the index does not know"""
+    unknown = [source_type for source_type in types or [] if source_type not in SOURCE_TYPES]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown search types: {', '.join(unknown)}"
+        )
+
+
+@search_router.get("", response_model=SearchResponse)
+async def search(
+    q: str = Query(..., min_length=1, description="Search query"),
+    types: Optional[List[str]] = Query(None, description="Restrict to notes, summary and/or transcript"),
+    page: int = Query(1, ge=1, description="1-based page number"),
+    per_page: int = Query(20, ge=1, le=100, description="Results per page"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Full-text search across the user's notes, summaries and transcripts
+    
+    Results are ranked best match first. Each snippet is HTML-escaped with
+    the matching words wrapped in `<mark>` tags; transcript hits carry the
+    `start_seconds` of the matching passage.
+    """
+    _check_types(types)
+    
+    try:
+        results, has_more = await search_service.search(
+            db, current_user.id, q, source_types=types, page=page, per_page=per_page
+        )
+        return SearchResponse(results=results, query=q, page=page, per_page=per_page, has_more=has_more)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+
+@search_router.get("/semantic", response_model=SemanticSearchResponse)
+async def semantic_search(
+    q: str = Query(..., min_length=1, description="Question or phrase, e.g. where did we discuss the Q3 pricing change?"),
+    k: int = Query(10, ge=1, le=50, description="Number of results"),
+    types: Optional[List[str]] = Query(None, description="Restrict to notes, summary and/or transcript"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Semantic search across the user's meetings
+    
+    Returns the passages closest in meaning to the query, most similar
+    first. Meetings become searchable once their post-meeting processing
+    has embedded them.
+    """
+    _check_types(types)
+    
+    try:
+        results = await semantic_index.search(db, current_user.id, q, k=k, source_types=types)
+        return SemanticSearchResponse(results=results, query=q, k=k)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
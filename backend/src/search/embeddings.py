@@ -0,0 +1,104 @@
+import hashlib
+import logging
+import re
+from functools import lru_cache
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from settings import settings
+
+logger = logging.getLogger(__name__)
+
+_WORD = re.compile(r"\w+")
+
+
+class Embedder:
+    """
+    Turns texts into L2-normalized float32 vectors
+    
+    `name` identifies the vector space (model and dimensions); vectors are
+    stored with it, so switching embedders never mixes incomparable vectors.
+    """
+    
+    name: str
+    dimensions: int
+    
+    async def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed texts into a (len(texts), dimensions) float32 matrix of unit rows"""
+        raise NotImplementedError
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length so a dot product is the cosine similarity"""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return (matrix / np.where(norms == 0, 1.0, norms)).astype(np.float32)
+
+
+class HashingEmbedder(Embedder):
+    """
+    Deterministic local embedder: signed feature hashing of words and word pairs
+    
+    Needs no model or network and gives the same vectors in every process,
+    which makes it the default for development and tests. It matches shared
+    vocabulary rather than meaning, so production deployments should use a
+    model-backed embedder.
+    """
+    
+    BIGRAM_WEIGHT = 0.5
+    
+    def __init__(self, dimensions: int):
+        self.dimensions = dimensions
+        self.name = f"hashing-{dimensions}"
+    
+    @staticmethod
+    @lru_cache(maxsize=65536)
+    def _bucket(feature: str, dimensions: int) -> Tuple[int, float]:
+        """Stable (bucket, sign) of a feature; Python's hash() is salted per process"""
+        value = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+        return value % dimensions, (1.0 if value >> 63 else -1.0)
+    
+    def _embed_one(self, text: str) -> np.ndarray:
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        words = _WORD.findall(text.lower())
+        for word in words:
+            bucket, sign = self._bucket(word, self.dimensions)
+            vector[bucket] += sign
+        for first, second in zip(words, words[1:]):
+            bucket, sign = self._bucket(f"{first} {second}", self.dimensions)
+            vector[bucket] += sign * self.BIGRAM_WEIGHT
+        # Dampen repeated terms so one frequent word does not dominate
+        return np.sign(vector) * np.log1p(np.abs(vector))
+    
+    async def embed(self, texts: Sequence[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, self.dimensions), dtype=np.float32)
+        return _normalize(np.stack([self._embed_one(text) for text in texts]))
+
+
+class OpenAIEmbedder(Embedder):
+    """Embedder backed by the OpenAI embeddings API"""
+    
+    def __init__(self, model: str, dimensions: int):
+        self.model = model
+        self.dimensions = dimensions
+        self.name = f"openai:{model}:{dimensions}"
+    
+    async def embed(self, texts: Sequence[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, self.dimensions), dtype=np.float32)
+        
+        # Imported here: the OpenAI service requires an API key at import time
+        from dashboard.openai_service import openai_service
+        vectors = await openai_service.create_embeddings(list(texts), self.model, self.dimensions)
+        return _normalize(np.asarray(vectors, dtype=np.float32))
+
+
+def create_embedder() -> Embedder:
+    """Create the embedder selected by EMBEDDING_PROVIDER"""
+    provider = settings.EMBEDDING_PROVIDER.lower()
+    if provider == "openai":
+        return OpenAIEmbedder(settings.EMBEDDING_MODEL, settings.EMBEDDING_DIMENSIONS)
+    if provider != "local":
+        logger.warning(f"⚠️ Unknown EMBEDDING_PROVIDER '{settings.EMBEDDING_PROVIDER}', using the local embedder")
+    return HashingEmbedder(settings.EMBEDDING_DIMENSIONS)
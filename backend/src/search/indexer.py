@@ -0,0 +1,133 @@
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import and_, delete, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .models import SearchDocument
+
+# Source types of search documents
+NOTES = "notes"
+SUMMARY = "summary"
+TRANSCRIPT = "transcript"
+SOURCE_TYPES = (NOTES, SUMMARY, TRANSCRIPT)
+
+# Transcript segments per search document: small enough that a match ranks
+# on its own and points at a moment of the meeting, large enough to keep the
+# number of documents per meeting low
+TRANSCRIPT_CHUNK_SEGMENTS = 20
+
+# Functions here only add and delete rows; callers commit them together with
+# the write that changed the source, so the index never drifts from it.
+
+
+def _loaded(obj, attribute: str):
+    """Value of an attribute if it is loaded, without triggering a lazy load"""
+    return inspect(obj).dict.get(attribute)
+
+
+async def remove_source(db: AsyncSession, source_type: str, source_id: str) -> None:
+    """Remove every document of a note, summary or meeting transcript"""
+    await db.execute(
+        delete(SearchDocument).where(
+            and_(SearchDocument.source_type == source_type, SearchDocument.source_id == source_id)
+        )
+    )
+
+
+async def remove_meeting(db: AsyncSession, meeting_id: str) -> None:
+    """Remove every document that belongs to a meeting"""
+    await db.execute(
+        delete(SearchDocument).where(SearchDocument.meeting_id == meeting_id)
+    )
+
+
+async def index_notes(db: AsyncSession, notes) -> None:
+    """
+    (Re)index a ComprehensiveNotes row
+    
+    The row must have been flushed so its ID is known.
+    """
+    await remove_source(db, NOTES, notes.id)
+    body = "\n\n".join(part for part in (notes.comprehensive_notes, notes.user_notes) if part)
+    if not body and not notes.tags:
+        return
+    
+    db.add(SearchDocument(
+        user_id=notes.user_id,
+        meeting_id=notes.meeting_id,
+        source_type=NOTES,
+        source_id=notes.id,
+        title=notes.tags,
+        body=body,
+        created_at=_loaded(notes, "created_at") or datetime.utcnow()
+    ))
+
+
+async def index_summary(db: AsyncSession, summary) -> None:
+    """
+    (Re)index a Summary row
+    
+    The row must have been flushed so its ID is known.
+    """
+    await remove_source(db, SUMMARY, summary.id)
+    db.add(SearchDocument(
+        user_id=summary.user_id,
+        meeting_id=summary.meeting_id,
+        source_type=SUMMARY,
+        source_id=summary.id,
+        title=summary.title,
+        body=summary.content,
+        created_at=_loaded(summary, "created_at") or datetime.utcnow()
+    ))
+
+
+async def index_meeting_summary(db: AsyncSession, meeting) -> None:
+    """(Re)index the AI summary saved on a meeting, keyed by the meeting ID"""
+    await remove_source(db, SUMMARY, meeting.id)
+    if not meeting.summary:
+        return
+    
+    db.add(SearchDocument(
+        user_id=meeting.user_id,
+        meeting_id=meeting.id,
+        source_type=SUMMARY,
+        source_id=meeting.id,
+        title=_loaded(meeting, "name"),
+        body=meeting.summary,
+        created_at=meeting.summary_generated_at or datetime.utcnow()
+    ))
+
+
+async def index_meeting_transcript(
+    db: AsyncSession, 
+    meeting_id: str, 
+    user_id: str, 
+    transcripts: List,
+    created_at: Optional[datetime] = None
+) -> int:
+    """
+    (Re)index a finished meeting's transcript as chunks of consecutive segments
+    
+    Returns:
+        Number of documents written
+    """
+    await remove_source(db, TRANSCRIPT, meeting_id)
+    created_at = created_at or datetime.utcnow()
+    
+    documents = []
+    for chunk, first in enumerate(range(0, len(transcripts), TRANSCRIPT_CHUNK_SEGMENTS)):
+        window = transcripts[first:first + TRANSCRIPT_CHUNK_SEGMENTS]
+        documents.append(SearchDocument(
+            user_id=user_id,
+            meeting_id=meeting_id,
+            source_type=TRANSCRIPT,
+            source_id=meeting_id,
+            chunk=chunk,
+            body="\n".join(f"{t.speaker or 'Unknown'}: {t.text}" for t in window),
+            start_seconds=window[0].start_seconds,
+            created_at=created_at
+        ))
+    
+    db.add_all(documents)
+    return len(documents)
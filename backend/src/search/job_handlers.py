@@ -0,0 +1,13 @@
+from typing import Optional
+
+from database import AsyncSessionLocal
+from jobs.queue import job_queue
+from .semantic import semantic_index
+
+
+@job_queue.handler("embed_meeting")
+async def embed_meeting(user_id: str, payload: dict) -> Optional[dict]:
+    """Embed a meeting's search documents for semantic search"""
+    async with AsyncSessionLocal() as db:
+        embedded = await semantic_index.embed_meeting(db, payload["meeting_id"], user_id)
+    return {"meeting_id": payload["meeting_id"], "embedded": embedded}
@@ -0,0 +1,49 @@
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Integer, Float, LargeBinary, Index
+from sqlalchemy.sql import func
+from database import Base
+
+
+class SearchDocument(Base):
+    """
+    Searchable text of a note, summary or transcript chunk, owned by one user
+    
+    Maintained by search.indexer in the same transaction as the source write.
+    The full-text index itself is dialect-specific and created by migration
+    0006: a generated tsvector column with a GIN index on PostgreSQL, an FTS5
+    table kept in sync by triggers on SQLite.
+    """
+    __tablename__ = "search_documents"
+    
+    # Integer key: doubles as the FTS5 rowid on SQLite
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(String, ForeignKey("users.id"), nullable=False)
+    meeting_id = Column(String, ForeignKey("meetings.id"), nullable=True)
+    
+    # Source the text was taken from
+    source_type = Column(String(20), nullable=False)  # notes, summary, transcript
+    source_id = Column(String, nullable=False)  # Notes/summary ID, or meeting ID for meeting summaries and transcripts
+    chunk = Column(Integer, nullable=False, default=0)  # Position of a transcript chunk
+    
+    # Indexed text
+    title = Column(String(255), nullable=True)  # Ranked above the body
+    body = Column(Text, nullable=False)
+    
+    # Transcript chunks: offset of their first segment, to jump to the match
+    start_seconds = Column(Float, nullable=True)
+    
+    # Semantic search vector (float32 bytes) and the embedder that produced it
+    embedding = Column(LargeBinary, nullable=True)
+    embedding_model = Column(String(100), nullable=True)
+    
+    # Timestamps
+    created_at = Column(DateTime, default=func.now())
+    
+    __table_args__ = (
+        # Re-indexing and removing a source
+        Index("ix_search_documents_source_type_source_id", "source_type", "source_id"),
+        # Removing a meeting's documents
+        Index("ix_search_documents_meeting_id", "meeting_id"),
+        # A user's documents: filter applied alongside the full-text match, and
+        # the index-only load/freshness check of their semantic search vectors
+        Index("ix_search_documents_user_id_embedding_model", "user_id", "embedding_model", "id"),
+    )
@@ -0,0 +1,45 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from datetime import datetime
+
+
+class SearchResult(BaseModel):
+    """Schema for one full-text search hit"""
+    source_type: str = Field(..., description="notes, summary or transcript")
+    source_id: str = Field(..., description="Notes or summary ID, or the meeting ID for meeting summaries and transcripts")
+    meeting_id: Optional[str] = None
+    meeting_name: Optional[str] = None
+    title: Optional[str] = None
+    snippet: str = Field(..., description="HTML-escaped excerpt with matches wrapped in <mark> tags")
+    start_seconds: Optional[float] = Field(None, description="Offset of the matching transcript chunk")
+    rank: float
+    created_at: Optional[datetime] = None
+
+
+class SearchResponse(BaseModel):
+    """Schema for a page of full-text search hits, best match first"""
+    results: List[SearchResult]
+    query: str
+    page: int
+    per_page: int
+    has_more: bool
+
+
+class SemanticSearchResult(BaseModel):
+    """Schema for one semantic search hit"""
+    source_type: str = Field(..., description="notes, summary or transcript")
+    source_id: str = Field(..., description="Notes or summary ID, or the meeting ID for meeting summaries and transcripts")
+    meeting_id: Optional[str] = None
+    meeting_name: Optional[str] = None
+    title: Optional[str] = None
+    snippet: str = Field(..., description="HTML-escaped start of the matching passage")
+    start_seconds: Optional[float] = Field(None, description="Offset of the matching transcript chunk")
+    score: float = Field(..., description="Cosine similarity to the query")
+    created_at: Optional[datetime] = None
+
+
+class SemanticSearchResponse(BaseModel):
+    """Schema for the closest documents to a query, most similar first"""
+    results: List[SemanticSearchResult]
+    query: str
+    k: int
@@ -0,0 +1,213 @@
+import html
+import logging
+from collections import OrderedDict
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import select, and_, or_, func, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from dashboard.models import Meeting
+from settings import settings
+from .embeddings import Embedder, create_embedder
+from .models import SearchDocument
+from .schemas import SemanticSearchResult
+
+logger = logging.getLogger(__name__)
+
+
+class _UserIndex(NamedTuple):
+    """A user's vectors in one matrix, row i belonging to search document ids[i]"""
+    signature: Tuple[int, Optional[int]]  # (count, max id) of the embedded documents
+    ids: np.ndarray
+    source_types: np.ndarray
+    matrix: np.ndarray
+
+
+class SemanticIndex:
+    """
+    Embedding-based search over a user's search documents
+    
+    Vectors are stored on the search documents (float32 bytes tagged with the
+    embedder name). Searches run against an in-process per-user matrix: one
+    matrix-vector product and a partial sort give the top k without reading
+    any text, and only the k winning rows are fetched. Before each search the
+    cached matrix is checked against the (count, max id) of the user's
+    embedded documents, an index-only query; documents are re-indexed by
+    replacing them, so any change moves the signature and the matrix is
+    reloaded, also when another worker made the change.
+    """
+    
+    EMBED_BATCH_SIZE = 64
+    EMBED_MAX_CHARS = 8000  # Keeps a chunk within embedding model input limits
+    SNIPPET_CHARS = 300
+    
+    def __init__(self, embedder: Optional[Embedder] = None, max_users: Optional[int] = None):
+        self.embedder = embedder or create_embedder()
+        self.max_users = max_users if max_users is not None else settings.SEMANTIC_INDEX_MAX_USERS
+        self._indexes: "OrderedDict[str, _UserIndex]" = OrderedDict()
+    
+    async def embed_meeting(self, db: AsyncSession, meeting_id: str, user_id: str) -> int:
+        """
+        Embed a meeting's search documents that have no vector from the current embedder
+        
+        Returns:
+            Number of documents embedded
+        """
+        result = await db.execute(
+            select(SearchDocument.id, SearchDocument.title, SearchDocument.body).where(
+                and_(
+                    SearchDocument.meeting_id == meeting_id,
+                    SearchDocument.user_id == user_id,
+                    or_(
+                        SearchDocument.embedding_model.is_(None),
+                        SearchDocument.embedding_model != self.embedder.name
+                    )
+                )
+            )
+        )
+        pending = result.all()
+        
+        for start in range(0, len(pending), self.EMBED_BATCH_SIZE):
+            batch = pending[start:start + self.EMBED_BATCH_SIZE]
+            texts = [
+                (f"{title}\n{body}" if title else body)[:self.EMBED_MAX_CHARS]
+                for _, title, body in batch
+            ]
+            vectors = await self.embedder.embed(texts)
+            await db.execute(
+                update(SearchDocument),
+                [
+                    {"id": document_id, "embedding": vector.tobytes(), "embedding_model": self.embedder.name}
+                    for (document_id, _, _), vector in zip(batch, vectors)
+                ]
+            )
+        
+        await db.commit()
+        return len(pending)
+    
+    async def _load(self, db: AsyncSession, user_id: str) -> _UserIndex:
+        """Return the user's matrix, reloading it if their embedded documents changed"""
+        embedded = and_(
+            SearchDocument.user_id == user_id,
+            SearchDocument.embedding_model == self.embedder.name
+        )
+        result = await db.execute(
+            select(func.count(SearchDocument.id), func.max(SearchDocument.id)).where(embedded)
+        )
+        signature = tuple(result.one())
+        
+        index = self._indexes.get(user_id)
+        if index is not None and index.signature == signature:
+            self._indexes.move_to_end(user_id)
+            return index
+        
+        result = await db.execute(
+            select(SearchDocument.id, SearchDocument.source_type, SearchDocument.embedding).where(embedded)
+        )
+        rows = result.all()
+        dimensions = self.embedder.dimensions
+        index = _UserIndex(
+            signature=signature,
+            ids=np.array([row[0] for row in rows], dtype=np.int64),
+            source_types=np.array([row[1] for row in rows], dtype=object),
+            matrix=(
+                np.vstack([np.frombuffer(row[2], dtype=np.float32) for row in rows])
+                if rows else np.zeros((0, dimensions), dtype=np.float32)
+            )
+        )
+        
+        self._indexes[user_id] = index
+        self._indexes.move_to_end(user_id)
+        while len(self._indexes) > self.max_users:
+            self._indexes.popitem(last=False)
+        return index
+    
+    async def search(
+        self,
+        db: AsyncSession,
+        user_id: str,
+        query: str,
+        k: int = 10,
+        source_types: Optional[Sequence[str]] = None
+    ) -> List[SemanticSearchResult]:
+        """
+        Find the k search documents closest in meaning to a query
+        
+        Args:
+            db: Database session
+            user_id: User whose documents are searched
+            query: Natural-language question or phrase
+            k: Number of results
+            source_types: Restrict to these source types
+            
+        Returns:
+            Results by descending cosine similarity (unrelated documents are left out)
+            
+        Raises:
+            Exception: If embedding the query or loading the index fails
+        """
+        try:
+            index = await self._load(db, user_id)
+            if not len(index.ids):
+                return []
+            
+            query_vector = (await self.embedder.embed([query]))[0]
+            scores = index.matrix @ query_vector
+            if source_types:
+                scores = np.where(np.isin(index.source_types, list(source_types)), scores, -np.inf)
+            
+            count = min(k, len(scores))
+            top = np.argpartition(-scores, count - 1)[:count]
+            top = top[np.argsort(-scores[top])]
+            top = top[scores[top] > 0]
+            if not len(top):
+                return []
+            
+            ids = [int(document_id) for document_id in index.ids[top]]
+            result = await db.execute(
+                select(
+                    SearchDocument.id,
+                    SearchDocument.source_type,
+                    SearchDocument.source_id,
+                    SearchDocument.meeting_id,
+                    SearchDocument.title,
+                    func.substr(SearchDocument.body, 1, self.SNIPPET_CHARS + 1),
+                    SearchDocument.start_seconds,
+                    SearchDocument.created_at,
+                    Meeting.name
+                )
+                .outerjoin(Meeting, Meeting.id == SearchDocument.meeting_id)
+                .where(SearchDocument.id.in_(ids))
+            )
+            rows = {row[0]: row for row in result.all()}
+            
+            results = []
+            for position, document_id in zip(top, ids):
+                row = rows.get(document_id)
+                if row is None:
+                    continue  # Removed since the matrix was loaded
+                _, source_type, source_id, meeting_id, title, text, start_seconds, created_at, meeting_name = row
+                snippet = html.escape(text[:self.SNIPPET_CHARS])
+                if len(text) > self.SNIPPET_CHARS:
+                    snippet += "…"
+                results.append(SemanticSearchResult(
+                    source_type=source_type,
+                    source_id=source_id,
+                    meeting_id=meeting_id,
+                    meeting_name=meeting_name,
+                    title=title,
+                    snippet=snippet,
+                    start_seconds=start_seconds,
+                    score=float(scores[position]),
+                    created_at=created_at
+                ))
+            return results
+            
+        except Exception as e:
+            logger.error(f"❌ Semantic search failed: {str(e)}")
+            raise Exception(f"Failed to run semantic search: {str(e)}")
+
+
+# Global semantic index instance
+semantic_index = SemanticIndex()
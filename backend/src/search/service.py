@@ -0,0 +1,182 @@
+import html
+import logging
+import re
+from typing import List, Optional, Sequence, Tuple
+
+from sqlalchemy import select, and_, func, literal_column, table, column
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from dashboard.models import Meeting
+from .models import SearchDocument
+from .schemas import SearchResult
+
+logger = logging.getLogger(__name__)
+
+# Text search configuration of the tsvector column (see migration 0006)
+_PG_CONFIG = literal_column("'english'")
+_PG_VECTOR = literal_column("search_documents.search_vector", TSVECTOR)
+
+# SQLite FTS5 table mirroring search_documents (rowid = search_documents.id)
+_FTS = table("search_documents_fts", column("rowid"))
+_FTS_NAME = literal_column("search_documents_fts")
+
+# Snippets are produced with control characters around the matches, then
+# HTML-escaped and only afterwards given <mark> tags, so text from notes
+# and transcripts can never inject markup into the results
+_MATCH_START = "\u0002"
+_MATCH_STOP = "\u0003"
+_ELLIPSIS = "…"
+
+_HEADLINE_OPTIONS = (
+    f"StartSel={_MATCH_START}, StopSel={_MATCH_STOP}, "
+    f"MaxFragments=2, MaxWords=25, MinWords=8, FragmentDelimiter={_ELLIPSIS}"
+)
+
+# Title (tags for notes) weighs more than the body in SQLite's bm25, as the
+# 'A' weight does in PostgreSQL
+_BM25_WEIGHTS = (10.0, 1.0)
+_SNIPPET_TOKENS = 16
+
+_TERM = re.compile(r"\w+")
+
+
+def _highlight(snippet: Optional[str]) -> str:
+    """Escape a raw snippet and turn the match markers into <mark> tags"""
+    return (
+        html.escape(snippet or "")
+        .replace(_MATCH_START, "<mark>")
+        .replace(_MATCH_STOP, "</mark>")
+    )
+
+
+def _fts5_query(query: str) -> Optional[str]:
+    """
+    Turn free text into an FTS5 query matching documents that contain every word
+    
+    Each word is quoted, so FTS5 operators and syntax characters in user input
+    are matched literally instead of raising a syntax error.
+    """
+    terms = _TERM.findall(query)
+    if not terms:
+        return None
+    return " ".join(f'"{term}"' for term in terms)
+
+
+class SearchService:
+    """Ranked full-text search over a user's search documents"""
+    
+    async def search(
+        self,
+        db: AsyncSession,
+        user_id: str,
+        query: str,
+        source_types: Optional[Sequence[str]] = None,
+        source_ids=None,
+        page: int = 1,
+        per_page: int = 20
+    ) -> Tuple[List[SearchResult], bool]:
+        """
+        Search a user's notes, summaries and transcripts
+        
+        Args:
+            db: Database session
+            user_id: User whose documents are searched
+            query: Free-text query (PostgreSQL also accepts web search syntax:
+                "quoted phrases", OR and -excluded words)
+            source_types: Restrict to these source types
+            source_ids: Restrict to these source IDs (a list or a subquery)
+            page: 1-based page number
+            per_page: Hits per page
+            
+        Returns:
+            Tuple of (hits best match first, whether another page exists)
+            
+        Raises:
+            Exception: If the search query fails
+        """
+        try:
+            filters = [SearchDocument.user_id == user_id]
+            if source_types:
+                filters.append(SearchDocument.source_type.in_(source_types))
+            if source_ids is not None:
+                filters.append(SearchDocument.source_id.in_(source_ids))
+            
+            offset = (page - 1) * per_page
+            if db.get_bind().dialect.name == "postgresql":
+                stmt = self._postgres_query(query, filters, per_page + 1, offset)
+            else:
+                stmt = self._sqlite_query(query, filters, per_page + 1, offset)
+                if stmt is None:
+                    return [], False
+            
+            rows = (await db.execute(stmt)).all()
+            hits = [
+                SearchResult(
+                    source_type=document.source_type,
+                    source_id=document.source_id,
+                    meeting_id=document.meeting_id,
+                    meeting_name=meeting_name,
+                    title=document.title,
+                    snippet=_highlight(snippet),
+                    start_seconds=document.start_seconds,
+                    rank=float(rank or 0.0),
+                    created_at=document.created_at
+                )
+                for document, rank, snippet, meeting_name in rows[:per_page]
+            ]
+            return hits, len(rows) > per_page
+            
+        except Exception as e:
+            logger.error(f"❌ Full-text search failed: {str(e)}")
+            raise Exception(f"Failed to search: {str(e)}")
+    
+    def _postgres_query(self, query: str, filters: List, limit: int, offset: int):
+        """Rank with ts_rank_cd over the GIN-indexed tsvector, headline only the page"""
+        tsquery = func.websearch_to_tsquery(_PG_CONFIG, query)
+        rank = func.ts_rank_cd(_PG_VECTOR, tsquery)
+        
+        # ts_headline re-parses the document, so it runs on the page alone
+        ranked = (
+            select(SearchDocument.id, rank.label("rank"))
+            .where(and_(_PG_VECTOR.op("@@")(tsquery), *filters))
+            .order_by(rank.desc(), SearchDocument.id.desc())
+            .limit(limit)
+            .offset(offset)
+            .subquery()
+        )
+        return (
+            select(
+                SearchDocument,
+                ranked.c.rank,
+                func.ts_headline(_PG_CONFIG, SearchDocument.body, tsquery, _HEADLINE_OPTIONS).label("snippet"),
+                Meeting.name
+            )
+            .join(ranked, ranked.c.id == SearchDocument.id)
+            .outerjoin(Meeting, Meeting.id == SearchDocument.meeting_id)
+            .order_by(ranked.c.rank.desc(), SearchDocument.id.desc())
+        )
+    
+    def _sqlite_query(self, query: str, filters: List, limit: int, offset: int):
+        """Rank with FTS5's bm25 and cut snippets with FTS5's snippet()"""
+        match = _fts5_query(query)
+        if match is None:
+            return None
+        
+        # bm25 is lower for better matches; negate it so rank sorts like ts_rank_cd
+        rank = -func.bm25(_FTS_NAME, *_BM25_WEIGHTS)
+        snippet = func.snippet(_FTS_NAME, 1, _MATCH_START, _MATCH_STOP, _ELLIPSIS, _SNIPPET_TOKENS)
+        return (
+            select(SearchDocument, rank.label("rank"), snippet.label("snippet"), Meeting.name)
+            .select_from(_FTS)
+            .join(SearchDocument, SearchDocument.id == _FTS.c.rowid)
+            .outerjoin(Meeting, Meeting.id == SearchDocument.meeting_id)
+            .where(and_(_FTS_NAME.op("MATCH")(match), *filters))
+            .order_by(rank.desc(), SearchDocument.id.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+
+
+# Global search service instance
+search_service = SearchService()
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Header, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Dict, Any
 import secrets
@@ -6,6 +6,7 @@ import uuid
 
 from database import get_async_db
 from auth.dependencies import get_current_user
+from jobs.queue import job_queue
 from auth.models import User
 from dashboard.models import Meeting
 from dashboard import crud as dashboard_crud
@@ -293,19 +294,22 @@ async def send_slack_message(
         )
 
 
-@slack_router.post("/integrations/{integration_id}/send-meeting-summary/{meeting_id}", response_model=MessageResponse)
+@slack_router.post("/integrations/{integration_id}/send-meeting-summary/{meeting_id}", response_model=MessageResponse, status_code=status.HTTP_202_ACCEPTED)
 async def send_meeting_summary_to_slack(
     integration_id: str,
     meeting_id: str,
+    response: Response,
     channel_id: str = Query(None, description="Target channel ID (optional, uses default if not provided)"),
+    idempotency_key: str = Header(None, alias="Idempotency-Key"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Send meeting summary to Slack channel
+    Queue delivery of the meeting summary to a Slack channel
     
     This endpoint is designed to be called from the meeting workspace
-    after a meeting ends.
+    after a meeting ends. Delivery runs in a background job (retried on
+    failure); its ID is returned in the `X-Job-Id` header.
     """
     # Get integration
     integration = await slack_crud.get_slack_integration_by_id(
@@ -343,24 +347,15 @@ async def send_meeting_summary_to_slack(
         )
     
     try:
-        # Format meeting summary
-        meeting_title = f"Итоги встречи - {meeting.bot_name}"
-        meeting_url = f"/meetings/{meeting.id}"  # Frontend URL
-        
-        blocks = slack_service.format_meeting_summary_blocks(
-            meeting_title,
-            meeting.summary,
-            meeting_url
-        )
-        
-        await slack_service.send_message(
-            integration.bot_access_token,
-            target_channel,
-            f"📋 Итоги встречи готовы!\n\n{meeting.summary}",
-            blocks
+        job = await job_queue.enqueue(
+            current_user.id,
+            "slack_meeting_summary",
+            {"integration_id": integration_id, "meeting_id": meeting_id, "channel_id": target_channel},
+            idempotency_key=f"{current_user.id}:{idempotency_key}" if idempotency_key else None
         )
+        response.headers["X-Job-Id"] = job.id
         
-        return MessageResponse(message="Meeting summary sent to Slack successfully")
+        return MessageResponse(message="Meeting summary queued for delivery to Slack")
         
     except Exception as e:
         raise HTTPException(
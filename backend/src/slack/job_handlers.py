@@ -0,0 +1,39 @@
+from typing import Optional
+
+from database import AsyncSessionLocal
+from jobs.queue import job_queue
+from dashboard import crud as dashboard_crud
+from .slack_service import slack_service
+from .crud import slack_crud
+
+
+@job_queue.handler("slack_meeting_summary")
+async def send_meeting_summary(user_id: str, payload: dict) -> Optional[dict]:
+    """Deliver a meeting summary to a Slack channel"""
+    async with AsyncSessionLocal() as db:
+        integration = await slack_crud.get_slack_integration_by_id(db, payload["integration_id"], user_id)
+        if not integration:
+            raise Exception("Slack integration not found")
+        
+        meeting = await dashboard_crud.get_meeting_by_id(db, payload["meeting_id"], user_id)
+        if not meeting or not meeting.summary:
+            raise Exception("Meeting summary not available")
+
+    # Format meeting summary
+    meeting_title = f"Итоги встречи - {meeting.bot_name}"
+    meeting_url = f"/meetings/{meeting.id}"  # Frontend URL
+
+    blocks = slack_service.format_meeting_summary_blocks(
+        meeting_title,
+        meeting.summary,
+        meeting_url
+    )
+
+    await slack_service.send_message(
+        integration.bot_access_token,
+        payload["channel_id"],
+        f"📋 Итоги встречи готовы!\n\n{meeting.summary}",
+        blocks
+    )
+
+    return {"channel_id": payload["channel_id"]}
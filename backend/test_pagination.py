@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Keyset pagination test for meeting and summary lists
+
+Pages through rows created within the same second on a scratch SQLite
+database, including rows stored before migration 0009 with second-precision
+created_at values. Every row must be returned exactly once and the last page
+must report has_more=False.
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+from datetime import date
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+
+# Service singletons need keys at import time; nothing here calls out to them,
+# and the test runs on its own scratch engine rather than the app's database
+os.environ.setdefault("OPENAI_API_KEY", "test")
+os.environ.setdefault("VEXA_ADMIN_KEY", "test")
+os.environ.setdefault("DATABASE_URL", "sqlite")
+
+from alembic import command
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+import main  # noqa: F401  (registers every model)
+from auth.models import User
+from dashboard import crud
+from dashboard.models import Meeting, Summary
+from dashboard.pagination import encode_cursor, decode_cursor
+from dashboard.service import dashboard_service
+from migrations.runner import _alembic_config
+
+LEGACY_ROWS = 3  # Stored with second precision before 0009
+NEW_ROWS = 4     # Created back to back, within the same second
+PER_PAGE = 2
+MAX_PAGES = 20   # A cursor that never advances would loop forever
+
+
+async def _scratch_database(path):
+    """Create a scratch database holding legacy and new meetings and summaries of one user"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: command.upgrade(_alembic_config(sync_conn), "0008"))
+
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        user = User(name="Pager", email="pager@example.com", hashed_password="x")
+        db.add(user)
+        await db.commit()
+
+        meetings = [
+            Meeting(user_id=user.id, meeting_url=f"https://meet.google.com/legacy-{i}", meeting_date=date.today())
+            for i in range(LEGACY_ROWS)
+        ]
+        db.add_all(meetings)
+        await db.flush()
+        db.add_all([
+            Summary(meeting_id=meeting.id, user_id=user.id, title=f"Legacy {i}", content="x")
+            for i, meeting in enumerate(meetings)
+        ])
+        await db.commit()
+
+        # What server-side now() left behind on SQLite
+        for table in ("meetings", "summaries"):
+            await db.execute(text(f"UPDATE {table} SET created_at = '2026-01-01 12:00:00'"))
+        await db.commit()
+
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: command.upgrade(_alembic_config(sync_conn), "head"))
+
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        for i in range(NEW_ROWS):
+            meeting = Meeting(user_id=user.id, meeting_url=f"https://meet.google.com/new-{i}", meeting_date=date.today())
+            db.add(meeting)
+            await db.flush()
+            db.add(Summary(meeting_id=meeting.id, user_id=user.id, title=f"New {i}", content="x"))
+        await db.commit()
+
+    return engine, user.id
+
+
+async def _page_meetings(db, user_id):
+    pages, cursor = [], None
+    while len(pages) < MAX_PAGES:
+        page = await dashboard_service.get_user_meetings(db, user_id, per_page=PER_PAGE, cursor=cursor)
+        pages.append([meeting.id for meeting in page.meetings])
+        if not page.has_more:
+            return pages
+        cursor = page.next_cursor
+    raise AssertionError(f"Meeting pages never ended: {pages[:3]}...")
+
+
+async def _page_summaries(db, user_id):
+    pages, after = [], None
+    while len(pages) < MAX_PAGES:
+        summaries = await crud.get_summaries_by_user(db, user_id, PER_PAGE + 1, after)
+        pages.append([summary.id for summary in summaries[:PER_PAGE]])
+        if len(summaries) <= PER_PAGE:
+            return pages
+        last = summaries[PER_PAGE - 1]
+        after = decode_cursor(encode_cursor(last.created_at, last.id))
+    raise AssertionError(f"Summary pages never ended: {pages[:3]}...")
+
+
+async def _check_paging(page_rows):
+    with tempfile.TemporaryDirectory() as directory:
+        engine, user_id = await _scratch_database(os.path.join(directory, "pagination.db"))
+        try:
+            async with AsyncSession(engine, expire_on_commit=False) as db:
+                pages = await page_rows(db, user_id)
+        finally:
+            await engine.dispose()
+
+    ids = [row_id for page in pages for row_id in page]
+    assert len(ids) == len(set(ids)), f"Rows repeated across pages: {pages}"
+    assert len(ids) == LEGACY_ROWS + NEW_ROWS, f"Expected {LEGACY_ROWS + NEW_ROWS} rows, got {len(ids)}: {pages}"
+    return pages
+
+
+def test_meetings_keyset_paging():
+    """Meeting list pages advance through rows created in the same second"""
+    asyncio.run(_check_paging(_page_meetings))
+
+
+def test_summaries_keyset_paging():
+    """Summary list pages advance through rows created in the same second"""
+    asyncio.run(_check_paging(_page_summaries))
+
+
+def main():
+    print("🧪 Testing keyset pagination")
+    print("=" * 50)
+
+    failed = False
+    for name, test in (("Meetings", test_meetings_keyset_paging), ("Summaries", test_summaries_keyset_paging)):
+        try:
+            test()
+            print(f"✅ {name} paging passed")
+        except AssertionError as e:
+            failed = True
+            print(f"❌ {name} paging failed: {e}")
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
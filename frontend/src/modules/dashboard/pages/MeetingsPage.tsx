@@ -118,7 +118,7 @@ export const MeetingsPage: React.FC = () => {
     try {
       setIsLoading(true);
       setError(null);
-      const response = await dashboardApi.getMeetings(1, 50); // Get first 50 meetings
+      const response = await dashboardApi.getMeetings(50); // Get first 50 meetings
       setMeetings(response.meetings);
     } catch (err) {
       console.error('Error loading meetings:', err);
@@ -48,18 +48,28 @@ export const LiveTranscript: React.FC<LiveTranscriptProps> = ({
     };
   }, [isActive, meetingId, initialTranscripts]);
 
+  // Merge a delta into the current list; revised segments replace the line with the same timestamp
+  const mergeTranscripts = (current: Transcript[], delta: Transcript[]) => {
+    const revised = new Set(delta.map((t) => t.timestamp));
+    return [...current.filter((t) => !revised.has(t.timestamp)), ...delta];
+  };
+
   const startPolling = async () => {
     if (isPolling) return;
 
     setIsPolling(true);
     try {
-      const cleanup = await dashboardApi.pollTranscripts(
+      const cursor = initialTranscripts.reduce(
+        (latest, t) => (t.created_at > latest ? t.created_at : latest),
+        '1970-01-01T00:00:00'
+      );
+      const cleanup = await dashboardApi.streamTranscripts(
         meetingId,
         (newTranscripts) => {
-          setTranscripts(newTranscripts);
+          setTranscripts((current) => mergeTranscripts(current, newTranscripts));
           setLastUpdate(new Date());
         },
-        8000 // Poll every 8 seconds
+        cursor
       );
       pollCleanupRef.current = cleanup;
     } catch (error) {
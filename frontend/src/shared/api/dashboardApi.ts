@@ -18,7 +18,8 @@ import type {
   NotesSearchRequest,
   NotesStatistics,
   GenerateStructuredNotesRequest,
-  StructuredMeetingNotesResponse
+  StructuredMeetingNotesResponse,
+  Job
 } from '@/shared/types/dashboard';
 
 class DashboardApi {
@@ -30,7 +31,8 @@ class DashboardApi {
 
   private async makeRequest<T>(
     endpoint: string,
-    options: RequestInit = {}
+    options: RequestInit = {},
+    baseUrl: string = this.baseUrl
   ): Promise<T> {
     const token = localStorage.getItem('access_token');
     
@@ -39,7 +41,7 @@ class DashboardApi {
       ...(token && { Authorization: `Bearer ${token}` }),
     };
 
-    const url = `${this.baseUrl}${endpoint}`;
+    const url = `${baseUrl}${endpoint}`;
     const requestOptions = {
       ...options,
       headers: {
@@ -86,14 +88,17 @@ class DashboardApi {
   }
 
   /**
-   * Get all meetings for the current user with pagination
+   * Get a page of the current user's meetings, newest first
    * GET /api/dashboard/meetings
+   * Pass the previous response's next_cursor to get the following page.
    */
-  async getMeetings(page: number = 1, perPage: number = 20): Promise<MeetingListResponse> {
+  async getMeetings(perPage: number = 20, cursor?: string): Promise<MeetingListResponse> {
     const params = new URLSearchParams({
-      page: page.toString(),
       per_page: perPage.toString(),
     });
+    if (cursor) {
+      params.set('cursor', cursor);
+    }
 
     return this.makeRequest<MeetingListResponse>(`/meetings?${params}`);
   }
@@ -107,14 +112,18 @@ class DashboardApi {
   }
 
   /**
-   * Sync and get the latest transcripts for a meeting
+   * Sync and get new transcripts for a meeting
    * GET /api/dashboard/meetings/{meeting_id}/transcripts
    * 
+   * Returns only the delta: transcripts stored after `since` (created_at cursor),
+   * or the segments written by this sync when no cursor is given.
+   * 
    * @throws Error with "410" status if meeting has ended
    */
-  async syncMeetingTranscripts(meetingId: string): Promise<Transcript[]> {
+  async syncMeetingTranscripts(meetingId: string, since?: string): Promise<Transcript[]> {
     try {
-      return this.makeRequest<Transcript[]>(`/meetings/${meetingId}/transcripts`);
+      const query = since ? `?since=${encodeURIComponent(since)}` : '';
+      return this.makeRequest<Transcript[]>(`/meetings/${meetingId}/transcripts${query}`);
     } catch (error) {
       // Re-throw with enhanced error information for better handling
       throw error;
@@ -213,21 +222,30 @@ class DashboardApi {
 
   /**
    * Poll transcripts for a meeting (useful for real-time updates)
+   * Calls onUpdate with new or revised transcripts only (merge them by timestamp)
    * Automatically stops when meeting has ended (HTTP 410)
    */
   async pollTranscripts(
     meetingId: string,
     onUpdate: (transcripts: Transcript[]) => void,
-    intervalMs: number = 10000 // 10 seconds
+    intervalMs: number = 10000, // 10 seconds
+    since: string = '1970-01-01T00:00:00'
   ): Promise<() => void> {
     let isPolling = true;
+    let cursor = since;
 
     const poll = async () => {
       if (!isPolling) return;
 
       try {
-        const transcripts = await this.syncMeetingTranscripts(meetingId);
-        onUpdate(transcripts);
+        const transcripts = await this.syncMeetingTranscripts(meetingId, cursor);
+        if (transcripts.length > 0) {
+          cursor = transcripts.reduce(
+            (latest, t) => (t.created_at > latest ? t.created_at : latest),
+            cursor
+          );
+          onUpdate(transcripts);
+        }
       } catch (error) {
         console.error('Error polling transcripts:', error);
         
@@ -256,6 +274,105 @@ class DashboardApi {
     };
   }
 
+  /**
+   * Stream live transcripts for a meeting over Server-Sent Events
+   * GET /api/dashboard/meetings/{meeting_id}/transcripts/stream
+   *
+   * Calls onUpdate with new or revised transcripts only (merge them by timestamp).
+   * Reconnects with a `since` cursor if the stream drops, and falls back to
+   * polling if streaming is not available. Stops when the meeting ends.
+   */
+  async streamTranscripts(
+    meetingId: string,
+    onUpdate: (transcripts: Transcript[]) => void,
+    since: string = '1970-01-01T00:00:00'
+  ): Promise<() => void> {
+    let isStreaming = true;
+    let cursor = since;
+    let controller: AbortController | null = null;
+    let stopPolling: (() => void) | null = null;
+
+    const handleBatch = (transcripts: Transcript[]) => {
+      if (transcripts.length === 0) return;
+      cursor = transcripts.reduce(
+        (latest, t) => (t.created_at > latest ? t.created_at : latest),
+        cursor
+      );
+      onUpdate(transcripts);
+    };
+
+    const connect = async () => {
+      if (!isStreaming) return;
+
+      controller = new AbortController();
+      const token = localStorage.getItem('access_token');
+      let ended = false;
+
+      try {
+        const response = await fetch(
+          `${this.baseUrl}/meetings/${meetingId}/transcripts/stream?since=${encodeURIComponent(cursor)}`,
+          {
+            headers: {
+              Accept: 'text/event-stream',
+              ...(token && { Authorization: `Bearer ${token}` }),
+            },
+            signal: controller.signal,
+          }
+        );
+
+        if (!response.ok || !response.body) {
+          throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+        }
+
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+
+        while (isStreaming && !ended) {
+          const { done, value } = await reader.read();
+          if (done) break;
+
+          buffer += decoder.decode(value, { stream: true });
+          const messages = buffer.split('\n\n');
+          buffer = messages.pop() ?? '';
+
+          for (const message of messages) {
+            let event = 'message';
+            let data = '';
+            for (const line of message.split('\n')) {
+              if (line.startsWith('event:')) event = line.slice(6).trim();
+              else if (line.startsWith('data:')) data += line.slice(5).trim();
+            }
+
+            if (event === 'transcripts' && data) {
+              handleBatch(JSON.parse(data));
+            } else if (event === 'end') {
+              ended = true;
+            }
+          }
+        }
+      } catch (error) {
+        if (!isStreaming) return;
+        console.error('Transcript stream failed, falling back to polling:', error);
+        stopPolling = await this.pollTranscripts(meetingId, handleBatch, 8000, cursor);
+        return;
+      }
+
+      // Stream dropped before the meeting ended: reconnect from the cursor
+      if (isStreaming && !ended) {
+        setTimeout(connect, 2000);
+      }
+    };
+
+    connect();
+
+    return () => {
+      isStreaming = false;
+      controller?.abort();
+      stopPolling?.();
+    };
+  }
+
   /**
    * Auto-save meeting notes with debouncing
    */
@@ -292,7 +409,7 @@ class DashboardApi {
     totalDuration: string;
   }> {
     try {
-      const response = await this.getMeetings(1, 100); // Get more meetings for stats
+      const response = await this.getMeetings(100); // Get more meetings for stats
       const meetings = response.meetings;
 
       const totalMeetings = meetings.length;
@@ -392,18 +509,46 @@ class DashboardApi {
     return this.makeRequest(`/trends?${params}`);
   }
 
+  /**
+   * Get the status of a background job
+   * GET /api/jobs/{job_id}
+   */
+  async getJob<T = any>(jobId: string): Promise<Job<T>> {
+    return this.makeRequest<Job<T>>(`/${jobId}`, {}, `${config.API_BASE_URL}/api/jobs`);
+  }
+
+  /**
+   * Poll a background job until it finishes and return its result
+   */
+  async waitForJob<T = any>(job: Job<T>, intervalMs: number = 1500): Promise<T> {
+    let current = job;
+    while (current.status === 'queued' || current.status === 'running') {
+      await new Promise(resolve => setTimeout(resolve, intervalMs));
+      current = await this.getJob<T>(job.id);
+    }
+
+    if (current.status === 'failed') {
+      throw new Error(current.last_error || 'Background job failed');
+    }
+    return current.result as T;
+  }
+
   /**
    * Create comprehensive notes for a meeting
    * POST /api/dashboard/meetings/{meeting_id}/comprehensive-notes
+   * 
+   * Generation runs as a background job; this waits for it to finish.
    */
   async createComprehensiveNotes(
     meetingId: string, 
     request: ComprehensiveNotesRequest
   ): Promise<ComprehensiveNotes> {
-    return this.makeRequest<ComprehensiveNotes>(`/meetings/${meetingId}/comprehensive-notes`, {
+    const job = await this.makeRequest<Job<ComprehensiveNotes>>(`/meetings/${meetingId}/comprehensive-notes`, {
       method: 'POST',
       body: JSON.stringify(request),
+      headers: { 'Idempotency-Key': crypto.randomUUID() },
     });
+    return this.waitForJob(job);
   }
 
   /**
@@ -525,10 +670,12 @@ class DashboardApi {
       
       onProgress?.('Анализ с помощью AI...');
       
-      const summary = await this.makeRequest<any>(`/meetings/${meetingId}/structured-notes`, {
+      const job = await this.makeRequest<Job>(`/meetings/${meetingId}/structured-notes`, {
         method: 'POST',
         body: JSON.stringify(options || {}),
+        headers: { 'Idempotency-Key': crypto.randomUUID() },
       });
+      const summary = await this.waitForJob(job);
       
       onProgress?.('Создание красивого резюме...');
       
@@ -135,7 +135,7 @@ export const useTasks = () => {
       setError(null);
 
       // Получаем последние встречи
-      const meetingsResponse = await dashboardApi.getMeetings(1, 10);
+      const meetingsResponse = await dashboardApi.getMeetings(10);
       const allTasks: TaskWithMeeting[] = [];
 
       // Для каждой встречи ищем summary и извлекаем задачи
@@ -42,6 +42,7 @@ export interface DashboardStats {
   total_meetings: number;
   total_summaries: number;
   total_tasks: number;
+  open_tasks?: number;
   meetings_this_month: number;
   summaries_this_month: number;
   avg_meeting_duration_minutes: number;
@@ -66,6 +67,8 @@ export interface Transcript {
   speaker?: string;
   text: string;
   timestamp?: string;
+  start_seconds?: number | null;
+  end_seconds?: number | null;
   created_at: string;
 }
 
@@ -129,16 +132,18 @@ export interface EndMeetingRequest {
 // Response types
 export interface MeetingListResponse {
   meetings: Meeting[];
-  total: number;
-  page: number;
   per_page: number;
+  next_cursor: string | null;
+  has_more: boolean;
+  total: number | null;
 }
 
 export interface SummaryListResponse {
   summaries: Summary[];
-  total: number;
-  page: number;
   per_page: number;
+  next_cursor: string | null;
+  has_more: boolean;
+  total: number | null;
 }
 
 // API Error types
@@ -287,4 +292,18 @@ export interface StructuredMeetingNotesResponse {
   generated_at: string;
   transcript_length: number;
   error?: string;
-} 
\ No newline at end of file
+} 
+// Background job status (GET /api/jobs/{job_id})
+export interface Job<TResult = any> {
+  id: string;
+  job_type: string;
+  status: 'queued' | 'running' | 'succeeded' | 'failed';
+  attempts: number;
+  max_attempts: number;
+  result?: TResult;
+  last_error?: string;
+  run_after: string;
+  created_at: string;
+  updated_at: string;
+  finished_at?: string;
+}